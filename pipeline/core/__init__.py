@@ -45,6 +45,38 @@ def get_consent_date_from_subject_id(
         return results
 
 
+def get_consent_dates(config_file: Path, study_id: str) -> Dict[str, str]:
+    """
+    Retrieves the consent dates of all subjects in a study, in a single query.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        study_id (str): The ID of the study.
+
+    Returns:
+        Dict[str, str]: A mapping from subject ID to consent date. Subjects
+            without a consent date are left out.
+    """
+    query = """
+        SELECT subject_id, consent_date
+        FROM subjects
+        WHERE study_id = %s AND
+            consent_date IS NOT NULL;
+    """
+
+    results = db.execute_sql(config_file=config_file, query=query, params=(study_id,))
+
+    consent_dates = {
+        subject_id: str(consent_date)
+        for subject_id, consent_date in zip(
+            results["subject_id"], results["consent_date"]
+        )
+        if not pd.isna(consent_date)
+    }
+
+    return consent_dates
+
+
 def get_subject_ids(config_file: Path, study_id: str) -> List[str]:
     """
     Gets the subject IDs from the database.
@@ -350,7 +382,7 @@ def get_interview_datetime(config_file: Path, interview_name: str) -> datetime:
     if results is None:
         raise ValueError(f"No interview date found for interview {interview_name}")
 
-    interview_datetime = datetime.strptime(results, "%Y-%m-%d %H:%M:%S")
+    interview_datetime = datetime.fromisoformat(results)
 
     return interview_datetime
 
@@ -504,8 +536,85 @@ def list_to_tuple(function: Callable) -> Any:
     return wrapper
 
 
+def _openface_features_query(cols: List[str], only_success: bool) -> str:
+    """
+    Builds the query for `fetch_openface_features_by_role`, with `%s`
+    placeholders for (interview_name, subject_id, study_id, roles).
+    """
+    filters = [
+        "interview_name = %s",
+        "subject_id = %s",
+        "study_id = %s",
+        "ir_role = ANY(%s)",
+    ]
+    if only_success:
+        filters.insert(0, "success = TRUE")
+
+    select_cols = ", ".join(f'"{col}"' for col in ["ir_role"] + list(cols))
+    where_clause = " AND\n                ".join(filters)
+
+    sql_query = f"""
+            SELECT
+                {select_cols}
+            FROM openface_features
+            WHERE {where_clause};
+        """
+
+    return sql_query
+
+
 @list_to_tuple
 @lru_cache(maxsize=32)
+def fetch_openface_features_by_role(
+    interview_name: str,
+    subject_id: str,
+    study_id: str,
+    roles: List[InterviewRole],
+    cols: List[str],
+    config_file: Path,
+    only_success: bool = True,
+) -> Dict[InterviewRole, pd.DataFrame]:
+    """
+    Fetches OpenFace features for several roles of an interview, in a single query.
+
+    Args:
+        interview_name (str): The name of the interview.
+        subject_id (str): The subject ID.
+        study_id (str): The study ID.
+        roles (List[InterviewRole]): The roles to fetch features for.
+        cols (List[str]): The list of columns to fetch.
+        config_file (Path): The path to the configuration file.
+        only_success (bool, optional): Whether to fetch only successful features. Defaults to True.
+
+    Returns:
+        Dict[InterviewRole, pd.DataFrame]: The fetched features, for each role.
+            Roles without any features map to an empty DataFrame.
+    """
+    sql_query = _openface_features_query(cols=cols, only_success=only_success)
+
+    # Positional parameters must be a tuple; the roles list is adapted to an
+    # ARRAY for ANY(%s)
+    params = (
+        interview_name,
+        subject_id,
+        study_id,
+        [str(role) for role in roles],
+    )
+
+    session_of_features = db.execute_sql(
+        config_file=config_file, query=sql_query, db="openface_db", params=params
+    )
+
+    features_by_role: Dict[InterviewRole, pd.DataFrame] = {
+        role: session_of_features.iloc[0:0][list(cols)] for role in roles
+    }
+    for role_str, role_features in session_of_features.groupby("ir_role", sort=False):
+        role = InterviewRole.from_str(str(role_str))
+        features_by_role[role] = role_features[list(cols)].reset_index(drop=True)
+
+    return features_by_role
+
+
 def fetch_openface_features(
     interview_name: str,
     subject_id: str,
@@ -528,38 +637,19 @@ def fetch_openface_features(
     Returns:
         pd.DataFrame: A DataFrame containing the fetched features.
     """
-
-    if only_success:
-        sql_query = f"""
-            SELECT
-                "{'", "'.join(cols)}"
-            FROM openface_features
-            WHERE success = TRUE AND
-                interview_name = '{interview_name}' AND
-                subject_id = '{subject_id}' AND
-                study_id = '{study_id}' AND
-                ir_role = '{role}';
-        """
-    else:
-        sql_query = f"""
-            SELECT
-                "{'", "'.join(cols)}"
-            FROM openface_features
-            WHERE interview_name = '{interview_name}' AND
-                subject_id = '{subject_id}' AND
-                study_id = '{study_id}' AND
-                ir_role = '{role}';
-        """
-
-    session_of_features = db.execute_sql(
-        config_file=config_file, query=sql_query, db="openface_db"
+    features_by_role = fetch_openface_features_by_role(
+        interview_name=interview_name,
+        subject_id=subject_id,
+        study_id=study_id,
+        roles=[role],
+        cols=cols,
+        config_file=config_file,
+        only_success=only_success,
     )
 
-    return session_of_features
+    return features_by_role[role]
 
 
-@list_to_tuple
-@lru_cache(maxsize=32)
 def fetch_openface_subject_distribution(
     subject_id: str, cols: List[str], config_file: Path
 ) -> pd.DataFrame:
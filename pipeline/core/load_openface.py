@@ -4,10 +4,9 @@ Helper functions for loading OpenFace features into the database.
 
 import logging
 from pathlib import Path
-from typing import Dict, List
+from typing import List
 
 import pandas as pd
-from tqdm import tqdm
 
 from pipeline import core
 from pipeline.core import metadata
@@ -249,16 +248,16 @@ def construct_load_openface(
     return lof
 
 
-def construct_insert_queries(
+def construct_features_df(
     config_file: Path,
     interview_name: str,
     role: str,
     subject_id: str,
     study_id: str,
     csv_file: Path,
-) -> List[str]:
+) -> pd.DataFrame:
     """
-    Constructs a list of SQL insert queries for OpenFace features from a CSV file.
+    Constructs the rows of OpenFace features to load from a CSV file.
 
     Args:
         interview_name (str): The name of the interview.
@@ -267,7 +266,7 @@ def construct_insert_queries(
         csv_file (str): The path to the CSV file containing the OpenFace features.
 
     Returns:
-        List[str]: A list of SQL insert queries.
+        pd.DataFrame: The 'openface_features' rows, with columns matching the table.
     """
     df = pd.read_csv(csv_file, on_bad_lines="skip")
 
@@ -294,33 +293,12 @@ def construct_insert_queries(
         except ValueError as e:
             print(f"Error casting {col} with value {df[col]} to {datatype}: {e}")
 
-    queries: List[str] = []
+    df.insert(0, "interview_name", interview_name)
+    df.insert(1, "ir_role", role)
+    df.insert(2, "subject_id", subject_id)
+    df.insert(3, "study_id", study_id)
 
-    for _, row in tqdm(df.iterrows(), total=len(df)):
-        vals: Dict[str, str] = {}
-
-        for col in cols:
-            vals[col] = str(row[col])
-
-        query = f"""
-            INSERT INTO openface_features (
-                interview_name,
-                ir_role,
-                subject_id,
-                study_id,
-                {", ".join(['"' + col + '"' for col in cols])}
-            ) VALUES (
-                '{interview_name}',
-                '{role}',
-                '{subject_id}',
-                '{study_id}',
-                {", ".join(["'" + vals[col] + "'" for col in cols])}
-            ) ON CONFLICT (interview_name, ir_role, frame, face_id) DO NOTHING;
-        """
-
-        queries.append(query)
-
-    return queries
+    return df
 
 
 def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
@@ -331,7 +309,7 @@ def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
         config_file (Path): Path to the config file.
         lof (LoadOpenface): LoadOpenface object.
     """
-    queries: List[str] = []
+    features_dfs: List[pd.DataFrame] = []
 
     if lof.lof_report_generation_possible is True:
         with Timer() as timer:
@@ -348,8 +326,8 @@ def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
                     raise ValueError(message)
 
                 csv_file = csv_files[0]
-                queries.extend(
-                    construct_insert_queries(
+                features_dfs.append(
+                    construct_features_df(
                         config_file=config_file,
                         interview_name=lof.interview_name,
                         role="interviewer",
@@ -372,8 +350,8 @@ def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
                     raise ValueError(message)
 
                 csv_file = csv_files[0]
-                queries.extend(
-                    construct_insert_queries(
+                features_dfs.append(
+                    construct_features_df(
                         config_file=config_file,
                         interview_name=lof.interview_name,
                         role="subject",
@@ -383,16 +361,17 @@ def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
                     )
                 )
 
-        logger.info(
-            f"Importing OpenFace features to openface_db for {lof.interview_name}"
-        )
-        db.execute_queries(
-            config_file=config_file,
-            queries=queries,
-            show_commands=False,
-            show_progress=True,
-            db="openface_db",
-        )
+        if len(features_dfs) > 0:
+            logger.info(
+                f"Importing OpenFace features to openface_db for {lof.interview_name}"
+            )
+            db.copy_from_df(
+                config_file=config_file,
+                df=pd.concat(features_dfs, ignore_index=True),
+                table="openface_features",
+                on_conflict="ON CONFLICT (interview_name, ir_role, frame, face_id) DO NOTHING",
+                db="openface_db",
+            )
 
         lof.lof_process_time = timer.duration
 
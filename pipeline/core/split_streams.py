@@ -171,7 +171,5 @@ def log_streams(config_file: Path, streams: List[VideoStream]) -> None:
         config_file (Path): Path to config file
         streams (List[VideoStream]): List of streams
     """
-    sql_queries = [stream.to_sql() for stream in streams]
-
     logger.info("Inserting streams into DB", extra={"markup": True})
-    db.execute_queries(config_file=config_file, queries=sql_queries)
+    VideoStream.bulk_insert(config_file=config_file, streams=streams)
@@ -5,7 +5,7 @@ Helper functions for performing quick QC on transcripts.
 import ast
 import heapq
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -393,7 +393,6 @@ def log_transcript_quick_qc(
         speaker_metrics=qqc,
         turn_data=turn_data,
         process_time=process_time,
-        timestamp=datetime.now(),
     )
 
     sql_query = transcript_qqc.insert_query()
@@ -171,9 +171,7 @@ def insert_subjects(config_file: Path, subjects: List[Subject]):
         subjects (List[Subject]): The list of subjects to insert.
     """
 
-    queries = [subject.to_sql() for subject in subjects]
-
-    db.execute_queries(config_file=config_file, queries=queries, show_commands=False)
+    Subject.bulk_insert(config_file=config_file, subjects=subjects)
 
 
 if __name__ == "__main__":
@@ -32,7 +32,7 @@ import logging
 import multiprocessing
 import re
 from datetime import date, datetime, time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from rich.logging import RichHandler
 from rich.progress import Progress
@@ -197,7 +197,10 @@ def fetch_interview_files(interview: Interview) -> List[InterviewFile]:
 
 
 def fetch_interviews(
-    config_file: Path, subject_id: str, study_id: str
+    config_file: Path,
+    subject_id: str,
+    study_id: str,
+    consent_date_s: Optional[str] = None,
 ) -> List[Interview]:
     """
     Fetches the interviews for a given subject ID.
@@ -205,6 +208,8 @@ def fetch_interviews(
     Args:
         config_file (Path): The path to the config file.
         subject_id (str): The subject ID.
+        consent_date_s (Optional[str]): The subject's consent date, if already
+            known. Fetched from the database otherwise.
 
     Returns:
         List[Interview]: A list of Interview objects.
@@ -212,6 +217,15 @@ def fetch_interviews(
     config_params = config(path=config_file, section="general")
     data_root = Path(config_params["data_root"])
 
+    if consent_date_s is None:
+        consent_date_s = core.get_consent_date_from_subject_id(
+            config_file=config_file, subject_id=subject_id, study_id=study_id
+        )
+    if consent_date_s is None:
+        logger.warning(f"Could not find consent date for {subject_id}")
+        return []
+    consent_date = datetime.fromisoformat(consent_date_s)
+
     study_path: Path = data_root / "PROTECTED" / study_id
     interview_types: List[InterviewType] = [InterviewType.OPEN, InterviewType.PSYCHS]
 
@@ -244,13 +258,6 @@ def fetch_interviews(
                     f"{subject_id}: Could not parse date and time from {base_name}. Skipping..."
                 )
                 continue
-            consent_date_s = core.get_consent_date_from_subject_id(
-                config_file=config_file, subject_id=subject_id, study_id=study_id
-            )
-            if consent_date_s is None:
-                logger.warning(f"Could not find consent date for {subject_id}")
-                continue
-            consent_date = datetime.strptime(consent_date_s, "%Y-%m-%d")
 
             interview_name = dpdash.get_dpdash_name(
                 study=study_id,
@@ -274,32 +281,29 @@ def fetch_interviews(
     return interviews
 
 
-def hash_file_worker(params: Tuple[InterviewFile, Path]) -> File:
+def hash_file_worker(params: Tuple[InterviewFile, bool]) -> File:
     """
     Hashes the file and returns a File object.
 
     Args:
-        params (Tuple[InterviewFile, Path]): A tuple containing the InterviewFile
-            and the path to the config file.
+        params (Tuple[InterviewFile, bool]): A tuple containing the InterviewFile
+            and whether the file should be hashed.
     """
-    interview_file, config_file = params
-    with_hash = orchestrator.is_crawler_hashing_required(config_file=config_file)
+    interview_file, with_hash = params
 
     file = File(file_path=interview_file.interview_file, with_hash=with_hash)
     return file
 
 
-def generate_queries(
-    interviews: List[Interview],
+def hash_files(
     interview_files: List[InterviewFile],
     config_file: Path,
     progress: Progress,
-) -> List[str]:
+) -> List[File]:
     """
-    Generates the SQL queries to insert the interview files into the database.
+    Builds (and hashes, if required) the File objects for the interview files.
 
     Args:
-        interviews (List[Interview]): A list of Interview objects.
         interview_files (List[InterviewFile]): A list of InterviewFile objects.
         config_file (Path): The path to the configuration file.
         progress (Progress): The progress bar.
@@ -307,12 +311,13 @@ def generate_queries(
 
     files: List[File] = []
 
-    if orchestrator.is_crawler_hashing_required(config_file=config_file):
+    with_hash = orchestrator.is_crawler_hashing_required(config_file=config_file)
+    if with_hash:
         logger.info("Hashing files...")
     else:
         logger.info("Skipping hashing files...")
 
-    params = [(interview_file, config_file) for interview_file in interview_files]
+    params = [(interview_file, with_hash) for interview_file in interview_files]
 
     num_processes = multiprocessing.cpu_count() / 2
     logger.info(f"Using {num_processes} processes")
@@ -323,21 +328,36 @@ def generate_queries(
             progress.update(task, advance=1)
         progress.remove_task(task)
 
-    sql_queries = []
-    logger.info("Generating SQL queries...")
-    # Insert the files
-    for file in files:
-        sql_queries.append(file.to_sql())
+    return files
 
-    # Insert the interviews
-    for interview in interviews:
-        sql_queries.append(interview.to_sql())
 
-    # Insert the interview files
-    for interview_file in interview_files:
-        sql_queries.append(interview_file.to_sql())
+def insert_models(
+    files: List[File],
+    interviews: List[Interview],
+    interview_files: List[InterviewFile],
+    config_file: Path,
+) -> None:
+    """
+    Inserts the files, interviews and interview files into the database,
+    using one multi-row statement per table (and page), in a single transaction.
 
-    return sql_queries
+    Args:
+        files (List[File]): A list of File objects.
+        interviews (List[Interview]): A list of Interview objects.
+        interview_files (List[InterviewFile]): A list of InterviewFile objects.
+        config_file (Path): The path to the configuration file.
+    """
+    with db.transaction(config_file=config_file) as conn:
+        logger.info("Inserting files...")
+        File.bulk_insert(config_file=config_file, files=files, conn=conn)
+
+        logger.info("Inserting interviews...")
+        Interview.bulk_insert(config_file=config_file, interviews=interviews, conn=conn)
+
+        logger.info("Inserting interview files...")
+        InterviewFile.bulk_insert(
+            config_file=config_file, interview_files=interview_files, conn=conn
+        )
 
 
 def import_interviews(config_file: Path, study_id: str, progress: Progress) -> None:
@@ -350,6 +370,7 @@ def import_interviews(config_file: Path, study_id: str, progress: Progress) -> N
 
     # Get the subjects
     subjects = core.get_subject_ids(config_file=config_file, study_id=study_id)
+    consent_dates = core.get_consent_dates(config_file=config_file, study_id=study_id)
 
     # Get the interviews
     logger.info(f"Fetching interviews for {study_id}")
@@ -362,7 +383,10 @@ def import_interviews(config_file: Path, study_id: str, progress: Progress) -> N
         )
         interviews.extend(
             fetch_interviews(
-                config_file=config_file, subject_id=subject_id, study_id=study_id
+                config_file=config_file,
+                subject_id=subject_id,
+                study_id=study_id,
+                consent_date_s=consent_dates.get(subject_id),
             )
         )
 
@@ -377,16 +401,18 @@ def import_interviews(config_file: Path, study_id: str, progress: Progress) -> N
         progress.update(task, advance=1)
         interview_files.extend(fetch_interview_files(interview=interview))
 
-    # Generate the SQL queries to import the interview files
-    sql_queries = generate_queries(
-        interviews=interviews,
+    files = hash_files(
         interview_files=interview_files,
         config_file=config_file,
         progress=progress,
     )
 
-    # Execute the SQL queries
-    db.execute_queries(config_file=config_file, queries=sql_queries)
+    insert_models(
+        files=files,
+        interviews=interviews,
+        interview_files=interview_files,
+        config_file=config_file,
+    )
 
 
 if __name__ == "__main__":
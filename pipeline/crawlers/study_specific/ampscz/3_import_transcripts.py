@@ -28,7 +28,7 @@ from rich.logging import RichHandler
 
 from pipeline import core, orchestrator
 from pipeline.core.fetch_video import check_if_interview_has_duplicates
-from pipeline.helpers import cli, utils, db
+from pipeline.helpers import cli, utils
 from pipeline.models.files import File
 from pipeline.models.interview_files import InterviewFile
 
@@ -136,15 +136,8 @@ def models_to_db(
         None
     """
 
-    sql_queries = []
-
-    for file in files:
-        sql_queries.append(file.to_sql())
-
-    for i_file in interview_files:
-        sql_queries.append(i_file.to_sql())
-
-    db.execute_queries(queries=sql_queries, config_file=config_file, show_commands=False)
+    File.bulk_insert(config_file=config_file, files=files)
+    InterviewFile.bulk_insert(config_file=config_file, interview_files=interview_files)
 
 
 def import_transcripts(data_root: Path, study: str, config_file: Path) -> None:
@@ -32,7 +32,7 @@ import logging
 import multiprocessing
 import re
 from datetime import date, datetime, time
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from rich.logging import RichHandler
 
@@ -211,13 +211,17 @@ def fetch_interview_files(
     return interview_files
 
 
-def fetch_interviews(config_file: Path, subject_id: str) -> List[Interview]:
+def fetch_interviews(
+    config_file: Path, subject_id: str, consent_date_s: Optional[str] = None
+) -> List[Interview]:
     """
     Fetches the interviews for a given subject ID.
 
     Args:
         config_file (Path): The path to the config file.
         subject_id (str): The subject ID.
+        consent_date_s (Optional[str]): The subject's consent date, if already
+            known. Fetched from the database otherwise.
 
     Returns:
         List[Interview]: A list of Interview objects.
@@ -233,6 +237,15 @@ def fetch_interviews(config_file: Path, subject_id: str) -> List[Interview]:
         logger.warning(f"Could not find offsite interview path for {subject_id}")
         return []
 
+    if consent_date_s is None:
+        consent_date_s = core.get_consent_date_from_subject_id(
+            config_file=config_file, subject_id=subject_id, study_id=study_id
+        )
+    if consent_date_s is None:
+        logger.warning(f"Could not find consent date for {subject_id}")
+        return []
+    consent_date = datetime.fromisoformat(consent_date_s)
+
     interviews: List[Interview] = []
     interview_dirs = [d for d in offsite_interview_path.iterdir() if d.is_dir()]
 
@@ -245,14 +258,6 @@ def fetch_interviews(config_file: Path, subject_id: str) -> List[Interview]:
         time_dt = time.fromisoformat(parts[1].replace(".", ":"))
         interview_datetime = datetime.combine(date_dt, time_dt)
 
-        consent_date_s = core.get_consent_date_from_subject_id(
-            config_file=config_file, subject_id=subject_id, study_id=study_id
-        )
-        if consent_date_s is None:
-            logger.warning(f"Could not find consent date for {subject_id}")
-            continue
-        consent_date = datetime.strptime(consent_date_s, "%Y-%m-%d")
-
         interview_name = dpdash.get_dpdash_name(
             study=study_id,
             subject=subject_id,
@@ -287,12 +292,11 @@ def hash_file_worker(interview_file: InterviewFile) -> File:
     return file
 
 
-def generate_queries(interviews: List[Interview], interview_files: List[InterviewFile]):
+def hash_files(interview_files: List[InterviewFile]) -> List[File]:
     """
-    Generates the SQL queries to insert the interview files into the database.
+    Builds and hashes the File objects for the interview files.
 
     Args:
-        interviews (List[Interview]): A list of Interview objects.
         interview_files (List[InterviewFile]): A list of InterviewFile objects.
     """
 
@@ -309,21 +313,36 @@ def generate_queries(interviews: List[Interview], interview_files: List[Intervie
                 files.append(result)
                 progress.update(task, advance=1)
 
-    sql_queries = []
-    logger.info("Generating SQL queries...")
-    # Insert the files
-    for file in files:
-        sql_queries.append(file.to_sql())
+    return files
 
-    # Insert the interviews
-    for interview in interviews:
-        sql_queries.append(interview.to_sql())
 
-    # Insert the interview files
-    for interview_file in interview_files:
-        sql_queries.append(interview_file.to_sql())
+def insert_models(
+    files: List[File],
+    interviews: List[Interview],
+    interview_files: List[InterviewFile],
+    config_file: Path,
+) -> None:
+    """
+    Inserts the files, interviews and interview files into the database,
+    using one multi-row statement per table (and page), in a single transaction.
 
-    return sql_queries
+    Args:
+        files (List[File]): A list of File objects.
+        interviews (List[Interview]): A list of Interview objects.
+        interview_files (List[InterviewFile]): A list of InterviewFile objects.
+        config_file (Path): The path to the configuration file.
+    """
+    with db.transaction(config_file=config_file) as conn:
+        logger.info("Inserting files...")
+        File.bulk_insert(config_file=config_file, files=files, conn=conn)
+
+        logger.info("Inserting interviews...")
+        Interview.bulk_insert(config_file=config_file, interviews=interviews, conn=conn)
+
+        logger.info("Inserting interview files...")
+        InterviewFile.bulk_insert(
+            config_file=config_file, interview_files=interview_files, conn=conn
+        )
 
 
 def import_interviews(config_file: Path) -> None:
@@ -338,6 +357,7 @@ def import_interviews(config_file: Path) -> None:
 
     # Get the subjects
     subjects = core.get_subject_ids(config_file=config_file, study_id=study_id)
+    consent_dates = core.get_consent_dates(config_file=config_file, study_id=study_id)
 
     # Get the interviews
     logger.info(f"Fetching interviews for {study_id}")
@@ -352,7 +372,11 @@ def import_interviews(config_file: Path) -> None:
                 task, advance=1, description=f"Fetching {subject_id}'s interviews..."
             )
             interviews.extend(
-                fetch_interviews(config_file=config_file, subject_id=subject_id)
+                fetch_interviews(
+                    config_file=config_file,
+                    subject_id=subject_id,
+                    consent_date_s=consent_dates.get(subject_id),
+                )
             )
 
         # Get the interview files
@@ -366,14 +390,13 @@ def import_interviews(config_file: Path) -> None:
                 fetch_interview_files(interview=interview, config_file=config_file)
             )
 
-    # Generate the SQL queries to import the interview files
-    sql_queries = generate_queries(
-        interviews=interviews, interview_files=interview_files
-    )
+    files = hash_files(interview_files=interview_files)
 
-    # Execute the SQL queries
-    db.execute_queries(
-        config_file=config_file, queries=sql_queries, show_commands=False
+    insert_models(
+        files=files,
+        interviews=interviews,
+        interview_files=interview_files,
+        config_file=config_file,
     )
 
 
@@ -2,11 +2,14 @@
 Module providing command line interface for the pipeline.
 """
 
+import grp
 import logging
 import os
+import pwd
 import random
 import shutil
 import signal
+import stat
 import subprocess
 import sys
 import tempfile
@@ -112,9 +115,44 @@ def set_environment_variable(variable: str, value: str, overwrite: bool = True)
         )
 
 
+def _apply_recursively(path: Path, func: Callable[[str, Optional[int]], None]) -> int:
+    """
+    Calls func on path and, if it is a directory, on everything below it.
+
+    Uses a single os.fwalk pass; entries below path are passed to func as
+    (name, dir_fd) pairs, relative to their parent directory.
+
+    Args:
+        path (Path): The file or directory to start from.
+        func (Callable[[str, Optional[int]], None]): The function to apply.
+
+    Returns:
+        int: The number of entries func failed on.
+    """
+    failures = 0
+
+    def apply(name: str, dir_fd: Optional[int] = None) -> None:
+        nonlocal failures
+        try:
+            func(name, dir_fd)
+        except OSError as e:
+            failures += 1
+            logger.debug(f"{e}")
+
+    apply(str(path))
+    if path.is_dir() and not path.is_symlink():
+        for _, dirnames, filenames, dir_fd in os.fwalk(path):
+            for name in dirnames + filenames:
+                apply(name, dir_fd)
+
+    return failures
+
+
 def chown(file_path: Path, user: str, group: str) -> None:
     """
-    Changes the ownership of a file.
+    Changes the ownership of a file, or of a directory and its contents.
+
+    Symbolic links are changed themselves, not followed.
 
     Args:
         file_path (Path): The path to the file.
@@ -124,31 +162,46 @@ def chown(file_path: Path, user: str, group: str) -> None:
     Returns:
         None
     """
-    command_array = ["chown", "-R", f"{user}:{group}", str(file_path)]
-    execute_commands(
-        command_array,
-        shell=True,
-        on_fail=lambda: logger.error("Failed to change ownership."),
+    try:
+        uid = pwd.getpwnam(user).pw_uid
+        gid = grp.getgrnam(group).gr_gid
+    except KeyError as e:
+        logger.error(f"Failed to change ownership. Unknown user / group: {e}")
+        return
+
+    failures = _apply_recursively(
+        file_path,
+        lambda name, dir_fd: os.chown(
+            name, uid, gid, dir_fd=dir_fd, follow_symlinks=False
+        ),
     )
+    if failures > 0:
+        logger.error(f"Failed to change ownership of {failures} file(s).")
 
 
 def chmod(file_path: Path, mode: int) -> None:
     """
-    Changes the permissions of a file.
+    Changes the permissions of a file, or of a directory and its contents.
+
+    Symbolic links are skipped.
 
     Args:
         file_path (Path): The path to the file.
-        mode (int): the mode to change the permissions to.
+        mode (int): the mode to change the permissions to, as an octal
+            literal (e.g. 0o770, not 770).
 
     Returns:
         None
     """
-    command_array = ["chmod", "-R", mode, str(file_path)]
-    execute_commands(
-        command_array,
-        shell=True,
-        on_fail=lambda: logger.error("Failed to change permissions."),
-    )
+
+    def apply(name: str, dir_fd: Optional[int]) -> None:
+        if stat.S_ISLNK(os.stat(name, dir_fd=dir_fd, follow_symlinks=False).st_mode):
+            return
+        os.chmod(name, mode, dir_fd=dir_fd)
+
+    failures = _apply_recursively(file_path, apply)
+    if failures > 0:
+        logger.error(f"Failed to change permissions of {failures} file(s).")
 
 
 def check_if_running(process_name: str) -> bool:
@@ -2,15 +2,74 @@
 Helper functions for reading configuration files.
 """
 
+import os
+import threading
+from collections import OrderedDict
 from configparser import ConfigParser
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+# Parsed configuration files, as {section: {key: value}}, keyed by
+# (absolute path, mtime, size), so that an edited file is re-read on its next
+# lookup. Least recently used entries are evicted past _CONFIG_CACHE_SIZE.
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Dict[str, str]]]" = (
+    OrderedDict()
+)
+_CONFIG_CACHE_SIZE = 32
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _parse(path: str) -> Dict[str, Dict[str, str]]:
+    parser = ConfigParser()
+    parser.read(path)
+
+    # Resolve interpolation once, rather than on every lookup
+    return {section: dict(parser.items(section)) for section in parser.sections()}
+
+
+def _get_sections(path: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Return the parsed configuration file, reading it only if it is not cached
+    or has changed since it was cached.
+
+    Args:
+        path (Path): The path to the configuration file.
+
+    Returns:
+        Dict[str, Dict[str, str]]: The parameters of each section.
+    """
+    abs_path = os.path.abspath(path)
+    try:
+        stat = os.stat(abs_path)
+    except OSError:
+        # Missing / unreadable files are not cached; ConfigParser skips them
+        return _parse(abs_path)
+
+    key = (abs_path, stat.st_mtime_ns, stat.st_size)
+
+    with _CONFIG_CACHE_LOCK:
+        sections = _CONFIG_CACHE.get(key)
+        if sections is not None:
+            _CONFIG_CACHE.move_to_end(key)
+            return sections
+
+    sections = _parse(abs_path)
+
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = sections
+        while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+
+    return sections
 
 
 def config(path: Path, section: str) -> Dict[str, str]:
     """
     Read the configuration file and return a dictionary of parameters for the given section.
 
+    The parsed file is cached, and only re-read when it changes on disk. The
+    returned dictionary is a copy, and safe to modify.
+
     Args:
         filename (str): The path to the configuration file.
         section (str): The section of the configuration file to read.
@@ -21,15 +80,9 @@ def config(path: Path, section: str) -> Dict[str, str]:
     Raises:
         Exception: If the specified section is not found in the configuration file.
     """
-    parser = ConfigParser()
-    parser.read(path)
+    sections = _get_sections(path)
 
-    conf = {}
-    if parser.has_section(section):
-        params = parser.items(section)
-        for param in params:
-            conf[param[0]] = param[1]
-    else:
+    if section not in sections:
         raise ValueError(f"Section {section} not found in the {path} file")
 
-    return conf
+    return dict(sections[section])
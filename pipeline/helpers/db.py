@@ -2,15 +2,34 @@
 Helper functions for interacting with a PostgreSQL database.
 """
 
+import io
 import json
 import logging
+import math
+import os
 import sys
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Literal, Optional
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+import psycopg2.pool
 import sqlalchemy
 
 from pipeline import orchestrator
@@ -18,6 +37,17 @@ from pipeline.helpers import cli, utils
 
 logger = logging.getLogger(__name__)
 
+# A SQL query, either as a plain string or as a (query, parameters) pair
+Query = Union[str, Tuple[str, Sequence]]
+# An open connection, see `transaction`
+Connection = psycopg2.extensions.connection
+
+# Open connections, reused across calls; see `get_connection_pool`
+# and `get_db_connection`
+_CONNECTION_POOLS: Dict[Tuple[str, str, int], "CheckedConnectionPool"] = {}
+_ENGINES: Dict[Tuple[str, str, int], sqlalchemy.engine.base.Engine] = {}
+_CONNECTION_POOLS_LOCK = threading.Lock()
+
 
 def handle_null(query: str) -> str:
     """
@@ -49,6 +79,23 @@ def handle_nan(query: str) -> str:
     return query
 
 
+def compact_query(query: str) -> str:
+    """
+    Collapses the indentation and line breaks of a SQL template into single spaces,
+    so that they are not sent to the server with every statement.
+
+    Note: Only use this on templates without string literals, as whitespace
+    inside quotes is collapsed too.
+
+    Args:
+        query (str): The SQL query to compact.
+
+    Returns:
+        str: The query on a single line.
+    """
+    return " ".join(query.split())
+
+
 def santize_string(string: str) -> str:
     """
     Sanitizes a string by escaping single quotes.
@@ -62,26 +109,97 @@ def santize_string(string: str) -> str:
     return string.replace("'", "''")
 
 
+def santize_strings(strings: Sequence[str]) -> List[str]:
+    """
+    Sanitizes a batch of strings by escaping single quotes.
+
+    Args:
+        strings (Sequence[str]): The strings to sanitize.
+
+    Returns:
+        List[str]: The sanitized strings, in the same order.
+    """
+    return [string.replace("'", "''") for string in strings]
+
+
 def sanitize_json(json_dict: dict) -> str:
     """
     Sanitizes a JSON object by replacing single quotes with double quotes.
 
+    Note: The input dictionary is left untouched, so that repeated calls on
+    the same object do not escape its values more than once.
+
     Args:
         json_dict (dict): The JSON object to sanitize.
 
     Returns:
         str: The sanitized JSON object.
     """
-    for key, value in json_dict.items():
-        if isinstance(value, str):
-            json_dict[key] = santize_string(value)
+    sanitized_dict = {
+        key: santize_string(value) if isinstance(value, str) else value
+        for key, value in json_dict.items()
+    }
+
+    return dump_json(sanitized_dict)
+
+
+def _nan_to_none(obj):
+    if isinstance(obj, float) and math.isnan(obj):
+        return None
+    if isinstance(obj, dict):
+        return {key: _nan_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(value) for value in obj]
+    return obj
+
+
+def dump_json(obj) -> str:
+    """
+    Serializes an object to JSON, as accepted by PostgreSQL's JSON types.
 
-    json_str = json.dumps(json_dict, default=str)
+    NaN values are written as null. Values that are not JSON serializable
+    (e.g. dates, or numpy scalars) are written as strings.
 
-    # Replace NaN with NULL
-    json_str = json_str.replace("NaN", "null")
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        str: The JSON string.
+    """
+    return json.dumps(_nan_to_none(obj), default=str)
+
+
+def json_param(obj) -> psycopg2.extras.Json:
+    """
+    Wraps an object to be bound as a JSON query parameter, so that psycopg2
+    handles the quoting instead of the SQL string.
 
-    return json_str
+    Args:
+        obj: The object to bind.
+
+    Returns:
+        psycopg2.extras.Json: The adapted object.
+    """
+    return psycopg2.extras.Json(obj, dumps=dump_json)
+
+
+def render_query(cursor, query: Query) -> str:
+    """
+    Renders a query as the exact string that will be sent to the server,
+    binding its parameters if it has any.
+
+    Args:
+        cursor: The psycopg2 cursor used to bind the parameters.
+        query (Query): The SQL query, or a (query, parameters) pair.
+
+    Returns:
+        str: The SQL query with its parameters bound.
+    """
+    if isinstance(query, tuple):
+        sql_query, params = query
+        return cursor.mogrify(sql_query, params).decode("utf-8")
+
+    return query
 
 
 def on_failure():
@@ -114,15 +232,146 @@ def get_db_credentials(config_file: Path, db: str = "postgresql") -> Dict[str, s
     return credentials
 
 
+class CheckedConnectionPool(psycopg2.pool.ThreadedConnectionPool):
+    """
+    A ThreadedConnectionPool that only hands out live connections, and waits
+    for a free connection instead of raising PoolError once maxconn
+    connections are in use.
+
+    Connections closed since they were returned are replaced. Connections
+    that sat idle for more than `ping_after_s` seconds (and may have been
+    dropped by a server restart or an idle timeout) are checked with a
+    `SELECT 1` first.
+    """
+
+    def __init__(
+        self, minconn: int, maxconn: int, *args, ping_after_s: float = 30.0, **kwargs
+    ) -> None:
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self.ping_after_s = ping_after_s
+        self._slots = threading.BoundedSemaphore(maxconn)
+        # When each idle connection was returned, by id
+        self._returned_at: Dict[int, float] = {}
+
+    def _is_alive(self, conn: Connection) -> bool:
+        returned_at = self._returned_at.pop(id(conn), None)
+        if conn.closed:
+            return False
+        if returned_at is None or time.monotonic() - returned_at < self.ping_after_s:
+            return True
+
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    def getconn(self, key=None) -> Connection:
+        self._slots.acquire()
+        try:
+            conn = super().getconn(key)
+            while not self._is_alive(conn):
+                # Stale connections are dropped until a live (or new) one is found
+                super().putconn(conn, key, close=True)
+                conn = super().getconn(key)
+            return conn
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False) -> None:
+        try:
+            if not close:
+                self._returned_at[id(conn)] = time.monotonic()
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+
+def get_connection_pool(
+    config_file: Path, db: str = "postgresql"
+) -> CheckedConnectionPool:
+    """
+    Returns the connection pool for the given database, creating it on first use.
+
+    Pools are kept per process, so that connections are never shared
+    across a fork (e.g. with multiprocessing). Callers block while all of the
+    pool's connections are in use (see `CheckedConnectionPool`).
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+
+    Returns:
+        CheckedConnectionPool: The connection pool.
+    """
+    key = (str(config_file), db, os.getpid())
+
+    with _CONNECTION_POOLS_LOCK:
+        if key not in _CONNECTION_POOLS:
+            credentials = get_db_credentials(config_file=config_file, db=db)
+            _CONNECTION_POOLS[key] = CheckedConnectionPool(
+                minconn=1, maxconn=16, **credentials
+            )
+
+        return _CONNECTION_POOLS[key]
+
+
+@contextmanager
+def transaction(
+    config_file: Path, db: str = "postgresql"
+) -> Iterator[Connection]:
+    """
+    Borrows a connection from the pool for a single transaction.
+
+    Pass the connection to `execute_queries` (or the helpers built on it) to
+    run several calls in the same transaction. It is committed when the block
+    exits, or rolled back (and discarded) if the block raises.
+
+    Usage:
+    ```
+    with db.transaction(config_file=config_file) as conn:
+        db.execute_queries(config_file, queries_a, conn=conn)
+        db.execute_queries(config_file, queries_b, conn=conn)
+    ```
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+
+    Yields:
+        Connection: The pooled connection.
+    """
+    pool = get_connection_pool(config_file=config_file, db=db)
+    conn = pool.getconn()
+    discard = False
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        # Including SystemExit, raised by the default `on_failure`
+        discard = True
+        raise
+    finally:
+        # A connection that saw an error may be broken; don't hand it out again
+        pool.putconn(conn, close=discard)
+
+
 def execute_queries(
     config_file: Path,
-    queries: list,
+    queries: List[Query],
     show_commands=True,
     show_progress=False,
     silent=False,
     db: str = "postgresql",
     backup: bool = False,
     on_failure: Optional[Callable] = on_failure,
+    single_transaction: bool = False,
+    conn: Optional[Connection] = None,
 ) -> list:
     """
     Executes a list of SQL queries on a PostgreSQL database.
@@ -130,7 +379,8 @@ def execute_queries(
     Args:
         config_file_path (str): The path to the configuration file containing
             the connection parameters.
-        queries (list): A list of SQL queries to execute.
+        queries (List[Query]): A list of SQL queries to execute. Each query is
+            either a string or a (query, parameters) pair.
         show_commands (bool, optional): Whether to display the executed SQL queries.
             Defaults to True.
         show_progress (bool, optional): Whether to display a progress bar. Defaults to False.
@@ -138,45 +388,72 @@ def execute_queries(
         db (str, optional): The section of the configuration file to use.
             Defaults to "postgresql".
         backup (bool, optional): Whether to sace all executed queries to a file.
+        single_transaction (bool, optional): Whether to send all queries to the
+            server at once, in a single round-trip. They always run in one
+            transaction. Only the result of the last query is returned.
+            Defaults to False.
+        conn (Optional[Connection], optional): An open
+            connection (see `transaction`) to run the queries on. The queries are
+            then committed by its owner, not here. Defaults to None, which
+            borrows a connection from the pool.
 
     Returns:
         list: A list of tuples containing the results of the executed queries.
     """
-    conn = None
+    pool = None
+    owns_conn = conn is None
+    discard = False
     command = None
     output = []
 
-    if backup:
-        repo_root = cli.get_repo_root()
-        backup_file = (
-            Path(repo_root)
-            / "data"
-            / "temp"
-            / f"backup_{datetime.now().strftime('%Y%m%d%H%M%S')}.sql"
-        )
+    try:
+        if owns_conn:
+            pool = get_connection_pool(config_file=config_file, db=db)
+            conn = pool.getconn()
+        cur = conn.cursor()
 
-        with open(backup_file, "w", encoding="utf-8") as f:
-            for query in queries:
-                f.write(query + ";\n\n")
+        if backup:
+            repo_root = cli.get_repo_root()
+            backup_file = (
+                Path(repo_root)
+                / "data"
+                / "temp"
+                / f"backup_{datetime.now().strftime('%Y%m%d%H%M%S')}.sql"
+            )
 
-        orchestrator.fix_permissions(config_file=config_file, file_path=backup_file)
+            with open(backup_file, "w", encoding="utf-8") as f:
+                for query in queries:
+                    f.write(render_query(cur, query) + ";\n\n")
 
-    try:
-        credentials = get_db_credentials(config_file=config_file, db=db)
-        conn = psycopg2.connect(**credentials)  # type: ignore
-        cur = conn.cursor()
+            orchestrator.fix_permissions(config_file=config_file, file_path=backup_file)
 
-        def execute_query(query: str):
+        def execute_query(query: Query):
             if show_commands:
                 logger.debug("Executing query:")
-                logger.debug(f"[bold blue]{query}", extra={"markup": True})
-            cur.execute(query)
+                logger.debug(
+                    f"[bold blue]{render_query(cur, query)}", extra={"markup": True}
+                )
+            if isinstance(query, tuple):
+                cur.execute(*query)
+            else:
+                cur.execute(query)
             try:
                 output.append(cur.fetchall())
             except psycopg2.ProgrammingError:
                 pass
 
-        if show_progress:
+        if single_transaction:
+            # psycopg2 already runs the statements in a transaction, committed
+            # below (or by the owner of conn), so only the round-trips are saved
+            command = (
+                ";\n".join(
+                    render_query(cur, query).strip().rstrip(";") for query in queries
+                )
+                + ";"
+            )
+            execute_query(command)
+
+        elif show_progress:
             with utils.get_progress_bar() as progress:
                 task = progress.add_task("Executing SQL queries...", total=len(queries))
 
@@ -190,13 +467,15 @@ def execute_queries(
 
         cur.close()
 
-        conn.commit()
+        if owns_conn:
+            conn.commit()
 
         if not silent:
             logger.debug(
                 f"[grey]Executed {len(queries)} SQL query(ies).", extra={"markup": True}
             )
     except (Exception, psycopg2.DatabaseError) as e:
+        discard = True
         logger.error("[bold red]Error executing queries.", extra={"markup": True})
         if command is not None:
             logger.error(f"[red]For query: {command}", extra={"markup": True})
@@ -206,42 +485,314 @@ def execute_queries(
         else:
             raise e
     finally:
-        if conn is not None:
-            conn.close()
+        if owns_conn and pool is not None and conn is not None:
+            # A connection that saw an error may be broken; don't hand it out again
+            pool.putconn(conn, close=discard)
 
     return output
 
 
+def execute_values(
+    config_file: Path,
+    query: str,
+    values: List[Sequence],
+    page_size: int = 1000,
+    db: str = "postgresql",
+    on_failure: Optional[Callable] = on_failure,
+    conn: Optional[Connection] = None,
+) -> None:
+    """
+    Inserts many rows with a single multi-row statement per page, using
+    psycopg2's `execute_values`.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        query (str): The SQL query to execute. Must contain a single `VALUES %s`
+            placeholder.
+        values (List[Sequence]): The rows to insert, as tuples of parameters.
+        page_size (int, optional): The maximum number of rows per statement.
+            Defaults to 1000.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+        conn (Optional[Connection], optional): An open connection (see
+            `transaction`) to insert with, committed by its owner. Defaults to
+            None, which borrows a connection from the pool.
+    """
+    if len(values) == 0:
+        return
+
+    pool = None
+    owns_conn = conn is None
+    discard = False
+    try:
+        if owns_conn:
+            pool = get_connection_pool(config_file=config_file, db=db)
+            conn = pool.getconn()
+        cur = conn.cursor()
+
+        psycopg2.extras.execute_values(cur, query, values, page_size=page_size)
+
+        cur.close()
+        if owns_conn:
+            conn.commit()
+
+        logger.debug(f"[grey]Inserted {len(values)} row(s).", extra={"markup": True})
+    except (Exception, psycopg2.DatabaseError) as e:
+        discard = True
+        logger.error("[bold red]Error executing queries.", extra={"markup": True})
+        logger.error(f"[red]For query: {query}", extra={"markup": True})
+        logger.error(e)
+        if on_failure is not None:
+            on_failure()
+        else:
+            raise e
+    finally:
+        if owns_conn and pool is not None and conn is not None:
+            # A connection that saw an error may be broken; don't hand it out again
+            pool.putconn(conn, close=discard)
+
+
+def execute_batch(
+    config_file: Path,
+    queries: List[Query],
+    page_size: int = 100,
+    db: str = "postgresql",
+    on_failure: Optional[Callable] = on_failure,
+) -> None:
+    """
+    Executes a list of SQL queries in a single transaction, sending runs of
+    parameterized queries that share the same SQL (i.e. rows for the same table)
+    together, using psycopg2's `execute_batch`.
+
+    Queries are executed in the order given, so rows that reference each other
+    can be mixed freely.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        queries (List[Query]): A list of SQL queries to execute. Each query is
+            either a string or a (query, parameters) pair.
+        page_size (int, optional): The maximum number of statements sent per
+            round-trip. Defaults to 100.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+    """
+    if len(queries) == 0:
+        return
+
+    pool = None
+    conn = None
+    discard = False
+    sql_query = None
+    try:
+        pool = get_connection_pool(config_file=config_file, db=db)
+        conn = pool.getconn()
+        cur = conn.cursor()
+
+        idx = 0
+        while idx < len(queries):
+            query = queries[idx]
+            if not isinstance(query, tuple):
+                sql_query = query
+                cur.execute(sql_query)
+                idx += 1
+                continue
+
+            sql_query = query[0]
+            params_list = []
+            while (
+                idx < len(queries)
+                and isinstance(queries[idx], tuple)
+                and queries[idx][0] == sql_query
+            ):
+                params_list.append(queries[idx][1])
+                idx += 1
+
+            psycopg2.extras.execute_batch(
+                cur, sql_query, params_list, page_size=page_size
+            )
+
+        cur.close()
+        conn.commit()
+
+        logger.debug(
+            f"[grey]Executed {len(queries)} SQL query(ies).", extra={"markup": True}
+        )
+    except (Exception, psycopg2.DatabaseError) as e:
+        discard = True
+        logger.error("[bold red]Error executing queries.", extra={"markup": True})
+        if sql_query is not None:
+            logger.error(f"[red]For query: {sql_query}", extra={"markup": True})
+        logger.error(e)
+        if on_failure is not None:
+            on_failure()
+        else:
+            raise e
+    finally:
+        if pool is not None and conn is not None:
+            # A connection that saw an error may be broken; don't hand it out again
+            pool.putconn(conn, close=discard)
+
+
+def copy_from_df(
+    config_file: Path,
+    df: pd.DataFrame,
+    table: str,
+    on_conflict: str = "",
+    db: str = "postgresql",
+    on_failure: Optional[Callable] = on_failure,
+) -> None:
+    """
+    Bulk loads a DataFrame into a table using COPY, which skips per-row
+    statement parsing entirely.
+
+    The rows are first copied into a temporary staging table, and then moved
+    into the target table with a single INSERT ... SELECT, so that an
+    ON CONFLICT clause can still be applied.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        df (pd.DataFrame): The rows to load. Column names must match the table's.
+        table (str): The name of the target table.
+        on_conflict (str, optional): The ON CONFLICT clause to apply when moving
+            rows into the target table, e.g. "ON CONFLICT (id) DO NOTHING".
+            Defaults to "".
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+    """
+    if df.empty:
+        return
+
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    columns = ", ".join(f'"{col}"' for col in df.columns)
+    staging_table = f"{table}_staging"
+
+    pool = None
+    conn = None
+    discard = False
+    try:
+        pool = get_connection_pool(config_file=config_file, db=db)
+        conn = pool.getconn()
+        cur = conn.cursor()
+
+        cur.execute(
+            f"CREATE TEMP TABLE {staging_table} (LIKE {table} INCLUDING DEFAULTS) \
+ON COMMIT DROP;"
+        )
+        cur.copy_expert(
+            f"COPY {staging_table} ({columns}) FROM STDIN WITH (FORMAT csv);", buffer
+        )
+        cur.execute(
+            f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging_table} \
+{on_conflict};"
+        )
+
+        cur.close()
+        conn.commit()
+
+        logger.debug(
+            f"[grey]Copied {len(df)} row(s) into {table}.", extra={"markup": True}
+        )
+    except (Exception, psycopg2.DatabaseError) as e:
+        discard = True
+        logger.error(f"[bold red]Error copying rows into {table}.", extra={"markup": True})
+        logger.error(e)
+        if on_failure is not None:
+            on_failure()
+        else:
+            raise e
+    finally:
+        if pool is not None and conn is not None:
+            # A connection that saw an error may be broken; don't hand it out again
+            pool.putconn(conn, close=discard)
+
+
+def init_tables(
+    config_file: Path,
+    tables: list,
+    show_commands: bool = True,
+    db: str = "postgresql",
+) -> None:
+    """
+    Drops and recreates the given tables, over a single connection and in a
+    single transaction.
+
+    WARNING: This will delete all existing data in the given tables.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        tables (list): The models to initialize, ordered so that referenced tables
+            come first. Each must provide `drop_table_query` and `init_table_query`.
+            Tables are dropped in reverse order.
+        show_commands (bool, optional): Whether to display the executed SQL queries.
+            Defaults to True.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+    """
+    sql_queries: List[str] = []
+
+    for table in reversed(tables):
+        query = table.drop_table_query()
+        sql_queries.extend(query if isinstance(query, list) else [query])
+
+    for table in tables:
+        query = table.init_table_query()
+        sql_queries.extend(query if isinstance(query, list) else [query])
+
+    execute_queries(
+        config_file=config_file,
+        queries=sql_queries,  # type: ignore
+        show_commands=show_commands,
+        db=db,
+        single_transaction=True,
+    )
+
+
 def get_db_connection(
     config_file: Path, db: str = "postgresql"
 ) -> sqlalchemy.engine.base.Engine:
     """
     Establishes a connection to the PostgreSQL database using the provided configuration file.
 
+    The engine (and its connection pool) is created once per process and database,
+    and reused by subsequent calls.
+
     Args:
         config_file (Path): The path to the configuration file.
 
     Returns:
         sqlalchemy.engine.base.Engine: The database connection engine.
     """
-    credentials = get_db_credentials(config_file=config_file, db=db)
-    engine = sqlalchemy.create_engine(
-        "postgresql+psycopg2://"
-        + credentials["user"]
-        + ":"
-        + credentials["password"]
-        + "@"
-        + credentials["host"]
-        + ":"
-        + credentials["port"]
-        + "/"
-        + credentials["database"]
-    )
+    key = (str(config_file), db, os.getpid())
+
+    with _CONNECTION_POOLS_LOCK:
+        if key not in _ENGINES:
+            credentials = get_db_credentials(config_file=config_file, db=db)
+            _ENGINES[key] = sqlalchemy.create_engine(
+                "postgresql+psycopg2://"
+                + credentials["user"]
+                + ":"
+                + credentials["password"]
+                + "@"
+                + credentials["host"]
+                + ":"
+                + credentials["port"]
+                + "/"
+                + credentials["database"],
+                pool_pre_ping=True,
+            )
 
-    return engine
+        return _ENGINES[key]
 
 
-def execute_sql(config_file: Path, query: str, db: str = "postgresql") -> pd.DataFrame:
+def execute_sql(
+    config_file: Path,
+    query: str,
+    db: str = "postgresql",
+    params: Optional[Sequence] = None,
+) -> pd.DataFrame:
     """
     Executes a SQL query on a PostgreSQL database and returns the result as a pandas DataFrame.
 
@@ -249,21 +800,24 @@ def execute_sql(config_file: Path, query: str, db: str = "postgresql") -> pd.Dat
         config_file_path (str): The path to the configuration file containing the
             PostgreSQL database credentials.
         query (str): The SQL query to execute.
+        params (Optional[Sequence], optional): Parameters for the `%s` placeholders
+            in the query. Defaults to None.
 
     Returns:
         pd.DataFrame: A pandas DataFrame containing the result of the SQL query.
     """
     engine = get_db_connection(config_file=config_file, db=db)
 
-    df = pd.read_sql(query, engine)
-
-    engine.dispose()
+    df = pd.read_sql(query, engine, params=params)
 
     return df
 
 
 def fetch_record(
-    config_file: Path, query: str, db: str = "postgresql"
+    config_file: Path,
+    query: str,
+    db: str = "postgresql",
+    params: Optional[Sequence] = None,
 ) -> Optional[str]:
     """
     Fetches a single record from the database using the provided SQL query.
@@ -271,12 +825,14 @@ def fetch_record(
     Args:
         config_file_path (str): The path to the database configuration file.
         query (str): The SQL query to execute.
+        params (Optional[Sequence], optional): Parameters for the `%s` placeholders
+            in the query. Defaults to None.
 
     Returns:
         Optional[str]: The value of the first column of the first row of the result set,
         or None if the result set is empty.
     """
-    df = execute_sql(config_file=config_file, query=query, db=db)
+    df = execute_sql(config_file=config_file, query=query, db=db, params=params)
 
     # Check if there is a row
     if df.shape[0] == 0:
@@ -306,4 +862,3 @@ def df_to_table(
 
     engine = get_db_connection(config_file=config_file)
     df.to_sql(table_name, engine, if_exists=if_exists, index=False)
-    engine.dispose()
@@ -6,19 +6,20 @@ Helper funtions for interacting with the ffprobe
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-ROOT = None
-parent = file.parent
-for parent in file.parents:
-    if parent.name == "pipeline":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    ROOT = None
+    parent = file.parent
+    for parent in file.parents:
+        if parent.name == "pipeline":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 # Reference:
 # https://stackoverflow.com/questions/9896644/getting-ffprobe-information-with-python
@@ -2,15 +2,24 @@
 Helper functions for drawing on PDF canvases
 """
 
+import io
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from reportlab.graphics import renderPDF
+from reportlab.graphics.shapes import Drawing
 from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 from svglib.svglib import svg2rlg
 
+# An image to draw: a file path, or an ImageReader (e.g. over in-memory PNG bytes)
+Image = Union[Path, ImageReader]
+
 # params needed to scale reportlab coordinates to match Illustrator coordinates
 iw = 819
 ih = 1056
@@ -19,6 +28,52 @@ cw = w / iw
 ch = h / ih
 
 
+@lru_cache(maxsize=32)
+def _load_svg(
+    svg_path: str, mtime_ns: int
+) -> Optional[Tuple[Drawing, Tuple[float, float, float, float]]]:
+    """
+    Parses an SVG image once, along with its bounds.
+
+    The SVG assets are static, and drawn on every page of a report. The
+    modification time is part of the cache key, so an edited file is re-read.
+
+    Args:
+        svg_path (str): The path to the SVG image file.
+        mtime_ns (int): The modification time of the file, in nanoseconds.
+
+    Returns:
+        Optional[Tuple[Drawing, Tuple[float, float, float, float]]]: The parsed
+            drawing and its bounds, or None if the file could not be parsed.
+    """
+    drawing = svg2rlg(svg_path)
+
+    if drawing is None:
+        return None
+
+    return drawing, drawing.getBounds()  # type: ignore
+
+
+@lru_cache(maxsize=256)
+def _load_image(image_path: str, mtime_ns: int) -> ImageReader:
+    with open(image_path, "rb") as image_file:
+        return ImageReader(io.BytesIO(image_file.read()))
+
+
+def load_image(image_path: Path) -> ImageReader:
+    """
+    Returns an ImageReader for a static image asset (e.g. a PNG under the
+    assets directory), reading the file only once, until it changes.
+
+    Args:
+        image_path (Path): The path to the image file.
+
+    Returns:
+        ImageReader: The image, to be passed to draw_image.
+    """
+    return _load_image(str(image_path), os.stat(image_path).st_mtime_ns)
+
+
 def draw_svg(
     canvas: canvas.Canvas,
     svg_path: Path,
@@ -38,12 +93,18 @@ def draw_svg(
         width (float): The width of the image.
         height (float): The height of the image.
     """
-    drawing = svg2rlg(svg_path)
+    try:
+        mtime_ns = os.stat(svg_path).st_mtime_ns
+    except OSError:
+        return
 
-    if drawing is None:
+    svg = _load_svg(str(svg_path), mtime_ns)
+
+    if svg is None:
         return
 
-    xL, yL, xH, yH = drawing.getBounds()  # type: ignore
+    # The drawing is shared between calls, renderScale is set on every draw
+    drawing, (xL, yL, xH, yH) = svg
 
     drawing.renderScale = cw * width / (xH - xL)
     drawing.renderScale = ch * height / (yH - yL)
@@ -53,7 +114,7 @@ def draw_svg(
 
 def draw_image(
     canvas: canvas.Canvas,
-    image_path: Path,
+    image_path: Image,
     x: float,
     y: float,
     width: float,
@@ -64,7 +125,7 @@ def draw_image(
 
     Args:
         canvas (canvas.Canvas): The canvas to draw on.
-        image_path (Path): The path to the image file.
+        image_path (Image): The path to the image file, or an ImageReader.
         x (float): The x-coordinate of the lower-left corner of the image.
         y (float): The y-coordinate of the lower-left corner of the image.
         width (float): The width of the image.
@@ -118,6 +179,40 @@ def draw_text(
     canvas.setFillColorRGB(0, 0, 0, 1)
 
 
+def draw_texts(
+    canvas: canvas.Canvas,
+    texts: Sequence[Tuple[str, float, float]],
+    size: float,
+    font: str,
+    color: Tuple[float, float, float, float] = (0, 0, 0, 1),
+):
+    """
+    Draw several strings that share a font and color, as a single text object.
+
+    Equivalent to calling `draw_text` for each string, but the font and color
+    are only set once, instead of once per string.
+
+    Args:
+        canvas (canvas.Canvas): The PDF canvas to draw on.
+        texts (Sequence[Tuple[str, float, float]]): The (text, x, y) of each string.
+        size (float): The font size.
+        font (str): The font to use.
+        color (Tuple[float, float, float, float], optional):
+            The color of the text. Defaults to (0, 0, 0, 1).
+    """
+    canvas.setFillColorRGB(*color)
+
+    pdf_text_object = canvas.beginText()
+    pdf_text_object.setFont(font, size)
+    for text, x, y in texts:
+        pdf_text_object.setTextOrigin(x * cw, h - y * ch)
+        pdf_text_object.textOut(text)
+
+    canvas.drawText(pdf_text_object)
+
+    canvas.setFillColorRGB(0, 0, 0, 1)
+
+
 def draw_text_vertical_centered(
     canvas: canvas.Canvas,
     text: str,
@@ -240,6 +335,47 @@ def draw_colored_rect(
     canvas.setFillColorRGB(0, 0, 0, 1)
 
 
+def draw_colored_rects(
+    canvas: canvas.Canvas,
+    rects: Sequence[Tuple[float, float, float, float]],
+    color: Tuple[float, float, float, float],
+    fill: bool = True,
+    stroke: bool = False,
+    line_width: Optional[float] = None,
+):
+    """
+    Draw several rectangles that share a color, as a single path.
+
+    Equivalent to calling `draw_colored_rect` for each rectangle, but the color
+    and line width are only set once, and the rectangles are filled / stroked
+    together.
+
+    Args:
+        canvas (reportlab.pdfgen.canvas.Canvas): The canvas to draw on.
+        rects (Sequence[Tuple[float, float, float, float]]): The (x, y, width, height)
+            of each rectangle, as for `draw_colored_rect`.
+        color (Tuple[float, float, float, float]): The color of the rectangles in RGBA format.
+        fill (bool, optional): Whether to fill the rectangles with the given color.
+            Defaults to True.
+        stroke (bool, optional): Whether to draw the outline of the rectangles.
+            Defaults to False.
+        line_width (Optional[float], optional): The width of the rectangles' outline.
+            Defaults to None / 1.
+    """
+    if len(rects) == 0:
+        return
+
+    if line_width:
+        canvas.setLineWidth(line_width)
+
+    canvas.setFillColorRGB(*(tuple(color)))
+    path = canvas.beginPath()
+    for x, y, width, height in rects:
+        path.rect(x * cw, h - y * ch, width * cw, height * ch)
+    canvas.drawPath(path, fill=fill, stroke=stroke)
+    canvas.setFillColorRGB(0, 0, 0, 1)
+
+
 def compute_x_right_align(text: str, font: str, size: float, x: float) -> float:
     """
     Computes the x-coordinate for right-aligning text in a PDF document.
@@ -275,6 +411,30 @@ def compute_x_right_align_list(
     return [compute_x_right_align(text, font, size, x) for text in text_list]
 
 
+def compute_x_right_align_batch(
+    text_list: List[str], font: str, size: float, rights: Sequence[float]
+) -> List[float]:
+    """
+    Computes the x-coordinate for right-aligned text for each string in the given list,
+    where each string has its own right edge.
+
+    Args:
+        text_list (List[str]): List of strings to compute the x-coordinate for.
+        font (str): Font to use for the text.
+        size (float): Font size to use for the text.
+        rights (Sequence[float]): The right edge of each string.
+
+    Returns:
+        List[float]: List of x-coordinates for right-aligned text for each string in the given list.
+    """
+    widths = np.fromiter(
+        (stringWidth(text, font, size) for text in text_list),
+        dtype=float,
+        count=len(text_list),
+    )
+    return (np.asarray(rights, dtype=float) - widths / cw).tolist()
+
+
 def draw_line(
     canvas: canvas.Canvas, x1: float, y1: float, x2: float, y2: float, line_width: float
 ):
@@ -3,7 +3,7 @@ Plot the correlation matrix
 """
 
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, Union
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -17,41 +17,66 @@ from pipeline.models.interview_roles import InterviewRole
 from pipeline.models.lite.heatmap_config import HeatmapConfig
 
 
-def combine_matrices(df_bottom: pd.DataFrame, df_top: pd.DataFrame) -> np.ndarray:
+def pearson_corr(df: pd.DataFrame) -> np.ndarray:
+    """
+    Computes the Pearson correlation matrix between the columns of a DataFrame.
+
+    Uses np.corrcoef, which is faster than DataFrame.corr. DataFrame.corr is
+    only used if there are missing values, since it then uses the pairwise
+    complete observations of each pair of columns, and np.corrcoef does not.
+
+    Args:
+        df (pd.DataFrame): The data, with one column per feature.
+
+    Returns:
+        np.ndarray: The correlation matrix. Correlations with a constant column
+            are NaN, as with DataFrame.corr.
+    """
+    values = df.to_numpy(dtype=np.float64)
+
+    if np.isnan(values).any():
+        return df.corr(method="pearson").to_numpy()
+
+    # Constant columns have a zero std, and a NaN correlation
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.corrcoef(values, rowvar=False)
+
+
+def combine_matrices(
+    df_bottom: Union[pd.DataFrame, np.ndarray], df_top: Union[pd.DataFrame, np.ndarray]
+) -> np.ndarray:
     """
     Combines two matrices by replacing the upper triangular elements of the first matrix
     with the corresponding elements from the second matrix, while keeping the lower triangular
     elements unchanged. The diagonal elements are set to NaN.
 
     Args:
-        df_bottom (pd.DataFrame): The first matrix.
-        df_top (pd.DataFrame): The second matrix.
+        df_bottom (Union[pd.DataFrame, np.ndarray]): The first matrix.
+        df_top (Union[pd.DataFrame, np.ndarray]): The second matrix.
 
     Returns:
         np.ndarray: The combined matrix.
     """
-    matrix = np.zeros(df_top.shape)
+    bottom = np.asarray(df_bottom, dtype=np.float64)
+    top = np.asarray(df_top, dtype=np.float64)
 
-    for i in range(df_top.shape[0]):
-        for j in range(df_top.shape[1]):
-            if i < j:
-                matrix[i, j] = df_top.iloc[i, j]
-            elif i > j:
-                matrix[i, j] = df_bottom.iloc[i, j]
+    matrix = np.where(
+        np.triu(np.ones(top.shape, dtype=bool), k=1),
+        top,
+        np.tril(bottom, k=-1),
+    )
 
     # matrix = matrix / matrix.max()
 
-    # Add the diagonal
-    for i in range(matrix.shape[0]):
-        # set the diagonal to the NaN
-        matrix[i, i] = np.nan
+    # Add the diagonal: set the diagonal to the NaN
+    np.fill_diagonal(matrix, np.nan)
 
     return matrix
 
 
 def plot_correrlation_matrix(
     df: pd.DataFrame,
-    output_path: Path,
+    output_path: Union[Path, BinaryIO],
     heatmap_config: HeatmapConfig,
     gap_idx: List[int],
     cmap: str = "BrBG",
@@ -62,7 +87,8 @@ def plot_correrlation_matrix(
 
     Args:
         df (pd.DataFrame): The correlation matrix.
-        output_path (Path): The path to save the plot.
+        output_path (Union[Path, BinaryIO]): The path (or binary file) to save
+            the plot to.
         heatmap_config (HeatmapConfig): The heatmap configuration.
         gap_idx (List[int]): The indices of the gaps in the correlation matrix.
         cmap (str, optional): The color map to use. Defaults to "BrBG".
@@ -105,13 +131,16 @@ def plot_correrlation_matrix(
     # Save the plot
     plt.savefig(output_path, bbox_inches="tight", pad_inches=0)
 
+    # close the figure
+    plt.close()
+
 
 def generate_correlation_matric(
     interview_name: str,
     role: InterviewRole,
     heatmap_config: HeatmapConfig,
     gap_idx: List[int],
-    output_path: Path,
+    output_path: Union[Path, BinaryIO],
     config_file_path: str,
     au_cols: List[str],
     data_path: Path,
@@ -125,7 +154,8 @@ def generate_correlation_matric(
         role (InterviewRole): The role of the primary person in the video.
         heatmap_config (HeatmapConfig): The heatmap configuration.
         gap_idx (List[int]): The indices of the gaps in the correlation matrix.
-        output_path (Path): The path to save the plot.
+        output_path (Union[Path, BinaryIO]): The path (or binary file) to save
+            the plot to.
         config_file_path (str): The path to the configuration file.
         au_cols (List[str]): The columns to use for the correlation matrix.
         data_path (Path): The path to the data directory.
@@ -161,8 +191,8 @@ def generate_correlation_matric(
         case _:
             raise ValueError(f"Invalid role: {role}")
 
-    corr_matrix_session = of_fau_session.corr(method="pearson")
-    corr_matrix_dist = of_fau_dist.corr(method="pearson")
+    corr_matrix_session = pearson_corr(of_fau_session)
+    corr_matrix_dist = pearson_corr(of_fau_dist)
 
     matrix = combine_matrices(df_top=corr_matrix_dist, df_bottom=corr_matrix_session)
 
@@ -2,7 +2,7 @@
 Plotting helper functions for creating heatmaps.
 """
 
-from typing import List
+from typing import BinaryIO, List, Union
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -16,7 +16,7 @@ def make_heatmap(
     df: pd.DataFrame,
     num_bins: int,
     cols: List[str],
-    output_path: str,
+    output_path: Union[str, BinaryIO],
     heatmap_config: HeatmapConfig,
     figsize=(10, 8),
 ):
@@ -27,24 +27,18 @@ def make_heatmap(
         df (pd.DataFrame): The input dataframe.
         num_bins (int): The number of bins.
         cols (List[str]): The columns to include in the heatmap.
-        output_path (str): The path to save the heatmap image.
+        output_path (Union[str, BinaryIO]): The path (or binary file) to save the
+            heatmap image to.
         heatmap_config (HeatmapConfig): The configuration for the heatmap.
         figsize (tuple, optional): The size of the figure. Defaults to (10, 8).
     """
 
-    # Create a new dataframe for Head Pose Heatmap data
-    df_heatmap = pd.DataFrame(columns=["bin"] + cols)
-
-    # Calculate the mean of each bin
-    for i in range(num_bins):
-        df_bin = df[df["bin"] == i]
-        df_heatmap.loc[i] = [i] + [df_bin[col].mean() for col in cols]  # type: ignore
+    # Calculate the mean of each bin, in a single pass over the data
+    # Bins without any frames are NaN
+    df_heatmap = df.groupby("bin")[cols].mean().reindex(range(num_bins))
 
     # Normalize the data
-    df_heatmap_norm = df_heatmap.copy()
-    df_heatmap_norm[cols] = df_heatmap_norm[cols].apply(
-        lambda x: (x - x.min()) / (x.max() - x.min())
-    )
+    df_heatmap_norm = df_heatmap.apply(lambda x: (x - x.min()) / (x.max() - x.min()))
 
     # Setup Color Map
     cmap: mpl.colors.Colormap = mpl.colormaps["PRGn"]  # type: ignore
@@ -88,7 +82,7 @@ def make_standard_deviation_heatmap(
     num_bins: int,
     features: List[str],
     cols: List[str],
-    output_path: str,
+    output_path: Union[str, BinaryIO],
     heatmap_config: HeatmapConfig,
     h_gap_idx: List[int],
     figsize=(20, 7),
@@ -104,31 +98,26 @@ def make_standard_deviation_heatmap(
         num_bins (int): The number of bins for the heatmap.
         features (List[str]): The list of feature names.
         cols (List[str]): The list of column names in the DataFrame.
-        output_path (str): The path to save the generated heatmap image.
+        output_path (Union[str, BinaryIO]): The path (or binary file) to save the
+            generated heatmap image to.
         heatmap_config (HeatmapConfig): The configuration object for the heatmap.
         h_gap_idx (List[int]): The list of indices to add horizontal gaps in the heatmap.
         figsize (tuple, optional): The size of the figure. Defaults to (20, 7).
         normalize (bool, optional): Flag indicating whether to normalize the data. Defaults to True.
     """
-    df_heatmap = pd.DataFrame(columns=["bin"] + features)
+    # Calculate the mean of each bin, in a single pass over the data
+    # Bins without any frames are NaN
+    bin_means = df.groupby("bin")[cols].mean().reindex(range(num_bins))
 
-    for i in range(num_bins):
-        df_bin = df[df["bin"] == i]
-        for col, feature in zip(cols, features):
-            df_heatmap.loc[i, "bin"] = i
-            df_heatmap.loc[i, feature] = df_bin[col].mean()
-
-            # Scale each bin to be with 3 standard deviations of the distribution
-            dist_mean = fau_avgs[col]
-            dist_std = fau_stds[col]
-
-            max_val = dist_mean + (3 * dist_std)
-            min_val = dist_mean - (3 * dist_std)
-
-            if df_heatmap.loc[i, feature] > max_val:
-                df_heatmap.loc[i, feature] = max_val
-            elif df_heatmap.loc[i, feature] < min_val:
-                df_heatmap.loc[i, feature] = min_val
+    # Scale each bin to be with 3 standard deviations of the distribution
+    dist_mean = fau_avgs[cols]
+    dist_std = fau_stds[cols]
+
+    max_val = dist_mean + (3 * dist_std)
+    min_val = dist_mean - (3 * dist_std)
+
+    bin_means = bin_means.clip(lower=min_val, upper=max_val, axis=1)
+    df_heatmap = bin_means.set_axis(features, axis=1)
 
     # Normalize the data if normalize is True
     if normalize:
@@ -3,7 +3,9 @@ Helper functions for the pipeline
 """
 
 import logging
+import os
 import re
+import sys
 from pathlib import Path
 from typing import List
 from datetime import datetime
@@ -18,12 +20,19 @@ from rich.progress import (
     TimeElapsedColumn,
     TimeRemainingColumn,
 )
+import numpy as np
 import pandas as pd
 
 from pipeline.helpers import cli
 from pipeline.helpers.config import config
 
-_console = Console(color_system="standard")
+# Skip ANSI styling when output is not a terminal (e.g. cron / docker logs),
+# and silence the console entirely when PIPELINE_QUIET=1
+_console = Console(
+    color_system="standard",
+    no_color=not sys.stdout.isatty(),
+    quiet=os.environ.get("PIPELINE_QUIET", "0") == "1",
+)
 
 
 def get_progress_bar(transient: bool = False) -> Progress:
@@ -48,6 +57,9 @@ def get_console() -> Console:
     """
     Returns a Console object with standard color system.
 
+    Colors are disabled when stdout is not a terminal, and all output is
+    suppressed when the `PIPELINE_QUIET` environment variable is set to 1.
+
     Returns:
         Console: A Console object with standard color system.
     """
@@ -188,6 +200,31 @@ def datetime_time_to_float(time: datetime.time) -> float:  # type: ignore
     return time.hour * 3600 + time.minute * 60 + time.second + time.microsecond / 1e6
 
 
+def datetime_times_to_floats(times: pd.Series) -> pd.Series:
+    """
+    Vectorized `datetime_time_to_float`: converts a Series of datetime.time
+    objects to the number of seconds since midnight, without a Python call per row.
+
+    Series that are already numeric are returned unchanged, and values that
+    can't be parsed become NaN.
+
+    Args:
+        times (pd.Series): The times to convert.
+
+    Returns:
+        pd.Series: The number of seconds since midnight, as floats.
+    """
+    if pd.api.types.is_numeric_dtype(times):
+        return times
+    if pd.api.types.is_timedelta64_dtype(times):
+        return times.dt.total_seconds()
+    if pd.api.types.is_datetime64_any_dtype(times):
+        return (times - times.dt.normalize()).dt.total_seconds()
+
+    # str(datetime.time) is 'HH:MM:SS[.ffffff]', which to_timedelta parses in C
+    return pd.to_timedelta(times.astype(str), errors="coerce").dt.total_seconds()
+
+
 def create_labels(start_time: float, end_time: float, num_of_labels: int):
     """
     Creates a list of labels for a given time range and number of labels.
@@ -203,16 +240,13 @@ def create_labels(start_time: float, end_time: float, num_of_labels: int):
     """
     interval = (end_time - start_time) / (num_of_labels - 1)
 
-    labels = []
-
-    for i in range(num_of_labels):
-        current_time = start_time + i * interval
-
-        minutes = int(current_time // 60)
-        seconds = int(current_time % 60)
-
-        label = f"{minutes:02d}:{seconds:02d}"
+    times = start_time + np.arange(num_of_labels) * interval
+    minutes = (times // 60).astype(int)
+    seconds = (times % 60).astype(int)
 
-        labels.append(label)
+    labels = [
+        f"{minute:02d}:{second:02d}"
+        for minute, second in zip(minutes.tolist(), seconds.tolist())
+    ]
 
     return labels
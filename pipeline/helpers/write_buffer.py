@@ -0,0 +1,178 @@
+"""
+Helper class for batching database writes off the critical path.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import List, Optional, Set
+
+from pipeline.helpers import db
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBuffer:
+    """
+    A context manager that collects SQL queries in memory and writes them to
+    the database in batches, on a background thread.
+
+    Each batch is written in a single transaction, and batches are written in
+    the order they were submitted. Within a batch, consecutive parameterized
+    queries for the same table are sent together (see `db.execute_batch`), so
+    queries for different tables can be interleaved.
+
+    All pending queries are written when the context exits, or when `flush`
+    is called. If the body of the context raises, pending queries are dropped
+    instead, and the exception propagates as is. If a background write fails, nothing more is written: batches
+    still queued are skipped, and the error is raised by the next `submit`,
+    `flush` or `close`.
+
+    Usage:
+    ```
+    with WriteBuffer(config_file=config_file) as buffer:
+        for item in items:
+            buffer.submit(item.to_sql())
+    ```
+    """
+
+    def __init__(
+        self,
+        config_file: Path,
+        batch_size: int = 1024,
+        max_wait_s: float = 5.0,
+        max_in_flight: int = 2,
+    ) -> None:
+        """
+        Args:
+            config_file (Path): The path to the configuration file.
+            batch_size (int, optional): The number of queries that triggers a
+                write. Defaults to 1024.
+            max_wait_s (float, optional): The maximum time (in seconds) a query
+                is held back before a write is triggered by the next submit.
+                This is only checked on submit; there is no timer, so queries
+                stay pending until the next submit, `flush` or exit.
+                Defaults to 5.0.
+            max_in_flight (int, optional): The maximum number of batches queued
+                for writing. `submit` blocks while this many are pending.
+                Defaults to 2.
+        """
+        self.config_file = config_file
+        self.batch_size = batch_size
+        self.max_wait_s = max_wait_s
+
+        self._pending: List[db.Query] = []
+        self._pending_since: Optional[float] = None
+        # Writes not finished yet; finished ones remove themselves
+        self._futures: Set[Future] = set()
+        self._futures_lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        # A single worker keeps batches in submission order
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def __enter__(self) -> "WriteBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        if exc_type is not None:
+            # Don't write a partial batch, or let a write error replace the
+            # exception being raised
+            self._pending = []
+            self._pending_since = None
+            self._executor.shutdown(wait=True)
+            return
+        self.close()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _on_done(self, future: Future) -> None:
+        with self._futures_lock:
+            self._futures.discard(future)
+            if self._error is None and future.exception() is not None:
+                self._error = future.exception()
+
+    def _write(self, queries: List[db.Query]) -> None:
+        try:
+            if self._error is not None:
+                # An earlier batch failed; don't commit the ones after it
+                return
+            db.execute_batch(
+                config_file=self.config_file,
+                queries=queries,
+                on_failure=None,
+            )
+            logger.debug(
+                f"[grey]Wrote {len(queries)} buffered query(ies).",
+                extra={"markup": True},
+            )
+        finally:
+            self._in_flight.release()
+
+    def _dispatch(self) -> None:
+        if len(self._pending) == 0:
+            return
+
+        queries, self._pending = self._pending, []
+        self._pending_since = None
+
+        self._in_flight.acquire()
+        future = self._executor.submit(self._write, queries)
+        with self._futures_lock:
+            self._futures.add(future)
+        future.add_done_callback(self._on_done)
+
+    def submit(self, query: db.Query) -> None:
+        """
+        Adds a query to the buffer, triggering a background write if the
+        buffer is full or the oldest pending query has waited too long.
+
+        Args:
+            query (db.Query): The SQL query, or a (query, parameters) pair.
+
+        Raises:
+            Exception: The error raised by a failed background write.
+        """
+        self._raise_if_failed()
+
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        self._pending.append(query)
+
+        if (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._pending_since >= self.max_wait_s
+        ):
+            self._dispatch()
+
+    def flush(self) -> None:
+        """
+        Writes all pending queries and waits for every write to finish.
+
+        Raises:
+            Exception: The first error raised by a background write.
+        """
+        self._raise_if_failed()
+        self._dispatch()
+
+        with self._futures_lock:
+            futures = list(self._futures)
+        wait(futures)
+        # `wait` can return before the done callbacks have run
+        for future in futures:
+            self._on_done(future)
+
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """
+        Flushes the buffer and stops the background writer.
+        """
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
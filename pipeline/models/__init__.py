@@ -3,7 +3,6 @@ Models Database tables, and contains functions to initialize the database.
 """
 
 from pathlib import Path
-from typing import List, Union
 
 from pipeline.models.study import Study
 from pipeline.models.subjects import Subject
@@ -55,49 +54,25 @@ def init_db(config_file: Path):
     Args:
         config_file (Path): Path to the config file.
     """
-    drop_queries_l: List[Union[str, List[str]]] = [
-        PdfReport.drop_table_query(),
-        LoadOpenface.drop_table_query(),
-        OpenfaceQC.drop_table_query(),
-        Openface.drop_table_query(),
-        VideoStream.drop_table_query(),
-        InterviewRole.drop_table_query(),
-        VideoQuickQc.drop_table_query(),
-        DecryptedFile.drop_table_query(),
-        InterviewFile.drop_table_query(),
-        Interview.drop_table_query(),
-        InterviewType.drop_table_query(),
-        File.drop_table_query(),
-        Subject.drop_table_query(),
-        Study.drop_table_query(),
-        KeyStore.drop_table_query(),
-        Log.drop_table_query(),
-        FfprobeMetadata.drop_table_query(),
+    # Ordered so that referenced tables are created first (and dropped last)
+    tables = [
+        KeyStore,
+        Log,
+        Study,
+        Subject,
+        InterviewType,
+        Interview,
+        File,
+        InterviewFile,
+        DecryptedFile,
+        VideoQuickQc,
+        InterviewRole,
+        VideoStream,
+        Openface,
+        OpenfaceQC,
+        LoadOpenface,
+        PdfReport,
+        FfprobeMetadata,
     ]
 
-    create_queries_l: List[Union[str, List[str]]] = [
-        KeyStore.init_table_query(),
-        Log.init_table_query(),
-        Study.init_table_query(),
-        Subject.init_table_query(),
-        InterviewType.init_table_query(),
-        Interview.init_table_query(),
-        File.init_table_query(),
-        InterviewFile.init_table_query(),
-        DecryptedFile.init_table_query(),
-        VideoQuickQc.init_table_query(),
-        InterviewRole.init_table_query(),
-        VideoStream.init_table_query(),
-        Openface.init_table_query(),
-        OpenfaceQC.init_table_query(),
-        LoadOpenface.init_table_query(),
-        PdfReport.init_table_query(),
-        FfprobeMetadata.init_table_query(),
-    ]
-
-    drop_queries = flatten_list(drop_queries_l)
-    create_queries = flatten_list(create_queries_l)
-
-    sql_queries: List[str] = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries)
+    db.init_tables(config_file=config_file, tables=tables)
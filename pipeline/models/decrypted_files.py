@@ -3,26 +3,28 @@
 DecryptedFile Model
 """
 
+import os
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
 
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 import pandas as pd
 
@@ -34,6 +36,43 @@ console = utils.get_console()
 class DecryptedFile:
     """Represents a decrypted file."""
 
+    __slots__ = (
+        "source_path",
+        "destination_path",
+        "requested_by",
+        "decrypted",
+        "process_time",
+        "requested_at",
+        "decrypted_at",
+    )
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS decrypted_files (
+            source_path TEXT NOT NULL REFERENCES interview_files (interview_file),
+            destination_path TEXT NOT NULL UNIQUE,
+            requested_by TEXT NOT NULL,
+            decrypted BOOLEAN NOT NULL DEFAULT FALSE,
+            process_time REAL,
+            requested_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            decrypted_at TIMESTAMP DEFAULT NULL,
+            PRIMARY KEY (source_path)
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS decrypted_files;
+        """
+
+    # 'requested_at' falls back to the server's clock when unset
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO decrypted_files (source_path, destination_path, requested_by,
+            decrypted, process_time, requested_at, decrypted_at)
+        VALUES (%s, %s, %s,
+            %s, %s, COALESCE(%s, CURRENT_TIMESTAMP), %s);
+        """
+    )
+
     def __init__(
         self,
         source_path: Path,
@@ -41,11 +80,11 @@ class DecryptedFile:
         requested_by: str,
         decrypted: bool = False,
         process_time: Optional[float] = None,
-        requested_at: Optional[datetime] = datetime.now(),
+        requested_at: Optional[datetime] = None,
         decrypted_at: Optional[datetime] = None,
     ):
-        self.source_path = source_path
-        self.destination_path = destination_path
+        self.source_path = os.fspath(source_path)
+        self.destination_path = os.fspath(destination_path)
         self.requested_by = requested_by
         self.decrypted = decrypted
         self.process_time = process_time
@@ -55,39 +94,21 @@ class DecryptedFile:
     def __repr__(self):
         return f"DecryptedFile({self.source_path}, {self.destination_path} {self.requested_by})"
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'decrypted_files' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS decrypted_files (
-            source_path TEXT NOT NULL REFERENCES interview_files (interview_file),
-            destination_path TEXT NOT NULL UNIQUE,
-            requested_by TEXT NOT NULL,
-            decrypted BOOLEAN NOT NULL DEFAULT FALSE,
-            process_time REAL,
-            requested_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            decrypted_at TIMESTAMP DEFAULT NULL,
-            PRIMARY KEY (source_path)
-        );
-        """
-
-        return sql_query
+        return DecryptedFile._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'decrypted_files' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS decrypted_files;
-        """
-
-        return sql_query
+        return DecryptedFile._DROP_TABLE_QUERY
 
     @staticmethod
     def drop_row_query(destination_path: Path) -> str:
@@ -108,35 +129,24 @@ class DecryptedFile:
 
         return sql_query
 
-    def to_sql(self):
-        """
-        Return the SQL query to insert the DecryptedFile object into the 'decrypted_files' table.
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        source_path = db.santize_string(str(self.source_path))
-
-        if self.requested_at is not None:
-            requested_at = self.requested_at.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            requested_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        if self.decrypted_at is not None:
-            decrypted_at = self.decrypted_at.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            decrypted_at = "NULL"
-
-        if self.process_time is None:
-            self.process_time = "NULL"
-
-        sql_query = f"""
-        INSERT INTO decrypted_files (source_path, destination_path, requested_by,
-            decrypted, process_time, requested_at, decrypted_at)
-        VALUES ('{source_path}', '{self.destination_path}', '{self.requested_by}',
-            {self.decrypted}, {self.process_time}, '{requested_at}', {decrypted_at});
+        Return the SQL query and its parameters to insert the DecryptedFile object
+        into the 'decrypted_files' table.
         """
+        sql_query = DecryptedFile._INSERT_QUERY
 
-        sql_query = db.handle_null(sql_query)
+        params = (
+            self.source_path,
+            self.destination_path,
+            self.requested_by,
+            self.decrypted,
+            self.process_time,
+            self.requested_at,
+            self.decrypted_at,
+        )
 
-        return sql_query
+        return sql_query, params
 
     @staticmethod
     def get_files_pending_decrytion(
@@ -235,11 +245,6 @@ if __name__ == "__main__":
         "[red]This will delete all existing data in the 'decrypted_files' table![/red]"
     )
 
-    drop_queries = [DecryptedFile.drop_table_query()]
-    create_queries = [DecryptedFile.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries)
+    db.init_tables(config_file=config_file, tables=[DecryptedFile])
 
     console.log("[green]Done!")
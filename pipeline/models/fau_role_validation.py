@@ -6,21 +6,23 @@ FauRoleValidation Model
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Dict
 
 from pipeline.helpers import db, utils
@@ -41,6 +43,20 @@ class FauRoleValidation:
         timestamp (datetime): Timestamp of the object creation
     """
 
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS fau_role_validation (
+            interview_name TEXT REFERENCES load_openface(interview_name),
+            frv_fau_metrics JSONB,
+            frv_matches_with_transcript BOOLEAN,
+            frv_timestamp TIMESTAMP,
+            PRIMARY KEY (interview_name)
+        )
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS fau_role_validation
+        """
+
     def __init__(
         self,
         interview_name: str,
@@ -51,41 +67,34 @@ class FauRoleValidation:
         self.fau_metrics = fau_metrics
         self.matches_with_transcript = matches_with_transcript
         self.timestamp: datetime = datetime.now()
+        self._timestamp_s = self.timestamp.isoformat(sep=" ")
 
     def __str__(self) -> str:
         return f"FauRoleValidation({self.interview_name}, \
 {self.fau_metrics}, {self.matches_with_transcript})"
 
-    def __repr__(self) -> str:
-        return self.__str__()
+    __repr__ = __str__
+
+    @cached_property
+    def fau_metrics_json(self) -> str:
+        """
+        The sanitized JSON representation of the FAU metrics, serialized once.
+        """
+        return db.sanitize_json(self.fau_metrics)
 
     @staticmethod
     def init_table_query() -> str:
         """
         Returns the query to create the table in the database
         """
-        frv_table_query = """
-        CREATE TABLE IF NOT EXISTS fau_role_validation (
-            interview_name TEXT REFERENCES load_openface(interview_name),
-            frv_fau_metrics JSONB,
-            frv_matches_with_transcript BOOLEAN,
-            frv_timestamp TIMESTAMP,
-            PRIMARY KEY (interview_name)
-        )
-        """
-
-        return frv_table_query
+        return FauRoleValidation._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Returns the query to drop the table in the database
         """
-        frv_table_query = """
-        DROP TABLE IF EXISTS fau_role_validation
-        """
-
-        return frv_table_query
+        return FauRoleValidation._DROP_TABLE_QUERY
 
     def to_sql(self) -> str:
         """
@@ -95,7 +104,7 @@ class FauRoleValidation:
             str: Query to insert the object into the database
         """
 
-        fau_metrics = db.sanitize_json(self.fau_metrics)
+        fau_metrics = self.fau_metrics_json
 
         frv_insert_query = f"""
         INSERT INTO fau_role_validation (
@@ -107,7 +116,7 @@ class FauRoleValidation:
             '{self.interview_name}',
             '{fau_metrics}',
             {self.matches_with_transcript},
-            '{self.timestamp}'
+            '{self._timestamp_s}'
         )
         """
 
@@ -122,11 +131,6 @@ if __name__ == "__main__":
         "[red]This will delete all existing data in the 'fau_role_validation' table!"
     )
 
-    drop_queries = [FauRoleValidation.drop_table_query()]
-    create_queries = [FauRoleValidation.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[FauRoleValidation])
 
     console.log("'fau_role_validation' table initialized.")
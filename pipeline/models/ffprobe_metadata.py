@@ -3,22 +3,24 @@
 FfprobeMetadata Model
 """
 
+import os
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 import logging
 import math
@@ -106,6 +108,8 @@ class FfprobeMetadata:
         role (Optional[InterviewRole]): The role of the interviewee.
     """
 
+    __slots__ = ("source_path", "requested_by", "metadata", "timestamp", "role")
+
     def __init__(
         self,
         source_path: Path,
@@ -113,7 +117,7 @@ class FfprobeMetadata:
         metadata: Dict[str, Any],
         role: Optional[InterviewRole] = None,
     ):
-        self.source_path: Path = source_path
+        self.source_path: str = os.fspath(source_path)
         self.requested_by: str = requested_by
         self.metadata: Dict[str, Any] = metadata
         self.timestamp: datetime = datetime.now()
@@ -122,8 +126,7 @@ class FfprobeMetadata:
     def __str__(self):
         return f"FfprobeMetadata({self.source_path}, {self.metadata}, {self.timestamp})"
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
     def init_table_query() -> List[str]:
@@ -506,10 +509,5 @@ if __name__ == "__main__":
         "[red]This will delete all existing data in the 'ffprobe_metadata' table![/red]"
     )
 
-    drop_queries = FfprobeMetadata.drop_table_query()
-    create_queries = FfprobeMetadata.init_table_query()
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries)
+    db.init_tables(config_file=config_file, tables=[FfprobeMetadata])
     console.log("Done!")
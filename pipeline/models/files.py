@@ -5,6 +5,7 @@ File Model
 
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional, Tuple
 
 from pipeline.helpers import db
 from pipeline.helpers.hash import compute_hash
@@ -18,6 +19,52 @@ class File:
         file_path (Path): The path to the file.
     """
 
+    __slots__ = ("file_path", "file_name", "file_type", "file_size_mb", "m_time", "md5")
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE files (
+            file_name TEXT NOT NULL,
+            file_type TEXT NOT NULL,
+            file_size_mb FLOAT NOT NULL,
+            file_path TEXT PRIMARY KEY,
+            m_time TIMESTAMP NOT NULL,
+            md5 TEXT
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS files CASCADE;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO files (file_name, file_type, file_size_mb,
+            file_path, m_time, md5)
+        VALUES (%s, %s, %s,
+            %s, %s, %s)
+        ON CONFLICT (file_path) DO UPDATE SET
+            file_name = excluded.file_name,
+            file_type = excluded.file_type,
+            file_size_mb = excluded.file_size_mb,
+            m_time = excluded.m_time,
+            md5 = excluded.md5;
+        """
+    )
+
+    _BULK_INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO files (file_name, file_type, file_size_mb,
+            file_path, m_time, md5)
+        VALUES %s
+        ON CONFLICT (file_path) DO UPDATE SET
+            file_name = excluded.file_name,
+            file_type = excluded.file_type,
+            file_size_mb = excluded.file_size_mb,
+            m_time = excluded.m_time,
+            md5 = excluded.md5;
+        """
+    )
+
     def __init__(
         self,
         file_path: Path,
@@ -54,66 +101,69 @@ class File:
         return f"File({self.file_name}, {self.file_type}, {self.file_size_mb}, \
             {self.file_path}, {self.m_time}, {self.md5})"
 
-    def __repr__(self):
-        """
-        Return a string representation of the File object.
-        """
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'files' table.
         """
-        sql_query = """
-        CREATE TABLE files (
-            file_name TEXT NOT NULL,
-            file_type TEXT NOT NULL,
-            file_size_mb FLOAT NOT NULL,
-            file_path TEXT PRIMARY KEY,
-            m_time TIMESTAMP NOT NULL,
-            md5 TEXT
-        );
-        """
-
-        return sql_query
+        return File._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'files' table if it exists.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS files CASCADE;
+        return File._DROP_TABLE_QUERY
+
+    def to_sql(self) -> Tuple[str, tuple]:
         """
+        Return the SQL query and its parameters to insert the File object
+        into the 'files' table.
+        """
+        sql_query = File._INSERT_QUERY
 
-        return sql_query
+        params = (
+            self.file_name,
+            self.file_type,
+            self.file_size_mb,
+            str(self.file_path),
+            self.m_time,
+            self.md5,
+        )
 
-    def to_sql(self):
-        """
-        Return the SQL query to insert the File object into the 'files' table.
+        return sql_query, params
+
+    @staticmethod
+    def bulk_insert(
+        config_file: Path,
+        files: List["File"],
+        page_size: int = 1000,
+        conn: Optional[db.Connection] = None,
+    ) -> None:
         """
-        f_name = db.santize_string(self.file_name)
-        f_path = db.santize_string(str(self.file_path))
+        Insert (or update) many files into the 'files' table,
+        using one multi-row statement per page.
 
-        if self.md5 is None:
-            hash_val = "NULL"
-        else:
-            hash_val = self.md5
+        Note: A statement cannot update the same row twice, so duplicate
+        file paths are collapsed, keeping the last one.
 
-        sql_query = f"""
-        INSERT INTO files (file_name, file_type, file_size_mb,
-            file_path, m_time, md5)
-        VALUES ('{f_name}', '{self.file_type}', '{self.file_size_mb}',
-            '{f_path}', '{self.m_time}', '{hash_val}')
-        ON CONFLICT (file_path) DO UPDATE SET
-            file_name = excluded.file_name,
-            file_type = excluded.file_type,
-            file_size_mb = excluded.file_size_mb,
-            m_time = excluded.m_time,
-            md5 = excluded.md5;
+        Args:
+            config_file (Path): The path to the configuration file.
+            files (List[File]): The files to insert.
+            page_size (int, optional): The maximum number of rows per statement.
+            conn (Optional[db.Connection], optional): An open connection (see
+                `db.transaction`) to insert with, committed by its owner.
         """
+        sql_query = File._BULK_INSERT_QUERY
 
-        sql_query = db.handle_null(sql_query)
+        values = list({str(file.file_path): file.to_sql()[1] for file in files}.values())
 
-        return sql_query
+        db.execute_values(
+            config_file=config_file,
+            query=sql_query,
+            values=values,
+            page_size=page_size,
+            conn=conn,
+        )
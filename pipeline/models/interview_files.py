@@ -2,12 +2,14 @@
 InterviewFiles model
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 from pipeline.helpers import db
 
 
+@dataclass(slots=True, frozen=True)
 class InterviewFile:
     """
     Represents a file associated with an interview.
@@ -18,44 +20,63 @@ class InterviewFile:
         tags (str): The tags associated with the file.
     """
 
-    def __init__(self, interview_path: Path, interview_file: Path, tags: str):
-        self.interview_path = interview_path
-        self.interview_file = interview_file
-        self.tags = tags
+    interview_path: Path
+    interview_file: Path
+    tags: str
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS interview_files;
+        """
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS interview_files (
+            interview_path TEXT NOT NULL REFERENCES interviews (interview_path),
+            interview_file TEXT UNIQUE NOT NULL REFERENCES files (file_path),
+            interview_file_tags TEXT,
+            ignored BOOLEAN DEFAULT FALSE,
+            PRIMARY KEY (interview_path, interview_file)
+        );
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO interview_files (interview_path, interview_file,
+            interview_file_tags)
+        VALUES (%s, %s,
+            %s)
+        ON CONFLICT (interview_path, interview_file) DO
+            UPDATE SET interview_file_tags = excluded.interview_file_tags;
+        """
+    )
+
+    _BULK_INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO interview_files (interview_path, interview_file,
+            interview_file_tags)
+        VALUES %s
+        ON CONFLICT (interview_path, interview_file) DO
+            UPDATE SET interview_file_tags = excluded.interview_file_tags;
+        """
+    )
 
     def __str__(self):
         return f"InterviewFiles({self.interview_path}, {self.interview_file})"
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'interview_files' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS interview_files;
-        """
-
-        return sql_query
+        return InterviewFile._DROP_TABLE_QUERY
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'interview_files' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS interview_files (
-            interview_path TEXT NOT NULL REFERENCES interviews (interview_path),
-            interview_file TEXT UNIQUE NOT NULL REFERENCES files (file_path),
-            interview_file_tags TEXT,
-            ignored BOOLEAN DEFAULT FALSE,
-            PRIMARY KEY (interview_path, interview_file)
-        );
-        """
-
-        return sql_query
+        return InterviewFile._INIT_TABLE_QUERY
 
     @staticmethod
     def ignore_file(interview_file: Path) -> str:
@@ -76,23 +97,54 @@ class InterviewFile:
 
         return sql_query
 
-    def to_sql(self):
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert the InterviewFiles object into the 'interview_files' table.
+        Return the SQL query and its parameters to insert the InterviewFiles object
+        into the 'interview_files' table.
         """
-        i_path = db.santize_string(str(self.interview_path))
-        i_file = db.santize_string(str(self.interview_file))
+        sql_query = InterviewFile._INSERT_QUERY
 
-        sql_query = f"""
-        INSERT INTO interview_files (interview_path, interview_file,
-            interview_file_tags)
-        VALUES ('{i_path}', '{i_file}',
-            '{self.tags}')
-        ON CONFLICT (interview_path, interview_file) DO
-            UPDATE SET interview_file_tags = '{self.tags}';
+        params = (str(self.interview_path), str(self.interview_file), self.tags)
+
+        return sql_query, params
+
+    @staticmethod
+    def bulk_insert(
+        config_file: Path,
+        interview_files: List["InterviewFile"],
+        page_size: int = 1000,
+        conn: Optional[db.Connection] = None,
+    ) -> None:
         """
+        Insert (or update) many interview files into the 'interview_files' table,
+        using one multi-row statement per page.
 
-        return sql_query
+        Note: A statement cannot update the same row twice, so duplicate
+        (interview_path, interview_file) pairs are collapsed, keeping the last one.
+
+        Args:
+            config_file (Path): The path to the configuration file.
+            interview_files (List[InterviewFile]): The interview files to insert.
+            page_size (int, optional): The maximum number of rows per statement.
+            conn (Optional[db.Connection], optional): An open connection (see
+                `db.transaction`) to insert with, committed by its owner.
+        """
+        sql_query = InterviewFile._BULK_INSERT_QUERY
+
+        values = list(
+            {
+                params[:2]: params
+                for params in (i_file.to_sql()[1] for i_file in interview_files)
+            }.values()
+        )
+
+        db.execute_values(
+            config_file=config_file,
+            query=sql_query,
+            values=values,
+            page_size=page_size,
+            conn=conn,
+        )
 
     @staticmethod
     def get_interview_files_with_tag(config_file: Path, interview_name: str, tag: str) -> List[Path]:
@@ -6,19 +6,20 @@ InterviewRole Model
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 from enum import Enum
 from typing import List
@@ -108,10 +109,5 @@ if __name__ == "__main__":
         "[red]This will delete all existing data in the 'interview_roles' table![/red]"
     )
 
-    drop_queries = [InterviewRole.drop_table_query()]
-    create_queries = InterviewRole.init_table_query()
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries)
+    db.init_tables(config_file=config_file, tables=[InterviewRole])
     console.log("Done!")
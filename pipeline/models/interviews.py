@@ -4,7 +4,7 @@ Interview model
 
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from enum import Enum
 
 from pipeline.helpers import db
@@ -71,6 +71,64 @@ class Interview:
         study_id (str): The study ID.
     """
 
+    __slots__ = (
+        "interview_id",
+        "interview_name",
+        "interview_path",
+        "interview_type",
+        "interview_datetime",
+        "subject_id",
+        "study_id",
+    )
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS interviews (
+            interview_id SERIAL PRIMARY KEY,
+            interview_name TEXT NOT NULL,
+            interview_path TEXT NOT NULL UNIQUE,
+            interview_type TEXT NOT NULL REFERENCES interview_types (interview_type),
+            interview_date TIMESTAMP NOT NULL,
+            subject_id TEXT NOT NULL,
+            study_id TEXT NOT NULL,
+            FOREIGN KEY (subject_id, study_id) REFERENCES subjects (subject_id, study_id)
+        );
+        """
+
+    # Covering indexes for the lookups by interview name and by study.
+    # Not built CONCURRENTLY, since init_db runs inside a single transaction.
+    _INIT_INDEX_QUERIES = [
+        """
+        CREATE INDEX IF NOT EXISTS idx_interviews_interview_name
+        ON interviews (interview_name)
+        INCLUDE (interview_path, subject_id, study_id);
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_interviews_study_id
+        ON interviews (study_id)
+        INCLUDE (interview_name);
+        """,
+    ]
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS interviews;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO interviews (interview_name, interview_path, interview_type, interview_date, subject_id, study_id)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON CONFLICT (interview_path) DO NOTHING;
+        """
+    )
+
+    _BULK_INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO interviews (interview_name, interview_path, interview_type, interview_date, subject_id, study_id)
+        VALUES %s
+        ON CONFLICT (interview_path) DO NOTHING;
+        """
+    )
+
     def __init__(
         self,
         interview_name: str,
@@ -92,58 +150,69 @@ class Interview:
     def __str__(self):
         return f"Interview({self.subject_id}, {self.study_id}, {self.interview_name})"
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
-    def init_table_query() -> str:
-        """
-        Return the SQL query to create the 'interviews' table.
+    def init_table_query() -> List[str]:
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS interviews (
-            interview_id SERIAL PRIMARY KEY,
-            interview_name TEXT NOT NULL,
-            interview_path TEXT NOT NULL UNIQUE,
-            interview_type TEXT NOT NULL REFERENCES interview_types (interview_type),
-            interview_date TIMESTAMP NOT NULL,
-            subject_id TEXT NOT NULL,
-            study_id TEXT NOT NULL,
-            FOREIGN KEY (subject_id, study_id) REFERENCES subjects (subject_id, study_id)
-        );
+        Return the SQL queries to create the 'interviews' table, and its indexes.
         """
-
-        return sql_query
+        return [Interview._INIT_TABLE_QUERY] + Interview._INIT_INDEX_QUERIES
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'interviews' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS interviews;
-        """
+        return Interview._DROP_TABLE_QUERY
 
-        return sql_query
-
-    def to_sql(self):
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert the Interview object into the 'interviews' table.
+        Return the SQL query and its parameters to insert the Interview object
+        into the 'interviews' table.
         """
-        i_name = db.santize_string(self.interview_name)
-        i_path = db.santize_string(str(self.interview_path))
-        i_type = db.santize_string(self.interview_type.value)
-        i_date = db.santize_string(str(self.interview_datetime))
-        s_id = db.santize_string(self.subject_id)
-        st_id = db.santize_string(self.study_id)
+        sql_query = Interview._INSERT_QUERY
 
-        sql_query = f"""
-        INSERT INTO interviews (interview_name, interview_path, interview_type, interview_date, subject_id, study_id)
-        VALUES ('{i_name}', '{i_path}', '{i_type}', '{i_date}', '{s_id}', '{st_id}')
-        ON CONFLICT (interview_path) DO NOTHING;
+        params = (
+            self.interview_name,
+            str(self.interview_path),
+            self.interview_type.value,
+            self.interview_datetime,
+            self.subject_id,
+            self.study_id,
+        )
+
+        return sql_query, params
+
+    @staticmethod
+    def bulk_insert(
+        config_file: Path,
+        interviews: List["Interview"],
+        page_size: int = 1000,
+        conn: Optional[db.Connection] = None,
+    ) -> None:
         """
+        Insert many interviews into the 'interviews' table,
+        using one multi-row statement per page.
 
-        return sql_query
+        Args:
+            config_file (Path): The path to the configuration file.
+            interviews (List[Interview]): The interviews to insert.
+            page_size (int, optional): The maximum number of rows per statement.
+            conn (Optional[db.Connection], optional): An open connection (see
+                `db.transaction`) to insert with, committed by its owner.
+        """
+        sql_query = Interview._BULK_INSERT_QUERY
+
+        values = [interview.to_sql()[1] for interview in interviews]
+
+        db.execute_values(
+            config_file=config_file,
+            query=sql_query,
+            values=values,
+            page_size=page_size,
+            conn=conn,
+        )
 
     @staticmethod
     def get_interview_name(config_file: Path, interview_file: Path) -> Optional[str]:
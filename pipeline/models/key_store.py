@@ -4,21 +4,24 @@ KeyStore Model
 """
 
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
 
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 
 from pipeline.helpers import utils, db
@@ -26,6 +29,7 @@ from pipeline.helpers import utils, db
 console = utils.get_console()
 
 
+@dataclass(slots=True, frozen=True)
 class KeyStore:
     """
     Represents a key-value pair.
@@ -35,52 +39,55 @@ class KeyStore:
         value (str): The value of the key.
     """
 
-    def __init__(self, name: str, value: str) -> None:
-        self.name = name
-        self.value = value
+    name: str
+    value: str
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS key_store (
+            name TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS key_store;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO key_store (name, value)
+        VALUES (%s, %s)
+        ON CONFLICT (name) DO UPDATE SET value = excluded.value;
+        """
+    )
 
     def __str__(self) -> str:
         return f"KeyStore({self.name}, {self.value})"
 
-    def __repr__(self) -> str:
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'key_store' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS key_store (
-            name TEXT PRIMARY KEY,
-            value TEXT NOT NULL
-        );
-        """
-
-        return sql_query
+        return KeyStore._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'key_store' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS key_store;
-        """
-
-        return sql_query
+        return KeyStore._DROP_TABLE_QUERY
 
-    def to_sql(self) -> str:
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert the KeyStore object into the 'key_store' table.
-        """
-        sql_query = f"""
-        INSERT INTO key_store (name, value)
-        VALUES ('{self.name}', '{self.value}')
-        ON CONFLICT (name) DO UPDATE SET value = '{self.value}';
+        Return the SQL query and its parameters to insert the KeyStore object
+        into the 'key_store' table.
         """
+        sql_query = KeyStore._INSERT_QUERY
 
-        return sql_query
+        return sql_query, (self.name, self.value)
 
 
 if __name__ == "__main__":
@@ -89,12 +96,6 @@ if __name__ == "__main__":
     console.log("Initializing 'key_store' table...")
     console.log("[red]Dropping 'key_store' table if it exists...")
 
-    drop_queries = [KeyStore.drop_table_query()]
-
-    create_queries = [KeyStore.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries)
+    db.init_tables(config_file=config_file, tables=[KeyStore])
 
     console.log("[green]Done!")
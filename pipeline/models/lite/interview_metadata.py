@@ -102,11 +102,7 @@ class InterviewMetadata:
         ]
         """
 
-    def __repr__(self) -> str:
-        """
-        Returns a string representation of the interview metadata object.
-        """
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
     def get(config_file: Path, interview_name: str) -> "InterviewMetadata":
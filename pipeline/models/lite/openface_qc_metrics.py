@@ -47,8 +47,7 @@ class OpenFaceQcMetrics:
         ]
         """
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
     def get(
@@ -45,8 +45,7 @@ class VideoMetadata:
         ]
         """
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
     def get(
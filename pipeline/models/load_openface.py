@@ -6,22 +6,23 @@ LoadOpenface Model
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
-
-
-from typing import Optional
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
+
+
+from typing import Optional, Tuple
 from datetime import datetime
 
 from pipeline.helpers import utils, db
@@ -45,6 +46,50 @@ class LoadOpenface:
         lof_timestamp (datetime): The timestamp of the load openface process.
     """
 
+    __slots__ = (
+        "interview_name",
+        "subject_id",
+        "study_id",
+        "subject_of_processed_path",
+        "interviewer_of_processed_path",
+        "lof_notes",
+        "lof_process_time",
+        "lof_report_generation_possible",
+        "lof_timestamp",
+        "_lof_timestamp_s",
+    )
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS load_openface (
+            interview_name TEXT NOT NULL,
+            subject_id TEXT NOT NULL,
+            study_id TEXT NOT NULL,
+            subject_of_processed_path TEXT REFERENCES openface (of_processed_path),
+            interviewer_of_processed_path TEXT,
+            lof_notes TEXT,
+            lof_process_time REAL,
+            lof_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            lof_report_generation_possible BOOLEAN NOT NULL DEFAULT FALSE,
+            PRIMARY KEY (interview_name),
+            FOREIGN KEY (subject_id, study_id) REFERENCES subjects (subject_id, study_id)
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS load_openface;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO load_openface (interview_name, subject_id, study_id,
+            subject_of_processed_path, interviewer_of_processed_path, lof_notes,
+            lof_process_time, lof_report_generation_possible, lof_timestamp)
+        VALUES (%s, %s, %s,
+            %s, %s, %s,
+            %s, %s, %s);
+        """
+    )
+
     def __init__(
         self,
         interview_name: str,
@@ -65,6 +110,7 @@ class LoadOpenface:
         self.lof_process_time: Optional[float] = lof_process_time
         self.lof_report_generation_possible = lof_report_generation_possible
         self.lof_timestamp = datetime.now()
+        self._lof_timestamp_s = self.lof_timestamp.isoformat(sep=" ")
 
     def __repr__(self):
         return f"LoadOpenface({self.interview_name}, {self.subject_id}, \
@@ -72,40 +118,21 @@ class LoadOpenface:
             {self.interviewer_of_processed_path}, {self.lof_notes}, {self.lof_process_time}, \
             {self.lof_report_generation_possible}, {self.lof_timestamp})"
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'openface' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS load_openface (
-            interview_name TEXT NOT NULL,
-            subject_id TEXT NOT NULL,
-            study_id TEXT NOT NULL,
-            subject_of_processed_path TEXT REFERENCES openface (of_processed_path),
-            interviewer_of_processed_path TEXT,
-            lof_notes TEXT,
-            lof_process_time REAL,
-            lof_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            lof_report_generation_possible BOOLEAN NOT NULL DEFAULT FALSE,
-            PRIMARY KEY (interview_name),
-            FOREIGN KEY (subject_id, study_id) REFERENCES subjects (subject_id, study_id)
-        );
-        """
-        return sql_query
+        return LoadOpenface._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'openface' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS load_openface;
-        """
-        return sql_query
+        return LoadOpenface._DROP_TABLE_QUERY
 
     @staticmethod
     def drop_row_query(interview_name: str) -> str:
@@ -123,41 +150,26 @@ class LoadOpenface:
         """
         return sql_query
 
-    def to_sql(self) -> str:
-        """
-        Return the SQL query to insert the object into the 'load_openface' table.
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-
-        if self.lof_process_time is None:
-            process_time = "NULL"
-        else:
-            process_time = str(self.lof_process_time)
-
-        if self.interviewer_of_processed_path is None:
-            interviewer_of_processed_path = "NULL"
-        else:
-            interviewer_of_processed_path = db.santize_string(
-                self.interviewer_of_processed_path
-            )
-
-        if self.lof_notes is None:
-            notes = "NULL"
-        else:
-            notes = db.santize_string(self.lof_notes)
-
-        sql_query = f"""
-        INSERT INTO load_openface (interview_name, subject_id, study_id, \
-            subject_of_processed_path, interviewer_of_processed_path, lof_notes, \
-            lof_process_time, lof_report_generation_possible, lof_timestamp) \
-        VALUES ('{self.interview_name}', '{self.subject_id}', '{self.study_id}', \
-            '{self.subject_of_processed_path}','{interviewer_of_processed_path}', '{notes}', \
-            {process_time}, {self.lof_report_generation_possible}, '{self.lof_timestamp}'
-        );
+        Return the SQL query and its parameters to insert the object
+        into the 'load_openface' table.
         """
+        sql_query = LoadOpenface._INSERT_QUERY
 
-        sql_query = db.handle_null(sql_query)
+        params = (
+            self.interview_name,
+            self.subject_id,
+            self.study_id,
+            self.subject_of_processed_path,
+            self.interviewer_of_processed_path,
+            self.lof_notes,
+            self.lof_process_time,
+            self.lof_report_generation_possible,
+            self._lof_timestamp_s,
+        )
 
-        return sql_query
+        return sql_query, params
 
 
 if __name__ == "__main__":
@@ -166,11 +178,6 @@ if __name__ == "__main__":
     console.log("Initializing 'load_openface' table...")
     console.log("[red]This will delete all existing data in the 'load_openface' table!")
 
-    drop_queries = [LoadOpenface.drop_table_query()]
-    create_queries = [LoadOpenface.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[LoadOpenface])
 
     console.log("'load_openface' table initialized.")
@@ -4,21 +4,24 @@ Log Model
 """
 
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
 
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 
 from pipeline.helpers import utils, db
@@ -26,6 +29,7 @@ from pipeline.helpers import utils, db
 console = utils.get_console()
 
 
+@dataclass(slots=True, frozen=True)
 class Log:
     """
     Represents a row in the 'logs' table.
@@ -35,22 +39,10 @@ class Log:
         message (str): The log message.
     """
 
-    def __init__(self, module_name: str, message: str) -> None:
-        self.module_name = module_name
-        self.message = message
-
-    def __str__(self) -> str:
-        return f"Log({self.module_name}, {self.message})"
-
-    def __repr__(self) -> str:
-        return self.__str__()
+    module_name: str
+    message: str
 
-    @staticmethod
-    def init_table_query() -> str:
-        """
-        Return the SQL query to create the 'logs' table.
-        """
-        sql_query = """
+    _INIT_TABLE_QUERY = """
         CREATE TABLE IF NOT EXISTS logs (
             log_id SERIAL PRIMARY KEY,
             log_module TEXT NOT NULL,
@@ -59,32 +51,42 @@ class Log:
         );
         """
 
-        return sql_query
-
-    @staticmethod
-    def drop_table_query() -> str:
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS logs;
         """
-        Return the SQL query to drop the 'logs' table.
+
+    _INSERT_QUERY = db.compact_query(
         """
-        sql_query = """
-        DROP TABLE IF EXISTS logs;
+        INSERT INTO logs (log_module, log_message)
+        VALUES (%s, %s);
         """
+    )
+
+    def __str__(self) -> str:
+        return f"Log({self.module_name}, {self.message})"
 
-        return sql_query
+    __repr__ = __str__
 
-    def to_sql(self):
+    @staticmethod
+    def init_table_query() -> str:
         """
-        Return the SQL query to insert the Log object into the 'logs' table.
+        Return the SQL query to create the 'logs' table.
         """
-        module_name = db.santize_string(self.module_name)
-        message = db.santize_string(self.message)
+        return Log._INIT_TABLE_QUERY
 
-        sql_query = f"""
-        INSERT INTO logs (log_module, log_message)
-        VALUES ('{module_name}', '{message}');
+    @staticmethod
+    def drop_table_query() -> str:
+        """
+        Return the SQL query to drop the 'logs' table.
         """
+        return Log._DROP_TABLE_QUERY
 
-        return sql_query
+    def to_sql(self) -> Tuple[str, tuple]:
+        """
+        Return the SQL query and its parameters to insert the Log object
+        into the 'logs' table.
+        """
+        return Log._INSERT_QUERY, (self.module_name, self.message)
 
 
 if __name__ == "__main__":
@@ -93,11 +95,6 @@ if __name__ == "__main__":
     console.log("Initializing 'logs' table...")
     console.log("[red]This will delete all existing data in the 'logs' table![/red]")
 
-    drop_queries = [Log.drop_table_query()]
-    create_queries = [Log.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries)
+    db.init_tables(config_file=config_file, tables=[Log])
 
     console.log("[green]Done!")
@@ -6,22 +6,24 @@ OpenfaceQC Model
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
 
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 
 from datetime import datetime
+from functools import cached_property
 
 from pipeline.helpers import utils, db
 
@@ -39,10 +41,23 @@ class Metrics:
             generated.
     """
 
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS metrics (
+            interview_name TEXT PRIMARY KEY,
+            metrics JSONB,
+            metrics_timestamp TIMESTAMP
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS metrics;
+        """
+
     def __init__(self, interview_name: str, metrics: dict):
         self.interview_name = interview_name
         self.metrics = metrics
         self.metrics_timestamp = datetime.now()
+        self._metrics_timestamp_s = self.metrics_timestamp.isoformat(sep=" ")
 
     def __repr__(self):
         return f"""Metrics(
@@ -52,32 +67,28 @@ class Metrics:
 )
 """
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
+
+    @cached_property
+    def metrics_json(self) -> str:
+        """
+        The sanitized JSON representation of the metrics, serialized once.
+        """
+        return db.sanitize_json(self.metrics)
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'openface' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS metrics (
-            interview_name TEXT PRIMARY KEY,
-            metrics JSONB,
-            metrics_timestamp TIMESTAMP
-        );
-        """
-        return sql_query
+        return Metrics._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'openface' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS metrics;
-        """
-        return sql_query
+        return Metrics._DROP_TABLE_QUERY
 
     @staticmethod
     def drop_row_query(interview_name: str) -> str:
@@ -101,18 +112,18 @@ class Metrics:
         Return the SQL query to insert the object into the 'openface' table.
         """
 
-        metrics_json = db.sanitize_json(self.metrics)
+        metrics_json = self.metrics_json
 
         sql_query = f"""
         INSERT INTO metrics
         (interview_name, metrics, metrics_timestamp)
         VALUES
-        ('{self.interview_name}', '{metrics_json}', '{self.metrics_timestamp}')
+        ('{self.interview_name}', '{metrics_json}', '{self._metrics_timestamp_s}')
         ON CONFLICT (interview_name)
         DO UPDATE
         SET
-            metrics = '{metrics_json}',
-            metrics_timestamp = '{self.metrics_timestamp}';
+            metrics = excluded.metrics,
+            metrics_timestamp = excluded.metrics_timestamp;
         """
 
         return sql_query
@@ -124,11 +135,6 @@ if __name__ == "__main__":
     console.log("Initializing 'metrics' table...")
     console.log("[red]This will delete all existing data in the 'metrics' table!")
 
-    drop_queries = [Metrics.drop_table_query()]
-    create_queries = [Metrics.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[Metrics])
 
     console.log("'metrics' table initialized.")
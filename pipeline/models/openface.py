@@ -3,25 +3,27 @@
 Openface Model
 """
 
+import os
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
-
-
-from typing import Optional
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
+
+
+from typing import Optional, Tuple
 from datetime import datetime
 
 from pipeline.helpers import utils, db
@@ -43,6 +45,49 @@ class Openface:
         of_timestamp (datetime): The timestamp of the Openface run.
     """
 
+    __slots__ = (
+        "vs_path",
+        "ir_role",
+        "_ir_role_s",
+        "video_path",
+        "of_processed_path",
+        "of_process_time",
+        "of_overlay_provess_time",
+        "of_timestamp",
+        "_of_timestamp_s",
+    )
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS openface (
+            vs_path TEXT NOT NULL PRIMARY KEY REFERENCES video_streams (vs_path),
+            ir_role TEXT NOT NULL,
+            video_path TEXT NOT NULL,
+            of_processed_path TEXT NOT NULL UNIQUE,
+            of_process_time REAL,
+            of_overlay_provess_time REAL,
+            of_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (video_path, ir_role) REFERENCES video_streams (video_path, ir_role)
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS openface;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO openface (
+            vs_path,
+            ir_role,
+            video_path,
+            of_processed_path,
+            of_process_time,
+            of_overlay_provess_time,
+            of_timestamp)
+        VALUES (%s, %s, %s, %s, %s, %s, %s);
+        """
+    )
+
     def __init__(
         self,
         vs_path: Path,
@@ -52,48 +97,36 @@ class Openface:
         of_process_time: Optional[float] = None,
         of_overlay_provess_time: Optional[float] = None,
     ):
-        self.vs_path = vs_path
+        self.vs_path = os.fspath(vs_path)
         self.ir_role = ir_role
-        self.video_path = video_path
-        self.of_processed_path = of_processed_path
+        self._ir_role_s = (
+            ir_role.value if isinstance(ir_role, InterviewRole) else ir_role
+        )
+        self.video_path = os.fspath(video_path)
+        self.of_processed_path = os.fspath(of_processed_path)
         self.of_process_time: Optional[float] = of_process_time
         self.of_overlay_provess_time: Optional[float] = of_overlay_provess_time
         self.of_timestamp = datetime.now()
+        self._of_timestamp_s = self.of_timestamp.isoformat(sep=" ")
 
     def __repr__(self):
         return f"Openface({self.vs_path}, {self.ir_role}, {self.of_processed_path})"
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'openface' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS openface (
-            vs_path TEXT NOT NULL PRIMARY KEY REFERENCES video_streams (vs_path),
-            ir_role TEXT NOT NULL,
-            video_path TEXT NOT NULL,
-            of_processed_path TEXT NOT NULL UNIQUE,
-            of_process_time REAL,
-            of_overlay_provess_time REAL,
-            of_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (video_path, ir_role) REFERENCES video_streams (video_path, ir_role)
-        );
-        """
-        return sql_query
+        return Openface._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'openface' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS openface;
-        """
-        return sql_query
+        return Openface._DROP_TABLE_QUERY
 
     @staticmethod
     def drop_row_query(of_processed_path: Path) -> str:
@@ -146,42 +179,24 @@ class Openface:
         """
         return sql_query
 
-    def to_sql(self) -> str:
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert the object into the 'openface' table.
+        Return the SQL query and its parameters to insert the object
+        into the 'openface' table.
         """
+        sql_query = Openface._INSERT_QUERY
 
-        if self.of_process_time is None:
-            process_time = "NULL"
-        else:
-            process_time = str(self.of_process_time)
-
-        if self.of_overlay_provess_time is None:
-            overlay_process_time = "NULL"
-        else:
-            overlay_process_time = str(self.of_overlay_provess_time)
+        params = (
+            self.vs_path,
+            self._ir_role_s,
+            self.video_path,
+            self.of_processed_path,
+            self.of_process_time,
+            self.of_overlay_provess_time,
+            self._of_timestamp_s,
+        )
 
-        sql_query = f"""
-        INSERT INTO openface (
-            vs_path,
-            ir_role,
-            video_path,
-            of_processed_path,
-            of_process_time,
-            of_overlay_provess_time,
-            of_timestamp)
-        VALUES (
-            '{self.vs_path}',
-            '{self.ir_role.value}',
-            '{self.video_path}',
-            '{self.of_processed_path}',
-            {process_time},
-            {overlay_process_time},
-            '{self.of_timestamp}'
-        );
-        """
-
-        return sql_query
+        return sql_query, params
 
 
 if __name__ == "__main__":
@@ -190,11 +205,6 @@ if __name__ == "__main__":
     console.log("Initializing 'openface' table...")
     console.log("[red]This will delete all existing data in the 'openface' table!")
 
-    drop_queries = [Openface.drop_table_query()]
-    create_queries = [Openface.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[Openface])
 
     console.log("'openface' table initialized.")
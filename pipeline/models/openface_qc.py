@@ -3,22 +3,24 @@
 OpenfaceQC Model
 """
 
+import os
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
 
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 
 from typing import Optional
@@ -54,6 +56,41 @@ class OpenfaceQC:
         ofqc_timestamp (datetime): The timestamp of the OpenFace quality check.
     """
 
+    __slots__ = (
+        "of_processed_path",
+        "faces_count",
+        "frames_count",
+        "sucessful_frames_count",
+        "sucessful_frames_percentage",
+        "successful_frames_confidence_mean",
+        "successful_frames_confidence_std",
+        "successful_frames_confidence_median",
+        "passed",
+        "ofqc_process_time",
+        "ofqc_timestamp",
+        "_ofqc_timestamp_s",
+    )
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS openface_qc (
+            of_processed_path TEXT NOT NULL PRIMARY KEY REFERENCES openface (of_processed_path),
+            faces_count INTEGER NOT NULL,
+            frames_count INTEGER NOT NULL,
+            sucessful_frames_count INTEGER NOT NULL,
+            sucessful_frames_percentage REAL NOT NULL,
+            successful_frames_confidence_mean REAL,
+            successful_frames_confidence_std REAL,
+            successful_frames_confidence_median REAL,
+            passed BOOLEAN NOT NULL,
+            ofqc_process_time REAL,
+            ofqc_timestamp TIMESTAMP NOT NULL
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS openface_qc;
+        """
+
     def __init__(
         self,
         of_processed_path: Path,
@@ -67,7 +104,7 @@ class OpenfaceQC:
         passed: bool,
         ofqc_process_time: Optional[float] = None,
     ):
-        self.of_processed_path = of_processed_path
+        self.of_processed_path = os.fspath(of_processed_path)
         self.faces_count = faces_count
         self.frames_count = frames_count
         self.sucessful_frames_count = sucessful_frames_count
@@ -78,44 +115,26 @@ class OpenfaceQC:
         self.passed = passed
         self.ofqc_process_time: Optional[float] = ofqc_process_time
         self.ofqc_timestamp = datetime.now()
+        self._ofqc_timestamp_s = self.ofqc_timestamp.isoformat(sep=" ")
 
     def __repr__(self):
         return f"OpenfaceQC({self.of_processed_path}, {self.passed})"
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'openface' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS openface_qc (
-            of_processed_path TEXT NOT NULL PRIMARY KEY REFERENCES openface (of_processed_path),
-            faces_count INTEGER NOT NULL,
-            frames_count INTEGER NOT NULL,
-            sucessful_frames_count INTEGER NOT NULL,
-            sucessful_frames_percentage REAL NOT NULL,
-            successful_frames_confidence_mean REAL,
-            successful_frames_confidence_std REAL,
-            successful_frames_confidence_median REAL,
-            passed BOOLEAN NOT NULL,
-            ofqc_process_time REAL,
-            ofqc_timestamp TIMESTAMP NOT NULL
-        );
-        """
-        return sql_query
+        return OpenfaceQC._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'openface' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS openface_qc;
-        """
-        return sql_query
+        return OpenfaceQC._DROP_TABLE_QUERY
 
     @staticmethod
     def drop_row_query(of_processed_path: Path) -> str:
@@ -183,7 +202,7 @@ class OpenfaceQC:
             {successful_frames_confidence_median},
             {self.passed},
             {process_time},
-            '{self.ofqc_timestamp}'
+            '{self._ofqc_timestamp_s}'
         );
         """
 
@@ -196,11 +215,6 @@ if __name__ == "__main__":
     console.log("Initializing 'openface_qc' table...")
     console.log("[red]This will delete all existing data in the 'openface_qc' table!")
 
-    drop_queries = [OpenfaceQC.drop_table_query()]
-    create_queries = [OpenfaceQC.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[OpenfaceQC])
 
     console.log("'openface_qc' table initialized.")
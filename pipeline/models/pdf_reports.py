@@ -3,26 +3,28 @@
 PdfReport Model
 """
 
+import os
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
 
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
 
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from pipeline.helpers import utils, db
 
@@ -41,6 +43,38 @@ class PdfReport:
         pr_timestamp (datetime): The timestamp of the report generation.
     """
 
+    __slots__ = (
+        "interview_name",
+        "pr_version",
+        "pr_path",
+        "pr_generation_time",
+        "pr_timestamp",
+    )
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS pdf_reports (
+            interview_name TEXT NOT NULL REFERENCES load_openface(interview_name),
+            pr_version TEXT NOT NULL,
+            pr_path TEXT NOT NULL,
+            pr_generation_time REAL NOT NULL,
+            pr_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (interview_name, pr_version)
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS pdf_reports;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO pdf_reports (interview_name, pr_version,
+            pr_path, pr_generation_time)
+        VALUES (%s, %s,
+            %s, %s);
+        """
+    )
+
     def __init__(
         self,
         interview_name: str,
@@ -51,7 +85,7 @@ class PdfReport:
     ):
         self.interview_name = interview_name
         self.pr_version = pr_version
-        self.pr_path = pr_path
+        self.pr_path = os.fspath(pr_path)
         self.pr_generation_time = pr_generation_time
         self.pr_timestamp = pr_timestamp
 
@@ -65,35 +99,21 @@ class PdfReport:
 )
 """
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'pdf_reports' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS pdf_reports (
-            interview_name TEXT NOT NULL REFERENCES load_openface(interview_name),
-            pr_version TEXT NOT NULL,
-            pr_path TEXT NOT NULL,
-            pr_generation_time REAL NOT NULL,
-            pr_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (interview_name, pr_version)
-        );
-        """
-        return sql_query
+        return PdfReport._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'pdf_reports' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS pdf_reports;
-        """
-        return sql_query
+        return PdfReport._DROP_TABLE_QUERY
 
     @staticmethod
     def drop_row_query(interview_name: str, pr_version: str) -> str:
@@ -110,23 +130,26 @@ class PdfReport:
         """
         return sql_query
 
-    def to_sql(self) -> str:
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert the object into the 'pdf_reports' table.
+        Return the SQL query and its parameters to insert the object
+        into the 'pdf_reports' table.
         """
         if self.pr_generation_time is None:
-            self.pr_generation_time = 0.0
+            pr_generation_time = 0.0
+        else:
+            pr_generation_time = self.pr_generation_time
 
-        sql_query = f"""
-        INSERT INTO pdf_reports (interview_name, pr_version,
-            pr_path, pr_generation_time)
-        VALUES ('{self.interview_name}', '{self.pr_version}',
-            '{self.pr_path}', {self.pr_generation_time});
-        """
+        sql_query = PdfReport._INSERT_QUERY
 
-        sql_query = db.handle_null(sql_query)
+        params = (
+            self.interview_name,
+            self.pr_version,
+            self.pr_path,
+            pr_generation_time,
+        )
 
-        return sql_query
+        return sql_query, params
 
 
 if __name__ == "__main__":
@@ -135,11 +158,6 @@ if __name__ == "__main__":
     console.log("Initializing 'pdf_reports' table...")
     console.log("[red]This will delete all existing data in the 'pdf_reports' table!")
 
-    drop_queries = [PdfReport.drop_table_query()]
-    create_queries = [PdfReport.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[PdfReport])
 
     console.log("'pdf_reports' table initialized.")
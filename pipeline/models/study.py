@@ -2,9 +2,13 @@
 Study Model
 """
 
+from dataclasses import dataclass
+from typing import Tuple
+
 from pipeline.helpers import db
 
 
+@dataclass(slots=True, frozen=True)
 class Study:
     """
     Represents a study.
@@ -13,42 +17,49 @@ class Study:
         study_id (str): The study ID.
     """
 
-    def __init__(self, study_id: str):
-        self.study_id = study_id
+    study_id: str
+
+    _INIT_TABLE_QUERY = """
+            CREATE TABLE IF NOT EXISTS study (
+                study_id TEXT PRIMARY KEY
+            );
+        """
+
+    _DROP_TABLE_QUERY = """
+            DROP TABLE IF EXISTS study;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+            INSERT INTO study (study_id)
+            VALUES (%s) ON CONFLICT DO NOTHING;
+        """
+    )
 
     def __str__(self):
         return f"Study({self.study_id})"
 
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'study' table.
         """
-        return """
-            CREATE TABLE IF NOT EXISTS study (
-                study_id TEXT PRIMARY KEY
-            );
-        """
+        return Study._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'study' table.
         """
-        return """
-            DROP TABLE IF EXISTS study;
-        """
+        return Study._DROP_TABLE_QUERY
 
-    def to_sql(self):
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert the object into the 'study' table.
+        Return the SQL query and its parameters to insert the object
+        into the 'study' table.
         """
-        study_id = db.santize_string(self.study_id)
+        sql_query = Study._INSERT_QUERY
 
-        return f"""
-            INSERT INTO study (study_id)
-            VALUES ('{study_id}') ON CONFLICT DO NOTHING;
-        """
+        return sql_query, (self.study_id,)
@@ -2,11 +2,15 @@
 Subject Model
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
+from typing import List, Tuple
 
 from pipeline.helpers import db
 
 
+@dataclass(slots=True, frozen=True, eq=True, unsafe_hash=False)
 class Subject:
     """
     Represents a subject / study participant.
@@ -16,36 +20,17 @@ class Subject:
         subject_id (str): The subject ID.
         is_active (bool): Whether or not the subject is active.
         consent_date (datetime): The date the subject consented to the study.
-        optional_notes (dict): Optional notes about the subject.
+        optional_notes (dict): Optional notes about the subject. Compared, but
+            not hashed (a dict is unhashable), so subjects can be used in sets.
     """
 
-    def __init__(
-        self,
-        study_id: str,
-        subject_id: str,
-        is_active: bool,
-        consent_date: datetime,
-        optional_notes: dict,
-    ):
-        self.study_id = study_id
-        self.subject_id = subject_id
-        self.is_active = is_active
-        self.consent_date = consent_date
-        self.optional_notes = optional_notes
+    study_id: str
+    subject_id: str
+    is_active: bool
+    consent_date: datetime
+    optional_notes: dict = field(hash=False)
 
-    def __str__(self):
-        return f"Subject({self.study_id}, {self.subject_id}, {self.is_active}, \
-            {self.consent_date}, {self.optional_notes})"
-
-    def __repr__(self):
-        return self.__str__()
-
-    @staticmethod
-    def init_table_query() -> str:
-        """
-        Return the SQL query to create the 'subjects' table.
-        """
-        sql_query = """
+    _INIT_TABLE_QUERY = """
         CREATE TABLE subjects (
             study_id TEXT NOT NULL REFERENCES study (study_id),
             subject_id TEXT NOT NULL,
@@ -56,34 +41,101 @@ class Subject:
         );
         """
 
-        return sql_query
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS subjects;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO subjects (study_id, subject_id, is_active, consent_date, optional_notes)
+        VALUES (%s, %s, %s, %s, %s)
+        ON CONFLICT(study_id, subject_id) DO UPDATE SET
+            is_active = excluded.is_active,
+            consent_date = excluded.consent_date,
+            optional_notes = excluded.optional_notes;
+        """
+    )
+
+    _BULK_INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO subjects (study_id, subject_id, is_active, consent_date, optional_notes)
+        VALUES %s
+        ON CONFLICT(study_id, subject_id) DO UPDATE SET
+            is_active = excluded.is_active,
+            consent_date = excluded.consent_date,
+            optional_notes = excluded.optional_notes;
+        """
+    )
+
+    def __str__(self):
+        return f"Subject({self.study_id}, {self.subject_id}, {self.is_active}, \
+            {self.consent_date}, {self.optional_notes})"
+
+    __repr__ = __str__
+
+    @staticmethod
+    def init_table_query() -> str:
+        """
+        Return the SQL query to create the 'subjects' table.
+        """
+        return Subject._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'subjects' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS subjects;
-        """
-
-        return sql_query
+        return Subject._DROP_TABLE_QUERY
 
-    def to_sql(self) -> str:
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert the subject into the 'subjects' table.
+        Return the SQL query and its parameters to insert the subject
+        into the 'subjects' table.
         """
 
         consent_date = self.consent_date.strftime("%Y-%m-%d")
-        optional_notes = db.sanitize_json(self.optional_notes)
+        optional_notes = db.dump_json(self.optional_notes)
 
-        sql_query = f"""
-        INSERT INTO subjects (study_id, subject_id, is_active, consent_date, optional_notes)
-        VALUES ('{self.study_id}', '{self.subject_id}', {self.is_active}, '{consent_date}', '{optional_notes}')
-        ON CONFLICT(study_id, subject_id) DO UPDATE SET
-            is_active = excluded.is_active,
-            consent_date = excluded.consent_date,
-            optional_notes = excluded.optional_notes;
+        sql_query = Subject._INSERT_QUERY
+
+        params = (
+            self.study_id,
+            self.subject_id,
+            self.is_active,
+            consent_date,
+            optional_notes,
+        )
+
+        return sql_query, params
+
+    @staticmethod
+    def bulk_insert(
+        config_file: Path, subjects: List["Subject"], page_size: int = 1000
+    ) -> None:
         """
+        Insert (or update) many subjects into the 'subjects' table,
+        using one multi-row statement per page.
+
+        Note: A statement cannot update the same row twice, so duplicate
+        (study_id, subject_id) pairs are collapsed, keeping the last one.
 
-        return sql_query
+        Args:
+            config_file (Path): The path to the configuration file.
+            subjects (List[Subject]): The subjects to insert.
+            page_size (int, optional): The maximum number of rows per statement.
+        """
+        sql_query = Subject._BULK_INSERT_QUERY
+
+        values = list(
+            {
+                params[:2]: params
+                for params in (subject.to_sql()[1] for subject in subjects)
+            }.values()
+        )
+
+        db.execute_values(
+            config_file=config_file,
+            query=sql_query,
+            values=values,
+            page_size=page_size,
+        )
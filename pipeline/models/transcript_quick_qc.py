@@ -3,24 +3,26 @@
 TranscriptQuickQc Model
 """
 
+import os
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
-
-from typing import Optional, Dict, Any
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
+
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from pipeline.helpers import db, utils
@@ -38,15 +40,49 @@ class TranscriptQuickQc:
         process_time (Optional[float]): The time it took to process the transcript.
     """
 
+    __slots__ = (
+        "transcript_path",
+        "speaker_metrics",
+        "turn_data",
+        "process_time",
+        "timestamp",
+    )
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS transcript_quick_qc (
+            transcript_path TEXT NOT NULL REFERENCES interview_files (interview_file),
+            speaker_metrics JSONB NOT NULL,
+            turn_data JSONB NOT NULL,
+            process_time FLOAT,
+            tqc_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (transcript_path)
+        )
+        """
+
+    _DROP_TABLE_QUERY = "DROP TABLE IF EXISTS transcript_quick_qc"
+
+    # 'tqc_timestamp' falls back to the server's clock when unset
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO transcript_quick_qc (
+            transcript_path, speaker_metrics, turn_data,
+            process_time, tqc_timestamp
+        ) VALUES (
+            %s, %s, %s,
+            %s, COALESCE(%s, CURRENT_TIMESTAMP)
+        )
+        """
+    )
+
     def __init__(
         self,
         transcript_path: Path,
         speaker_metrics: Dict[str, Dict[str, Any]],
         turn_data: Dict[int, Dict[str, str]],
         process_time: Optional[float] = None,
-        timestamp: datetime = datetime.now()
+        timestamp: Optional[datetime] = None,
     ):
-        self.transcript_path = transcript_path
+        self.transcript_path = os.fspath(transcript_path)
         self.speaker_metrics = speaker_metrics
         self.turn_data = turn_data
         self.process_time = process_time
@@ -55,63 +91,40 @@ class TranscriptQuickQc:
     def __repr__(self):
         return f"TranscriptQuickQc({self.transcript_path}, {self.speaker_metrics})"
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Returns the query to initialize the table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS transcript_quick_qc (
-            transcript_path TEXT NOT NULL REFERENCES interview_files (interview_file),
-            speaker_metrics JSONB NOT NULL,
-            turn_data JSONB NOT NULL,
-            process_time FLOAT,
-            tqc_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (transcript_path)
-        )
-        """
-
-        return sql_query
+        return TranscriptQuickQc._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Returns the query to drop the table.
         """
-        sql_query = "DROP TABLE IF EXISTS transcript_quick_qc"
-        return sql_query
+        return TranscriptQuickQc._DROP_TABLE_QUERY
 
-    def insert_query(self) -> str:
+    def insert_query(self) -> Tuple[str, tuple]:
         """
         Returns the query to insert the object into the table.
 
         Returns:
-            str: The SQL insert query.
+            Tuple[str, tuple]: The SQL insert query and its parameters.
         """
-        speaker_metrics = db.sanitize_json(self.speaker_metrics)
-        turn_data = db.sanitize_json(self.turn_data)  # type: ignore
-
-        if self.process_time is None:
-            process_time = "NULL"
-        else:
-            process_time = self.process_time
-
-        sql_query = f"""
-        INSERT INTO transcript_quick_qc (
-            transcript_path, speaker_metrics, turn_data,
-            process_time, tqc_timestamp
-        ) VALUES (
-            '{self.transcript_path}', '{speaker_metrics}', '{turn_data}',
-            {process_time}, '{self.timestamp}'
+        sql_query = TranscriptQuickQc._INSERT_QUERY
+
+        params = (
+            self.transcript_path,
+            db.json_param(self.speaker_metrics),
+            db.json_param(self.turn_data),
+            self.process_time,
+            self.timestamp,
         )
-        """
-
-        sql_query = db.handle_null(sql_query)
 
-        return sql_query
+        return sql_query, params
 
 
 if __name__ == "__main__":
@@ -122,12 +135,6 @@ if __name__ == "__main__":
         "[red]This will delete all existing data in the 'transcript_quick_qc' table!"
     )
 
-    drop_queries = [TranscriptQuickQc.drop_table_query()]
-    create_queries = [TranscriptQuickQc.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    console.log("Executing queries...")
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[TranscriptQuickQc])
 
     console.log("[green]Done!")
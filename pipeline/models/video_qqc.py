@@ -3,24 +3,26 @@
 VideoQuickQc Model
 """
 
+import os
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
-
-from typing import Optional
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
+
+from typing import Optional, Tuple
 
 from pipeline.helpers import db, utils
 
@@ -38,6 +40,34 @@ class VideoQuickQc:
         process_time (Optional[float]): The time it took to process the video.
     """
 
+    __slots__ = ("video_path", "has_black_bars", "black_bar_height", "process_time")
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS video_quick_qc (
+            video_path TEXT NOT NULL REFERENCES decrypted_files (destination_path),
+            has_black_bars BOOLEAN NOT NULL,
+            black_bar_height INTEGER,
+            vqqc_process_time REAL NOT NULL,
+            vqqc_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (video_path)
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS video_quick_qc;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO video_quick_qc (
+            video_path,
+            has_black_bars,
+            black_bar_height,
+            vqqc_process_time
+        ) VALUES (%s, %s, %s, %s);
+        """
+    )
+
     def __init__(
         self,
         video_path: Path,
@@ -45,7 +75,7 @@ class VideoQuickQc:
         black_bar_height: Optional[int] = None,
         process_time: Optional[float] = None,
     ):
-        self.video_path = video_path
+        self.video_path = os.fspath(video_path)
         self.has_black_bars = has_black_bars
         self.black_bar_height = black_bar_height
         self.process_time = process_time
@@ -53,37 +83,21 @@ class VideoQuickQc:
     def __repr__(self):
         return f"VideoQuickQc({self.video_path}, {self.has_black_bars}, {self.black_bar_height})"
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'video_quick_qc' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS video_quick_qc (
-            video_path TEXT NOT NULL REFERENCES decrypted_files (destination_path),
-            has_black_bars BOOLEAN NOT NULL,
-            black_bar_height INTEGER,
-            vqqc_process_time REAL NOT NULL,
-            vqqc_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (video_path)
-        );
-        """
-
-        return sql_query
+        return VideoQuickQc._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'video_quick_qc' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS video_quick_qc;
-        """
-
-        return sql_query
+        return VideoQuickQc._DROP_TABLE_QUERY
 
     @staticmethod
     def drop_row_query(video_path: Path) -> str:
@@ -97,35 +111,26 @@ class VideoQuickQc:
 
         return sql_query
 
-    def to_sql(self):
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert the VideoQuickQc object into the 'video_quick_qc' table.
+        Return the SQL query and its parameters to insert the VideoQuickQc object
+        into the 'video_quick_qc' table.
         """
-        if self.black_bar_height is None:
-            _black_bar_height = "NULL"
-        else:
-            _black_bar_height = self.black_bar_height
-
         if self.process_time is None:
-            _process_time = "0.0"
+            _process_time = 0.0
         else:
             _process_time = self.process_time
 
-        sql_query = f"""
-        INSERT INTO video_quick_qc (
-            video_path,
-            has_black_bars,
-            black_bar_height,
-            vqqc_process_time
-        ) VALUES (
-            '{self.video_path}',
-            {self.has_black_bars},
-            {_black_bar_height},
-            {_process_time}
-        );
-        """
+        sql_query = VideoQuickQc._INSERT_QUERY
 
-        return sql_query
+        params = (
+            self.video_path,
+            self.has_black_bars,
+            self.black_bar_height,
+            _process_time,
+        )
+
+        return sql_query, params
 
 
 if __name__ == "__main__":
@@ -136,12 +141,6 @@ if __name__ == "__main__":
         "[red]This will delete all existing data in the 'video_quick_qc' table!"
     )
 
-    drop_queries = [VideoQuickQc.drop_table_query()]
-    create_queries = [VideoQuickQc.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    console.log("Executing queries...")
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[VideoQuickQc])
 
     console.log("[green]Done!")
@@ -3,24 +3,26 @@
 VideoStream Model
 """
 
+import os
 import sys
 from pathlib import Path
 
-file = Path(__file__).resolve()
-parent = file.parent
-ROOT = None
-for parent in file.parents:
-    if parent.name == "av-pipeline-v2":
-        ROOT = parent
-sys.path.append(str(ROOT))
-
-# remove current directory from path
-try:
-    sys.path.remove(str(parent))
-except ValueError:
-    pass
-
-from typing import Optional
+if __name__ == "__main__":
+    file = Path(__file__).resolve()
+    parent = file.parent
+    ROOT = None
+    for parent in file.parents:
+        if parent.name == "av-pipeline-v2":
+            ROOT = parent
+    sys.path.append(str(ROOT))
+
+    # remove current directory from path
+    try:
+        sys.path.remove(str(parent))
+    except ValueError:
+        pass
+
+from typing import List, Optional, Tuple
 
 from pipeline.helpers import db, utils
 from pipeline.models.interview_roles import InterviewRole
@@ -42,6 +44,37 @@ class VideoStream:
         vs_process_time (Optional[float]): The time it took to process the video stream.
     """
 
+    __slots__ = ("video_path", "ir_role", "_ir_role_s", "vs_path", "vs_process_time")
+
+    _INIT_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS video_streams (
+            vs_path TEXT NOT NULL PRIMARY KEY,
+            video_path TEXT NOT NULL REFERENCES video_quick_qc (video_path),
+            ir_role TEXT NOT NULL REFERENCES interview_roles (ir_role),
+            vs_process_time REAL,
+            vs_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (video_path, ir_role)
+        );
+        """
+
+    _DROP_TABLE_QUERY = """
+        DROP TABLE IF EXISTS video_streams;
+        """
+
+    _INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO video_streams (video_path, ir_role, vs_path, vs_process_time)
+        VALUES (%s, %s, %s, %s);
+        """
+    )
+
+    _BULK_INSERT_QUERY = db.compact_query(
+        """
+        INSERT INTO video_streams (video_path, ir_role, vs_path, vs_process_time)
+        VALUES %s;
+        """
+    )
+
     def __init__(
         self,
         video_path: Path,
@@ -49,45 +82,32 @@ class VideoStream:
         vs_path: Path,
         vs_process_time: Optional[float] = None,
     ):
-        self.video_path = video_path
+        self.video_path = os.fspath(video_path)
         self.ir_role = ir_role
-        self.vs_path = vs_path
+        self._ir_role_s = (
+            ir_role.value if isinstance(ir_role, InterviewRole) else ir_role
+        )
+        self.vs_path = os.fspath(vs_path)
         self.vs_process_time = vs_process_time
 
     def __repr__(self):
         return f"VideoStream({self.video_path}, {self.ir_role}, {self.vs_path})"
 
-    def __str__(self):
-        return self.__repr__()
+    __str__ = __repr__
 
     @staticmethod
     def init_table_query() -> str:
         """
         Return the SQL query to create the 'video_streams' table.
         """
-        sql_query = """
-        CREATE TABLE IF NOT EXISTS video_streams (
-            vs_path TEXT NOT NULL PRIMARY KEY,
-            video_path TEXT NOT NULL REFERENCES video_quick_qc (video_path),
-            ir_role TEXT NOT NULL REFERENCES interview_roles (ir_role),
-            vs_process_time REAL,
-            vs_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE (video_path, ir_role)
-        );
-        """
-
-        return sql_query
+        return VideoStream._INIT_TABLE_QUERY
 
     @staticmethod
     def drop_table_query() -> str:
         """
         Return the SQL query to drop the 'video_streams' table.
         """
-        sql_query = """
-        DROP TABLE IF EXISTS video_streams;
-        """
-
-        return sql_query
+        return VideoStream._DROP_TABLE_QUERY
 
     @staticmethod
     def drop_row_query_s(stream_path: Path) -> str:
@@ -125,22 +145,54 @@ class VideoStream:
 
         return sql_query
 
-    def to_sql(self) -> str:
+    def to_sql(self) -> Tuple[str, tuple]:
         """
-        Return the SQL query to insert this object into the 'video_streams' table.
+        Return the SQL query and its parameters to insert this object
+        into the 'video_streams' table.
         """
 
-        if self.vs_process_time is None:
-            process_time = "NULL"
-        else:
-            process_time = str(self.vs_process_time)
+        sql_query = VideoStream._INSERT_QUERY
 
-        sql_query = f"""
-        INSERT INTO video_streams (video_path, ir_role, vs_path, vs_process_time)
-        VALUES ('{self.video_path}', '{self.ir_role.value}', '{self.vs_path}', {process_time});
+        params = (
+            self.video_path,
+            self._ir_role_s,
+            self.vs_path,
+            self.vs_process_time,
+        )
+
+        return sql_query, params
+
+    @staticmethod
+    def bulk_insert(
+        config_file: Path, streams: List["VideoStream"], page_size: int = 1000
+    ) -> None:
         """
+        Insert many video streams into the 'video_streams' table,
+        using one multi-row statement per page.
 
-        return sql_query
+        Args:
+            config_file (Path): The path to the configuration file.
+            streams (List[VideoStream]): The video streams to insert.
+            page_size (int, optional): The maximum number of rows per statement.
+        """
+        sql_query = VideoStream._BULK_INSERT_QUERY
+
+        values = [
+            (
+                stream.video_path,
+                stream._ir_role_s,
+                stream.vs_path,
+                stream.vs_process_time,
+            )
+            for stream in streams
+        ]
+
+        db.execute_values(
+            config_file=config_file,
+            query=sql_query,
+            values=values,
+            page_size=page_size,
+        )
 
 
 if __name__ == "__main__":
@@ -149,11 +201,6 @@ if __name__ == "__main__":
     console.log("Initializing 'video_streams' table...")
     console.log("[red]This will delete all existing data in the 'video_streams' table!")
 
-    drop_queries = [VideoStream.drop_table_query()]
-    create_queries = [VideoStream.init_table_query()]
-
-    sql_queries = drop_queries + create_queries
-
-    db.execute_queries(config_file=config_file, queries=sql_queries, show_commands=True)
+    db.init_tables(config_file=config_file, tables=[VideoStream])
 
     console.log("'video_streams' table initialized.")
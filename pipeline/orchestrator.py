@@ -2,17 +2,138 @@
 Pipeline ochestration module.
 """
 
+import atexit
+import functools
 import logging
 import sys
-import time
+import threading
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Literal
+from typing import Deque, Dict, List, Literal, Optional, Sequence, Tuple
 
 from pipeline.helpers import db, cli, notifications
 from pipeline.helpers.config import config
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
+# For messages with rich markup, without passing extra={"markup": True} each time
+markup_logger = logging.LoggerAdapter(logger, {"markup": True})
+
+# Messages logged with db_log, waiting to be written to the logs table.
+# A background thread writes them every _LOG_FLUSH_INTERVAL_S seconds, or as
+# soon as _LOG_FLUSH_SIZE messages are pending.
+_LOG_BUFFER: Deque[Tuple[Path, str, str]] = deque()
+_LOG_FLUSH_INTERVAL_S = 0.2
+_LOG_FLUSH_SIZE = 64
+_LOG_FLUSH_LOCK = threading.Lock()
+_LOG_WAKEUP = threading.Event()
+_LOG_FLUSHER: Optional[threading.Thread] = None
+
+# snooze() waits on this event, so that wakeup() can cut a snooze short.
+# Consecutive snoozes back off by snooze_backoff_factor (_SNOOZE_BACKOFF_BASE
+# if not configured), up to
+# max_snooze_time_seconds, until reset_snooze() is called.
+_SNOOZE_EVENT = threading.Event()
+_SNOOZE_BACKOFF_BASE = 1.3
+_CONSECUTIVE_SNOOZES = 0
+
+
+@dataclass(slots=True, frozen=True)
+class OrchestrationConfig:
+    """
+    Parsed `orchestration` section of the configuration file, along with the
+    crawler's hash_files setting.
+
+    Attributes:
+        num_to_decrypt (Optional[int]): The number of files to decrypt per request.
+        snooze_time_seconds (Optional[int]): How long to sleep when there is
+            nothing to process.
+        max_snooze_time_seconds (Optional[int]): The longest a snooze can grow to
+            after consecutive idle polls. Defaults to snooze_time_seconds (no backoff).
+        snooze_backoff_factor (float): How much longer each consecutive snooze is
+            than the previous one.
+        max_instances (Dict[str, int]): The maximum number of instances, per module.
+        pipeline_user (Optional[str]): The user that should own pipeline outputs.
+        pipeline_group (Optional[str]): The group that should own pipeline outputs.
+        hash_files (bool): Whether the crawler should hash the files it imports.
+    """
+
+    num_to_decrypt: Optional[int]
+    snooze_time_seconds: Optional[int]
+    max_snooze_time_seconds: Optional[int]
+    snooze_backoff_factor: float
+    max_instances: Dict[str, int]
+    pipeline_user: Optional[str]
+    pipeline_group: Optional[str]
+    hash_files: bool
+
+
+def load_orchestration_config(config_file: Path) -> OrchestrationConfig:
+    """
+    Reads the `orchestration` section of the configuration file once, converting
+    the values to their types.
+
+    Meant to be called once per iteration of a polling loop, with the result
+    passed to the helpers that need it.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+
+    Returns:
+        OrchestrationConfig: The parsed orchestration parameters.
+
+    Raises:
+        ValueError: If snooze_backoff_factor is less than 1, or
+            max_snooze_time_seconds is less than snooze_time_seconds.
+    """
+    params = config(config_file, section="orchestration")
+
+    def get_int(key: str) -> Optional[int]:
+        return int(params[key]) if key in params else None
+
+    max_instances = {
+        key[: -len("_max_instances")]: int(value)
+        for key, value in params.items()
+        if key.endswith("_max_instances")
+    }
+
+    try:
+        hash_files = config(config_file, section="crawler").get("hash_files", "True")
+    except ValueError:
+        hash_files = "True"
+
+    snooze_time_seconds = get_int("snooze_time_seconds")
+    max_snooze_time_seconds = get_int("max_snooze_time_seconds")
+    snooze_backoff_factor = float(
+        params.get("snooze_backoff_factor", _SNOOZE_BACKOFF_BASE)
+    )
+
+    # Otherwise snoozes would shrink, or never reach their configured length
+    if snooze_backoff_factor < 1:
+        raise ValueError(
+            f"snooze_backoff_factor must be at least 1, got {snooze_backoff_factor}"
+        )
+    if (
+        snooze_time_seconds is not None
+        and max_snooze_time_seconds is not None
+        and max_snooze_time_seconds < snooze_time_seconds
+    ):
+        raise ValueError(
+            f"max_snooze_time_seconds ({max_snooze_time_seconds}) must be at least "
+            f"snooze_time_seconds ({snooze_time_seconds})"
+        )
+
+    return OrchestrationConfig(
+        num_to_decrypt=get_int("num_to_decrypt"),
+        snooze_time_seconds=snooze_time_seconds,
+        max_snooze_time_seconds=max_snooze_time_seconds,
+        snooze_backoff_factor=snooze_backoff_factor,
+        max_instances=max_instances,
+        pipeline_user=params.get("pipeline_user"),
+        pipeline_group=params.get("pipeline_group"),
+        hash_files=hash_files.strip().lower() not in ("false", "0", "no", "off"),
+    )
 
 
 def redirect_temp_dir(config_file: Path) -> None:
@@ -37,12 +158,15 @@ def redirect_temp_dir(config_file: Path) -> None:
     cli.redirect_temp_dir(temp_dir)
 
 
+@functools.lru_cache(maxsize=8)
 def get_data_root(config_file: Path, enforce_real: bool = False) -> Path:
     """
     Gets the data root directory from the configuration file.
     If fake_root is defined in the configuration file, the fake root directory is returned,
     unless enforce_real is set to True.
 
+    The result is cached per configuration file.
+
     Args:
         config_file (Path): The path to the configuration file.
         enforce_real (bool): If True, the real data root directory is returned.
@@ -65,21 +189,28 @@ def get_data_root(config_file: Path, enforce_real: bool = False) -> Path:
     return data_root
 
 
+@functools.lru_cache(maxsize=8)
+def _get_studies(config_file: Path) -> Tuple[str, ...]:
+    params = config(path=config_file, section="general")
+    studies = params["study"].split(",")
+
+    # strip leading and trailing whitespaces
+    return tuple(study.strip() for study in studies)
+
+
 def get_studies(config_file: Path) -> List[str]:
     """
     Gets the list of studies from configuration file.
 
+    The parsed list is cached per configuration file.
+
     Args:
         config_file (Path): The path to the configuration file.
 
     Returns:
         List[str]: The list of studies.
     """
-    params = config(path=config_file, section="general")
-    studies = params["study"].split(",")
-
-    # strip leading and trailing whitespaces
-    studies = [study.strip() for study in studies]
+    studies = list(_get_studies(config_file))
 
     # Check if study metadata exists
     if not studies:
@@ -88,6 +219,66 @@ def get_studies(config_file: Path) -> List[str]:
     return studies
 
 
+class PathTranslator:
+    """
+    Translates paths under the data root to the same paths under the fake root.
+
+    Built once per configuration file (see translate_to_fake_root), so that
+    translating a path only compares and joins path parts.
+    """
+
+    __slots__ = ("data_root", "fake_root", "_data_root_parts")
+
+    def __init__(self, data_root: Path, fake_root: Path) -> None:
+        """
+        Args:
+            data_root (Path): The real data root directory.
+            fake_root (Path): The fake data root directory.
+        """
+        self.data_root = data_root
+        self.fake_root = fake_root
+        self._data_root_parts = data_root.parts
+
+    def translate(self, file_path: Path) -> Path:
+        """
+        Translates a path under the data root to the fake root.
+
+        Args:
+            file_path (Path): The path to the file in data directory.
+
+        Returns:
+            Path: The path to the file in the fake root directory.
+
+        Raises:
+            ValueError: If file_path is not under the data root.
+        """
+        parts = file_path.parts
+        n_root_parts = len(self._data_root_parts)
+        if parts[:n_root_parts] != self._data_root_parts:
+            raise ValueError(f"{file_path} is not in the subpath of {self.data_root}")
+
+        return self.fake_root.joinpath(*parts[n_root_parts:])
+
+
+@functools.lru_cache(maxsize=8)
+def get_path_translator(config_file: Path) -> PathTranslator:
+    """
+    Returns the (cached) PathTranslator for the data and fake roots in the
+    configuration file.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+
+    Returns:
+        PathTranslator: The translator from the data root to the fake root.
+    """
+    config_params = config(config_file, section="general")
+    data_root = Path(config_params["data_root"])
+    fake_root = Path(config_params["fake_root"])
+
+    return PathTranslator(data_root=data_root, fake_root=fake_root)
+
+
 def translate_to_fake_root(
     config_file: Path,
     file_path: Path,
@@ -102,15 +293,7 @@ def translate_to_fake_root(
     Returns:
         str: The path to the file in the fake root directory.
     """
-
-    config_params = config(config_file, section="general")
-    data_root = Path(config_params["data_root"])
-    fake_root = Path(config_params["fake_root"])
-
-    fake_file_path = file_path.relative_to(data_root)
-    fake_file_path = fake_root / fake_file_path
-
-    return fake_file_path
+    return get_path_translator(config_file).translate(file_path)
 
 
 def fix_permissions(
@@ -129,11 +312,10 @@ def fix_permissions(
     Returns:
         None
     """
-    config_params = config(config_file, section="orchestration")
-    try:
-        pipeline_user = config_params["pipeline_user"]
-        pipeline_group = config_params["pipeline_group"]
-    except KeyError:
+    orchestration_config = load_orchestration_config(config_file)
+    pipeline_user = orchestration_config.pipeline_user
+    pipeline_group = orchestration_config.pipeline_group
+    if pipeline_user is None or pipeline_group is None:
         logger.warning("Pipeline user and group not set. Skipping permission fix...")
         return
 
@@ -154,67 +336,169 @@ def get_decryption_count(config_file: Path) -> int:
     Returns:
         int: The number of files to decrypt.
     """
-    orchestration_params = config(config_file, section="orchestration")
-    num_to_decrypt = int(orchestration_params["num_to_decrypt"])
+    num_to_decrypt = load_orchestration_config(config_file).num_to_decrypt
+    if num_to_decrypt is None:
+        raise KeyError("num_to_decrypt")
     return num_to_decrypt
 
 
-def snooze(config_file: Path) -> None:
+def wakeup() -> None:
+    """
+    Ends the current (or next) snooze early, and resets the snooze backoff.
+
+    Returns:
+        None
+    """
+    reset_snooze()
+    _SNOOZE_EVENT.set()
+
+
+def reset_snooze() -> None:
+    """
+    Resets the snooze backoff, so that the next snooze lasts snooze_time_seconds.
+
+    Called after work was done, e.g. by log().
+
+    Returns:
+        None
+    """
+    global _CONSECUTIVE_SNOOZES  # pylint: disable=global-statement
+    _CONSECUTIVE_SNOOZES = 0
+
+
+def snooze(
+    config_file: Path, orchestration_config: Optional[OrchestrationConfig] = None
+) -> None:
     """
     Sleeps for a specified amount of time.
 
+    Each consecutive snooze (without work in between, see reset_snooze) is
+    longer than the previous one, up to max_snooze_time_seconds.
+
     Args:
         config_file (str): The path to the configuration file.
+        orchestration_config (Optional[OrchestrationConfig]): The already parsed
+            orchestration parameters. Read from config_file if not provided.
 
     Returns:
         None
     """
-    params = config(config_file, section="orchestration")
-    snooze_time_seconds = int(params["snooze_time_seconds"])
+    global _CONSECUTIVE_SNOOZES  # pylint: disable=global-statement
+
+    if orchestration_config is None:
+        orchestration_config = load_orchestration_config(config_file)
+    snooze_time_seconds = orchestration_config.snooze_time_seconds
+    if snooze_time_seconds is None:
+        raise KeyError("snooze_time_seconds")
 
     if snooze_time_seconds == 0:
-        logger.info(
-            "[bold green]Snooze time is set to 0. Exiting...", extra={"markup": True}
-        )
+        markup_logger.info("[bold green]Snooze time is set to 0. Exiting...")
         sys.exit(0)
 
-    logger.info(
-        f"[bold green]No file to process. Snoozing for {snooze_time_seconds} seconds...",
-        extra={"markup": True},
+    # Validated to be at least snooze_time_seconds by load_orchestration_config
+    max_snooze_time_seconds = orchestration_config.max_snooze_time_seconds
+    if max_snooze_time_seconds is None:
+        max_snooze_time_seconds = snooze_time_seconds
+
+    snooze_time_seconds = (
+        snooze_time_seconds
+        * orchestration_config.snooze_backoff_factor**_CONSECUTIVE_SNOOZES
+    )
+    # Stop backing off once the longest snooze is reached, so that the exponent
+    # stays bounded however long the runner stays idle
+    if snooze_time_seconds >= max_snooze_time_seconds:
+        snooze_time_seconds = max_snooze_time_seconds
+    else:
+        _CONSECUTIVE_SNOOZES += 1
+
+    markup_logger.info(
+        f"[bold green]No file to process. Snoozing for {snooze_time_seconds:.0f} seconds..."
     )
 
-    # Sleep for snooze_time_seconds
+    # Sleep for snooze_time_seconds, or until wakeup() is called
     # Catch KeyboardInterrupt to allow the user to stop snoozing
     try:
-        time.sleep(snooze_time_seconds)
+        if _SNOOZE_EVENT.wait(timeout=snooze_time_seconds):
+            markup_logger.info("[bold green]Woken up.")
+        _SNOOZE_EVENT.clear()
     except KeyboardInterrupt:
         try:
-            logger.info("[bold red]Snooze interrupted by user.", extra={"markup": True})
-            logger.info("[red]Interrupt again to exit.", extra={"markup": True})
-            time.sleep(5)
+            markup_logger.info("[bold red]Snooze interrupted by user.")
+            markup_logger.info("[red]Interrupt again to exit.")
+            # wakeup() ends the grace period early, same as the snooze itself
+            _SNOOZE_EVENT.wait(timeout=5)
+            _SNOOZE_EVENT.clear()
         except KeyboardInterrupt:
-            logger.info("[bold red]Exiting...", extra={"markup": True})
+            markup_logger.info("[bold red]Exiting...")
             sys.exit(0)
-        logger.info("[bold green]Resuming...", extra={"markup": True})
+        markup_logger.info("[bold green]Resuming...")
+
+
+def flush_db_log() -> None:
+    """
+    Writes all buffered db_log messages to the database, with one multi-row
+    INSERT per configuration file.
+
+    Called periodically by the background flusher, and at exit.
+
+    Returns:
+        None
+    """
+    with _LOG_FLUSH_LOCK:
+        rows_by_config = {}
+        while _LOG_BUFFER:
+            config_file, module_name, message = _LOG_BUFFER.popleft()
+            rows_by_config.setdefault(config_file, []).append((module_name, message))
+
+        for config_file, rows in rows_by_config.items():
+            try:
+                db.execute_values(
+                    config_file=config_file,
+                    query="INSERT INTO logs (log_module, log_message) VALUES %s",
+                    values=rows,
+                    on_failure=None,
+                )
+            except Exception as e:
+                logger.error(f"Failed to write {len(rows)} log message(s): {e}")
+
+
+def _db_log_flusher() -> None:
+    while True:
+        _LOG_WAKEUP.wait(timeout=_LOG_FLUSH_INTERVAL_S)
+        _LOG_WAKEUP.clear()
+        flush_db_log()
 
 
 def db_log(config_file: Path, module_name: str, message: str) -> None:
     """
     Logs a message to the database.
 
+    The message is buffered, and written by a background thread shortly after.
+    Use flush_db_log to write pending messages immediately.
+
     Args:
     - config_file (str): the path to the configuration file
     - module_name (str): the name of the module
     - message (str): the message to log
     """
-    commands = [
-        f"""
-        INSERT INTO logs (log_module, log_message)
-        VALUES ('{module_name}', '{message}');
-        """
-    ]
+    global _LOG_FLUSHER  # pylint: disable=global-statement
+
+    _LOG_BUFFER.append((config_file, module_name, message))
+
+    # The flusher does not survive a fork, so restart it if needed
+    if _LOG_FLUSHER is None or not _LOG_FLUSHER.is_alive():
+        with _LOG_FLUSH_LOCK:
+            if _LOG_FLUSHER is None or not _LOG_FLUSHER.is_alive():
+                _LOG_FLUSHER = threading.Thread(
+                    target=_db_log_flusher, name="db_log_flusher", daemon=True
+                )
+                _LOG_FLUSHER.start()
+
+    if len(_LOG_BUFFER) >= _LOG_FLUSH_SIZE:
+        _LOG_WAKEUP.set()
 
-    db.execute_queries(config_file, commands, show_commands=False, silent=True)
+
+atexit.register(flush_db_log)
 
 
 def log(module_name: str, message: str, config_file: Path) -> None:
@@ -231,6 +515,9 @@ def log(module_name: str, message: str, config_file: Path) -> None:
     """
     logger.info(f"{module_name}: {message}")
 
+    # Callers log after finishing a batch of work; poll at the base rate again
+    reset_snooze()
+
     # Log to database
     db_log(config_file=config_file, module_name=module_name, message=message)
     notifications.send_notification(
@@ -241,23 +528,28 @@ def log(module_name: str, message: str, config_file: Path) -> None:
     )
 
 
-def request_decrytion(config_file: Path):
+def request_decrytion(config_file: Path, conn: Optional["db.Connection"] = None):
     """
     Requests decryption by updating the key_store table in the database.
 
     Args:
         config_file (str): The path to the configuration file.
+        conn (Optional[db.Connection]): An open connection (see db.transaction),
+            to run in the caller's transaction. Defaults to None.
 
     Returns:
         None
     """
     logger.info("Requesting decryption...")
 
-    query = """
+    query = (
+        """
         UPDATE key_store
-        SET value = 'enabled'
-        WHERE name = 'decryption';
-    """
+        SET value = %s
+        WHERE name = %s;
+        """,
+        ("enabled", "decryption"),
+    )
 
     db.execute_queries(
         config_file,
@@ -266,10 +558,46 @@ def request_decrytion(config_file: Path):
         ],
         show_commands=False,
         silent=True,
+        conn=conn,
+    )
+
+
+def put_key_store_many(
+    config_file: Path,
+    items: Sequence[Tuple[str, str]],
+    conn: Optional["db.Connection"] = None,
+):
+    """
+    Adds (or updates) several key-value pairs in the key_store table, with a
+    single multi-row statement.
+
+    Args:
+        config_file (str): The path to the configuration file.
+        items (Sequence[Tuple[str, str]]): The (key, value) pairs to update.
+        conn (Optional[db.Connection]): An open connection (see db.transaction),
+            to run in the caller's transaction. Defaults to None.
+
+    Returns:
+        None
+    """
+    # A statement can't update the same row twice; keep the last value per key
+    values = list(dict(items).items())
+
+    db.execute_values(
+        config_file=config_file,
+        query="""
+        INSERT INTO key_store (name, value)
+        VALUES %s
+        ON CONFLICT (name) DO UPDATE SET value = excluded.value;
+        """,
+        values=values,
+        conn=conn,
     )
 
 
-def put_key_store(config_file: Path, key: str, value: str):
+def put_key_store(
+    config_file: Path, key: str, value: str, conn: Optional["db.Connection"] = None
+):
     """
     Adds a key-value pair to the key_store table in the database.
 
@@ -277,15 +605,39 @@ def put_key_store(config_file: Path, key: str, value: str):
         config_file (str): The path to the configuration file.
         key (str): The key to update.
         value (str): The value to update.
+        conn (Optional[db.Connection]): An open connection (see db.transaction),
+            to run in the caller's transaction. Defaults to None.
 
     Returns:
         None
     """
-    query = f"""
-        INSERT INTO key_store (name, value)
-        VALUES ('{key}', '{value}')
-        ON CONFLICT (name) DO UPDATE SET value = '{value}';
+    put_key_store_many(config_file=config_file, items=[(key, value)], conn=conn)
+
+
+def complete_decryption(
+    config_file: Path,
+    requester: Literal["fetch_audio", "fetch_video"],
+    conn: Optional["db.Connection"] = None,
+):
     """
+    Disables decryption by updating the key_store table in the database.
+
+    Args:
+        config_file (str): The path to the configuration file.
+        conn (Optional[db.Connection]): An open connection (see db.transaction),
+            to run in the caller's transaction. Defaults to None.
+
+    Returns:
+        None
+    """
+    query = (
+        """
+        UPDATE key_store
+        SET value = %s
+        WHERE name = %s;
+        """,
+        ("disabled", requester),
+    )
 
     db.execute_queries(
         config_file,
@@ -294,26 +646,38 @@ def put_key_store(config_file: Path, key: str, value: str):
         ],
         show_commands=False,
         silent=True,
+        conn=conn,
     )
 
 
-def complete_decryption(
-    config_file: Path, requester: Literal["fetch_audio", "fetch_video"]
-):
+def initialize_key_store(
+    config_file: Path,
+    requesters: Sequence[str] = ("fetch_audio", "fetch_video"),
+    conn: Optional["db.Connection"] = None,
+) -> None:
     """
-    Disables decryption by updating the key_store table in the database.
+    Seeds the key_store table with an 'enabled' key for each requester,
+    leaving existing keys untouched.
+
+    Meant to be called once, when a module that requests decryption starts.
 
     Args:
         config_file (str): The path to the configuration file.
+        requesters (Sequence[str]): The names of the modules requesting decryption.
+        conn (Optional[db.Connection]): An open connection (see db.transaction),
+            to run in the caller's transaction. Defaults to None.
 
     Returns:
         None
     """
-    query = f"""
-        UPDATE key_store
-        SET value = 'disabled'
-        WHERE name = '{requester}';
-    """
+    query = (
+        """
+        INSERT INTO key_store (name, value)
+        SELECT unnest(%s::text[]), 'enabled'
+        ON CONFLICT (name) DO NOTHING;
+        """,
+        (list(requesters),),
+    )
 
     db.execute_queries(
         config_file,
@@ -322,59 +686,102 @@ def complete_decryption(
         ],
         show_commands=False,
         silent=True,
+        conn=conn,
     )
 
 
-def check_if_decryption_requested(
-    config_file: Path, requester: Literal["fetch_audio", "fetch_video"]
-) -> bool:
+def check_many_decryption_requested(
+    config_file: Path,
+    requesters: Sequence[str],
+    conn: Optional["db.Connection"] = None,
+) -> Dict[str, bool]:
     """
-    Check if decryption has been requested by querying the key_store table.
+    Check if decryption has been requested, for several modules at once,
+    with a single query to the key_store table.
+
+    The requesters' keys must have been seeded with initialize_key_store.
 
     Args:
         config_file (str): The path to the configuration file.
-        requester (str): The name of the module requesting decryption.
+        requesters (Sequence[str]): The names of the modules requesting decryption.
+        conn (Optional[db.Connection]): An open connection (see db.transaction),
+            to run in the caller's transaction. Defaults to None.
 
     Returns:
-        bool: True if decryption has been requested, False otherwise.
-    """
-    message = "Checking if decryption has been requested...\t"
+        Dict[str, bool]: Whether decryption has been requested, per module.
 
-    query = f"""
-        SELECT value
-        FROM key_store
-        WHERE name = '{requester}';
+    Raises:
+        ValueError: If a key is missing, or has an unexpected value.
     """
+    query = (
+        """
+        SELECT name, value
+        FROM key_store
+        WHERE name = ANY(%s);
+        """,
+        (list(requesters),),
+    )
 
-    result = db.fetch_record(config_file=config_file, query=query)
-
-    if result == "enabled":
-        message += "[green]yes"
-        logger.info(message, extra={"markup": True})
-        return True
-    elif result == "disabled":
-        message += "[red]no"
-        logger.info(message, extra={"markup": True})
-        return False
-    else:
-        if result is None:
-            message += "[yellow]no"
-            logger.info(message, extra={"markup": True})
-            logger.info(
-                "[yellow] Initializing key_store table...", extra={"markup": True}
-            )
-            put_key_store(config_file, requester, "enabled")
-            logger.info("[green] done", extra={"markup": True})
-            return True
+    output = db.execute_queries(
+        config_file,
+        queries=[
+            query,
+        ],
+        show_commands=False,
+        silent=True,
+        conn=conn,
+    )
+    values = dict(output[0]) if output else {}
+
+    requested: Dict[str, bool] = {}
+    for requester in requesters:
+        message = "Checking if decryption has been requested...\t"
+        if len(requesters) > 1:
+            message = f"[{requester}] {message}"
+
+        result = values.get(requester)
+        if result == "enabled":
+            message += "[green]yes"
+            markup_logger.info(message)
+            requested[requester] = True
+        elif result == "disabled":
+            message += "[red]no"
+            markup_logger.info(message)
+            requested[requester] = False
         else:
             message += "[red]no"
-            logger.info(message, extra={"markup": True})
-            logger.info(
-                f"[red] Unexpected value in key_store table: {result}. Exiting...",
-                extra={"markup": True},
+            markup_logger.info(message)
+            markup_logger.info(
+                f"[red] Unexpected value in key_store table: {result}. Exiting..."
             )
             raise ValueError
 
+    return requested
+
+
+def check_if_decryption_requested(
+    config_file: Path,
+    requester: Literal["fetch_audio", "fetch_video"],
+    conn: Optional["db.Connection"] = None,
+) -> bool:
+    """
+    Check if decryption has been requested by querying the key_store table.
+
+    The requester's key must have been seeded with initialize_key_store.
+
+    Args:
+        config_file (str): The path to the configuration file.
+        requester (str): The name of the module requesting decryption.
+        conn (Optional[db.Connection]): An open connection (see db.transaction),
+            to run in the caller's transaction. Defaults to None.
+
+    Returns:
+        bool: True if decryption has been requested, False otherwise.
+    """
+    return check_many_decryption_requested(
+        config_file=config_file, requesters=[requester], conn=conn
+    )[requester]
+
 
 def get_max_instances(
     config_file: Path,
@@ -390,8 +797,8 @@ def get_max_instances(
     Returns:
         int: The maximum number of instances of a module that can be run at once.
     """
-    config_params = config(config_file, section="orchestration")
-    max_instances = int(config_params[f"{module_name}_max_instances"])
+    orchestration_config = load_orchestration_config(config_file)
+    max_instances = orchestration_config.max_instances[module_name]
 
     return max_instances
 
@@ -406,10 +813,4 @@ def is_crawler_hashing_required(config_file: Path) -> bool:
     Returns:
         bool: True if hashing is required, False otherwise.
     """
-    crawler_params = config(config_file, section="crawler")
-    hashing_required = crawler_params["hash_files"]
-
-    if hashing_required == "False" or hashing_required == "false":
-        return False
-    else:
-        return True
+    return load_orchestration_config(config_file).hash_files
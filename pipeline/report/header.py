@@ -87,12 +87,16 @@ def construct_header(
     metadata_col1 = interview_metadata.get_params_col1()
     metadata_col2 = interview_metadata.get_params_col2()
 
-    metadata_col1_left = pdf.compute_x_right_align_list(
-        metadata_col1, "Helvetica-Bold", 12, params_answer_col1_right
-    )
-    metadata_col2_left = pdf.compute_x_right_align_list(
-        metadata_col2, "Helvetica-Bold", 12, params_answer_col2_right
+    # Both columns share a font, so their widths are measured in one pass
+    metadata_left = pdf.compute_x_right_align_batch(
+        metadata_col1 + metadata_col2,
+        "Helvetica-Bold",
+        12,
+        [params_answer_col1_right] * len(metadata_col1)
+        + [params_answer_col2_right] * len(metadata_col2),
     )
+    metadata_col1_left = metadata_left[: len(metadata_col1)]
+    metadata_col2_left = metadata_left[len(metadata_col1) :]
 
     for text, bot in zip(params_col1, params_col_bottoms):
         pdf.draw_text(
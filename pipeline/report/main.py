@@ -2,7 +2,10 @@
 Generates a report for the Interview.
 """
 
-import tempfile
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 from typing import List, Optional
@@ -10,6 +13,7 @@ from typing import List, Optional
 import numpy as np
 import pandas as pd
 from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 from pipeline import constants, core
@@ -19,9 +23,257 @@ from pipeline.helpers.config import config
 from pipeline.helpers.plot import corr_matrix, heatmaps
 from pipeline.models.interview_roles import InterviewRole
 from pipeline.models.lite.interview_metadata import InterviewMetadata
+from pipeline.models.lite.openface_qc_metrics import OpenFaceQcMetrics
+from pipeline.models.lite.video_metadata import VideoMetadata
 from pipeline.report import common, header, video
 
 
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns a process pool whose workers are started fresh ("spawn"), rather
+    than forked.
+
+    By the time reports are rendered, this process runs background threads
+    (report prefetching, the db_log flusher) and holds database connection
+    pools. A fork taken while one of those threads holds a lock can deadlock
+    the worker, and a forked worker would share the parent's connections.
+    Spawned workers inherit neither, and open their own connections if they
+    need any.
+
+    Args:
+        max_workers (int): The number of worker processes.
+
+    Returns:
+        ProcessPoolExecutor: The process pool.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def prepare_features(session: pd.DataFrame, feature_cols: List[str]) -> pd.DataFrame:
+    """
+    Returns a new DataFrame with only the timestamp (in seconds) and the
+    plotted features, downcast to float32, sorted by timestamp.
+
+    The features are sliced into pages and sent to worker processes, so
+    keeping them narrow halves the data copied around.
+
+    Args:
+        session (pd.DataFrame): The OpenFace features, as fetched from the DB.
+        feature_cols (List[str]): The feature columns to keep.
+
+    Returns:
+        pd.DataFrame: The trimmed features.
+    """
+    features = session[feature_cols].astype(np.float32)
+    timestamps = utils.datetime_times_to_floats(session["timestamp"])
+    features.insert(0, "timestamp", timestamps)
+
+    # Sorted once here, so that pages can be sliced out by position
+    features = features.sort_values("timestamp", kind="mergesort")
+    features.reset_index(drop=True, inplace=True)
+
+    return features
+
+
+def split_into_pages(
+    session: pd.DataFrame, duration: float, seconds_per_page: int
+) -> List[pd.DataFrame]:
+    """
+    Splits the OpenFace features into consecutive pages of `seconds_per_page`
+    seconds each, starting at 0.
+
+    Each page is sliced out by position, instead of masking the whole
+    DataFrame for every page. The rows are sorted by timestamp first, unless
+    they already are (see `prepare_features`).
+
+    Args:
+        session (pd.DataFrame): The OpenFace features, with timestamps in seconds.
+        duration (float): The duration of the interview, in seconds.
+        seconds_per_page (int): The number of seconds per page.
+
+    Returns:
+        List[pd.DataFrame]: The features for each page.
+    """
+    if not session["timestamp"].is_monotonic_increasing:
+        session = session.sort_values("timestamp", kind="stable")
+    timestamps = session["timestamp"].to_numpy()
+
+    page_starts = np.arange(0, int(duration), seconds_per_page)
+    # Rows with page_start <= timestamp < page_start + seconds_per_page
+    starts_idx = np.searchsorted(timestamps, page_starts, side="left")
+    ends_idx = np.searchsorted(timestamps, page_starts + seconds_per_page, side="left")
+
+    return [session.iloc[start:end] for start, end in zip(starts_idx, ends_idx)]
+
+
+def assign_bins(
+    part: pd.DataFrame, start_timestamp: float, end_timestamp: float, num_bins: int
+) -> pd.DataFrame:
+    """
+    Adds a `bin` column, with the index of the equal-width time bin each row
+    falls in, between start_timestamp and end_timestamp.
+
+    The bins are uniform, so the index is computed arithmetically, instead of
+    searching the bin edges with `pd.cut`.
+
+    Args:
+        part (pd.DataFrame): The OpenFace features for one page.
+        start_timestamp (float): The start of the page, in seconds.
+        end_timestamp (float): The end of the page, in seconds.
+        num_bins (int): The number of bins on the page.
+
+    Returns:
+        pd.DataFrame: A copy of `part`, with the `bin` column.
+    """
+    bin_width = (end_timestamp - start_timestamp) / num_bins
+    bin_idx = np.floor((part["timestamp"].to_numpy() - start_timestamp) / bin_width)
+
+    return part.assign(bin=np.clip(bin_idx, 0, num_bins - 1).astype(np.int32))
+
+
+def render_page_heatmaps(
+    of_pt_part: pd.DataFrame,
+    of_int_part: Optional[pd.DataFrame],
+    start_timestamp: float,
+    end_timestamp: float,
+    bins_per_page: int,
+    fau_avgs: pd.Series,
+    fau_stds: pd.Series,
+    fau_h_idx: List[int],
+) -> List[Optional[bytes]]:
+    """
+    Renders the heatmaps for one page of the report, as PNG bytes.
+
+    Runs in a worker process, so that pages are rendered in parallel.
+
+    Args:
+        of_pt_part (pd.DataFrame): The subject's OpenFace features for the page.
+        of_int_part (Optional[pd.DataFrame]): The interviewer's OpenFace features
+            for the page, if there is an interviewer stream.
+        start_timestamp (float): The start of the page, in seconds.
+        end_timestamp (float): The end of the page, in seconds.
+        bins_per_page (int): The number of bins on the page.
+        fau_avgs (pd.Series): The average of each AU, across subjects.
+        fau_stds (pd.Series): The standard deviation of each AU, across subjects.
+        fau_h_idx (List[int]): Where to draw horizontal gaps in the AU heatmaps.
+
+    Returns:
+        List[Optional[bytes]]: The pose / gaze heatmaps for the subject and
+            interviewer, then the AU heatmaps for the subject and interviewer.
+            The interviewer's are None if there is no interviewer stream.
+    """
+    heatmap_vid_pose_gaze_pt = io.BytesIO()
+    heatmap_vid_pose_gaze_int = io.BytesIO()
+    heatmap_vid_fau_pt = io.BytesIO()
+    heatmap_vid_fau_int = io.BytesIO()
+
+    # Split the data into bins
+    of_pt_part = assign_bins(
+        part=of_pt_part,
+        start_timestamp=start_timestamp,
+        end_timestamp=end_timestamp,
+        num_bins=bins_per_page,
+    )
+    if of_int_part is not None:
+        of_int_part = assign_bins(
+            part=of_int_part,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            num_bins=bins_per_page,
+        )
+
+    # Generate pose and gaze heatmaps
+    # features = constants.HEADPOSE_FEATURES + constants.GAZE_FEATURES
+    cols = constants.HEADPOSE_COLS + constants.GAZE_COLS
+
+    heatmaps.make_heatmap(
+        df=of_pt_part,
+        num_bins=bins_per_page,
+        cols=cols,
+        output_path=heatmap_vid_pose_gaze_pt,
+        heatmap_config=constants.heatmap_config,
+    )
+
+    if of_int_part is not None:
+        heatmaps.make_heatmap(
+            df=of_int_part,
+            num_bins=bins_per_page,
+            cols=cols,
+            output_path=heatmap_vid_pose_gaze_int,
+            heatmap_config=constants.heatmap_config,
+        )
+
+    # Generate AU heatmaps
+    heatmaps.make_standard_deviation_heatmap(
+        df=of_pt_part,
+        fau_avgs=fau_avgs,
+        fau_stds=fau_stds,
+        num_bins=bins_per_page,
+        features=constants.AU_LABELS,
+        cols=constants.AU_COLS,
+        output_path=heatmap_vid_fau_pt,
+        h_gap_idx=fau_h_idx,
+        heatmap_config=constants.heatmap_config,
+    )
+    if of_int_part is not None:
+        heatmaps.make_standard_deviation_heatmap(
+            df=of_int_part,
+            fau_avgs=fau_avgs,
+            fau_stds=fau_stds,
+            num_bins=bins_per_page,
+            features=constants.AU_LABELS,
+            cols=constants.AU_COLS,
+            output_path=heatmap_vid_fau_int,
+            h_gap_idx=fau_h_idx,
+            heatmap_config=constants.heatmap_config,
+        )
+
+    return [
+        heatmap_vid_pose_gaze_pt.getvalue(),
+        heatmap_vid_pose_gaze_int.getvalue() if of_int_part is not None else None,
+        heatmap_vid_fau_pt.getvalue(),
+        heatmap_vid_fau_int.getvalue() if of_int_part is not None else None,
+    ]
+
+
+def render_correlation_matrix(
+    interview_name: str,
+    role: InterviewRole,
+    config_file: Path,
+    fau_h_idx: List[int],
+) -> bytes:
+    """
+    Renders the AU correlation matrix for one role of the interview, as PNG bytes.
+
+    Runs in a worker process, so that both roles are rendered in parallel.
+
+    Args:
+        interview_name (str): The name of the interview.
+        role (InterviewRole): The role to render the correlation matrix for.
+        config_file (Path): The path to the configuration file.
+        fau_h_idx (List[int]): Where to draw gaps in the correlation matrix.
+
+    Returns:
+        bytes: The correlation matrix, as a PNG image.
+    """
+    correlation_matrix = io.BytesIO()
+
+    corr_matrix.generate_correlation_matric(
+        interview_name=interview_name,
+        role=role,
+        output_path=correlation_matrix,
+        heatmap_config=constants.heatmap_config,
+        config_file_path=str(config_file),
+        gap_idx=fau_h_idx,
+        au_cols=constants.AU_COLS,
+        data_path=constants.DATA_PATH,
+    )
+
+    return correlation_matrix.getvalue()
+
+
 def generate_report(
     interview_name: str,
     dest_file_name: Path,
@@ -60,80 +312,56 @@ def generate_report(
         interview_name=interview_name, config_file=config_file
     )
 
-    required_cols = (
-        ["timestamp"]
-        + constants.HEADPOSE_COLS
-        + constants.GAZE_COLS
-        + constants.AU_COLS
-    )
+    feature_cols = constants.HEADPOSE_COLS + constants.GAZE_COLS + constants.AU_COLS
+    required_cols = ["timestamp"] + feature_cols
 
     # Fetch OpenFace features for PT and INT from DB
     with console.status("Fetching OpenFace features...") as status:
-        status.update("Fetching OpenFace features for subject...")
-        of_pt_session = core.fetch_openface_features(
+        roles = [InterviewRole.SUBJECT]
+        if interview_metadata.has_interviewer_stream:
+            roles.append(InterviewRole.INTERVIEWER)
+
+        # Both roles are fetched in one query, and split by role client-side
+        of_sessions = core.fetch_openface_features_by_role(
             interview_name=interview_name,
             subject_id=subject_id,
             study_id=study_id,
-            role=InterviewRole.SUBJECT,
+            roles=roles,
             cols=required_cols,
             config_file=config_file,
         )
-        try:
-            of_pt_session["timestamp"] = of_pt_session["timestamp"].apply(
-                utils.datetime_time_to_float
-            )
-        except AttributeError:
-            pass
+
+        of_pt_session = prepare_features(
+            of_sessions[InterviewRole.SUBJECT], feature_cols=feature_cols
+        )
 
         if interview_metadata.has_interviewer_stream:
-            status.update("Fetching OpenFace features for interviewer...")
-            of_int_session = core.fetch_openface_features(
-                interview_name=interview_name,
-                subject_id=subject_id,
-                study_id=study_id,
-                role=InterviewRole.INTERVIEWER,
-                cols=required_cols,
-                config_file=config_file,
+            of_int_session = prepare_features(
+                of_sessions[InterviewRole.INTERVIEWER], feature_cols=feature_cols
             )
-            try:
-                of_int_session["timestamp"] = of_int_session["timestamp"].apply(
-                    utils.datetime_time_to_float
-                )
-            except AttributeError:
-                pass
-
-        temp_files_common: List[tempfile.NamedTemporaryFile] = []  # type: ignore
-
-        correlation_matrix_pt_path = tempfile.NamedTemporaryFile(suffix=".png")
-        temp_files_common.append(correlation_matrix_pt_path)
-
-        correlation_matrix_int_path = tempfile.NamedTemporaryFile(suffix=".png")
-        temp_files_common.append(correlation_matrix_int_path)
 
+        # The correlation matrices are independent renders, so run them in
+        # parallel, and keep the PNGs in memory. The interviewer's is only
+        # rendered if there is an interviewer stream.
         console.log("Generating correlation matrices...")
-        status.update("Generating correlation for subject...")
-        corr_matrix.generate_correlation_matric(
-            interview_name=interview_name,
-            role=InterviewRole.SUBJECT,
-            output_path=correlation_matrix_pt_path,  # type: ignore
-            heatmap_config=constants.heatmap_config,
-            config_file_path=str(config_file),
-            gap_idx=fau_h_idx,
-            au_cols=constants.AU_COLS,
-            data_path=constants.DATA_PATH,
-        )
-
-        status.update("Generating correlation for interviewer...")
-        corr_matrix.generate_correlation_matric(
-            interview_name=interview_name,
-            role=InterviewRole.INTERVIEWER,
-            output_path=correlation_matrix_int_path,  # type: ignore
-            heatmap_config=constants.heatmap_config,
-            config_file_path=str(config_file),
-            gap_idx=fau_h_idx,
-            au_cols=constants.AU_COLS,
-            data_path=constants.DATA_PATH,
-        )
+        status.update("Generating correlation matrices...")
+        with _process_pool(max_workers=len(roles)) as executor:
+            corr_futures = {
+                role: executor.submit(
+                    render_correlation_matrix,
+                    interview_name=interview_name,
+                    role=role,
+                    config_file=config_file,
+                    fau_h_idx=fau_h_idx,
+                )
+                for role in roles
+            }
+            correlation_matrices = {
+                role: ImageReader(io.BytesIO(future.result()))
+                for role, future in corr_futures.items()
+            }
+        correlation_matrix_pt = correlation_matrices[InterviewRole.SUBJECT]
+        correlation_matrix_int = correlation_matrices.get(InterviewRole.INTERVIEWER)
 
         console.log("Starting report generation...")
 
@@ -151,43 +379,122 @@ def generate_report(
         seconds_per_page = bin_size * bins_per_page
 
         status.update(f"Splitting Interview into {seconds_per_page} second chunks...")
-        of_pt_session_parts = []
-        of_int_session_parts = []
-
-        for i in range(0, int(duration), seconds_per_page):
-            of_pt_session_parts.append(
-                of_pt_session[
-                    (of_pt_session["timestamp"] >= i)
-                    & (of_pt_session["timestamp"] < i + seconds_per_page)
-                ]
+        of_pt_session_parts = split_into_pages(
+            session=of_pt_session,
+            duration=duration,
+            seconds_per_page=seconds_per_page,
+        )
+        of_int_session_parts: List[Optional[pd.DataFrame]]
+        if interview_metadata.has_interviewer_stream:
+            of_int_session_parts = split_into_pages(  # type: ignore
+                session=of_int_session,  # type: ignore
+                duration=duration,
+                seconds_per_page=seconds_per_page,
             )
-            if interview_metadata.has_interviewer_stream:
-                of_int_session_parts.append(
-                    of_int_session[  # type: ignore
-                        (of_int_session["timestamp"] >= i)  # type: ignore
-                        & (of_int_session["timestamp"] < i + seconds_per_page)  # type: ignore
-                    ]
-                )
-            else:
-                of_int_session_parts.append(None)
+        else:
+            of_int_session_parts = [None] * len(of_pt_session_parts)
+
+        # Skip time windows without any OpenFace frames (e.g. the tail of the
+        # interview), keeping each page's start time
+        pages = [
+            (page_idx * seconds_per_page, of_pt_part, of_int_part)
+            for page_idx, (of_pt_part, of_int_part) in enumerate(
+                zip(of_pt_session_parts, of_int_session_parts)
+            )
+            if len(of_pt_part) > 0 or (of_int_part is not None and len(of_int_part) > 0)
+        ]
+
+        num_pages = len(pages)
+        if num_pages == 0:
+            message = "Skipping report generation. No OpenFace features to plot."
+            console.log(message)
+            return message
 
-        num_pages = len(of_pt_session_parts)
         console.log(f"Report will have {num_pages} pages.")
         status.update("Starting report generation...")
 
+        # The subject's distribution covers all of their interviews, so it is
+        # computed for every report, and shared by its pages
+        subject_stats = video.corr_matrix.get_subject_distribution_stats(
+            subject_id=subject_id,
+            cols=feature_cols,
+            config_file=config_file,
+        )
+
+        # Re-read for every report, as QC may be rerun while the runner loops
+        vid_metadatas = {
+            role: VideoMetadata.get(
+                interview_name=interview_name, role=role, config_file=config_file
+            )
+            for role in roles
+        }
+        qc_metrics = {
+            role: OpenFaceQcMetrics.get(
+                interview_name=interview_name, role=role, config_file=config_file
+            )
+            for role in roles
+        }
+
         fau_metrics = pd.read_csv(constants.FAU_METRICS_PT_CACHE)
         # row1 has average of all the rows, row2 has standard deviation of all the rows
         fau_avgs = fau_metrics.iloc[0]
         fau_stds = fau_metrics.iloc[1]
 
+        # Render every page's heatmaps in parallel first; the canvas is then
+        # assembled page by page, as reportlab's canvas is not thread-safe
+        status.update(f"Generating heatmaps for {num_pages} pages...")
+        max_workers = max(1, min(num_pages, os.cpu_count() or 1))
+        with _process_pool(max_workers=max_workers) as executor:
+            futures = []
+            for page_start, of_pt_part, of_int_part in pages:
+                futures.append(
+                    executor.submit(
+                        render_page_heatmaps,
+                        of_pt_part=of_pt_part,
+                        of_int_part=of_int_part,
+                        start_timestamp=float(page_start),
+                        end_timestamp=float(page_start + seconds_per_page),
+                        bins_per_page=bins_per_page,
+                        fau_avgs=fau_avgs,
+                        fau_stds=fau_stds,
+                        fau_h_idx=fau_h_idx,
+                    )
+                )
+
+            # Keep the PNGs in memory; reportlab reads them through ImageReader
+            page_heatmaps: List[List[Optional[ImageReader]]] = [
+                [
+                    ImageReader(io.BytesIO(png)) if png is not None else None
+                    for png in future.result()
+                ]
+                for future in futures
+            ]
+
         page_number: int = 1
-        start_timestap: float = 0.0
         c = canvas.Canvas(filename=str(dest_file_name), pagesize=letter)
 
-        page_number: int = 1
-        start_timestap: float = 0.0
+        # The header and visit metadata are the same on every page, so draw them
+        # once as form XObjects, and reference them from each page
+        status.update("Constructing header...")
+        c.beginForm("header")
+        header.construct_header(
+            assets_path=constants.ASSETS_PATH,
+            canvas=c,
+            output_path=dest_file_name,
+            interview_metadata=interview_metadata,
+        )
+        c.endForm()
 
-        for of_pt_part, of_int_part in zip(of_pt_session_parts, of_int_session_parts):
+        c.beginForm("visit_metadata")
+        common.print_visit_and_participant_metadata(
+            canvas=c,
+            interview_metadata=interview_metadata,
+            config_file=config_file,
+            data_type="video",
+        )
+        c.endForm()
+
+        for (page_start, _, _), heatmap_images in zip(pages, page_heatmaps):
             console.log(f"Generating page {page_number} of {num_pages}...")
             duration = bin_size * bins_per_page
 
@@ -197,6 +504,7 @@ def generate_report(
             frame_frequency = duration / num_frames
             frame_frequency = timedelta(seconds=frame_frequency)
 
+            start_timestap = float(page_start)
             end_timestamp = start_timestap + duration
 
             start_timedelta = timedelta(seconds=start_timestap)
@@ -207,92 +515,14 @@ def generate_report(
             )
             min_labels = utils.create_labels(start_timestap, end_timestamp, num_labels)
 
-            bins = np.linspace(start_timestap, end_timestamp, bins_per_page + 1)
-
-            # Split the data into bins
-            # Reference:
-            # https://stackoverflow.com/questions/20625582/how-to-deal-with-settingwithcopywarning-in-pandas
-            of_pt_part = of_pt_part.iloc[:]  # To avoid SettingWithCopyWarning
-            of_pt_part["bin"] = pd.cut(
-                of_pt_part["timestamp"], bins=bins, labels=False  # type: ignore
-            )
-            if of_int_part is not None:
-                of_int_part = of_int_part.iloc[:]  # To avoid SettingWithCopyWarning
-                of_int_part["bin"] = pd.cut(
-                    of_int_part["timestamp"], bins=bins, labels=False  # type: ignore
-                )  # type: ignore
-
-            temp_files: List[tempfile.NamedTemporaryFile] = []  # type: ignore
-
-            # Generate pose and gaze heatmaps
-            # features = constants.HEADPOSE_FEATURES + constants.GAZE_FEATURES
-            cols = constants.HEADPOSE_COLS + constants.GAZE_COLS
-
-            heatmap_vid_pose_gaze_pt = tempfile.NamedTemporaryFile(suffix=".png")
-            temp_files.append(heatmap_vid_pose_gaze_pt)
-
-            heatmap_vid_pose_gaze_int = tempfile.NamedTemporaryFile(suffix=".png")
-            temp_files.append(heatmap_vid_pose_gaze_int)
-
-            status.update("Generating Pose Heatmap for subject...")
-            heatmaps.make_heatmap(
-                df=of_pt_part,
-                num_bins=bins_per_page,
-                cols=cols,
-                output_path=heatmap_vid_pose_gaze_pt,  # type: ignore
-                heatmap_config=constants.heatmap_config,
-            )
+            (
+                heatmap_vid_pose_gaze_pt,
+                heatmap_vid_pose_gaze_int,
+                heatmap_vid_fau_pt,
+                heatmap_vid_fau_int,
+            ) = heatmap_images
 
-            if of_int_part is not None:
-                status.update("Generating Pose Heatmap for interviewer...")
-                heatmaps.make_heatmap(
-                    df=of_int_part,
-                    num_bins=bins_per_page,
-                    cols=cols,
-                    output_path=heatmap_vid_pose_gaze_int,  # type: ignore
-                    heatmap_config=constants.heatmap_config,
-                )
-
-            # Generate AU heatmaps
-            heatmap_vid_fau_pt = tempfile.NamedTemporaryFile(suffix=".png")
-            temp_files.append(heatmap_vid_fau_pt)
-
-            heatmap_vid_fau_int = tempfile.NamedTemporaryFile(suffix=".png")
-            temp_files.append(heatmap_vid_fau_int)
-
-            status.update("Generating AU Heatmap for subject...")
-            heatmaps.make_standard_deviation_heatmap(
-                df=of_pt_part,
-                fau_avgs=fau_avgs,
-                fau_stds=fau_stds,
-                num_bins=bins_per_page,
-                features=constants.AU_LABELS,
-                cols=constants.AU_COLS,
-                output_path=heatmap_vid_fau_pt,  # type: ignore
-                h_gap_idx=fau_h_idx,
-                heatmap_config=constants.heatmap_config,
-            )
-            status.update("Generating AU Heatmap for interviewer...")
-            if of_int_part is not None:
-                heatmaps.make_standard_deviation_heatmap(
-                    df=of_int_part,
-                    fau_avgs=fau_avgs,
-                    fau_stds=fau_stds,
-                    num_bins=bins_per_page,
-                    features=constants.AU_LABELS,
-                    cols=constants.AU_COLS,
-                    output_path=heatmap_vid_fau_int,  # type: ignore
-                    h_gap_idx=fau_h_idx,
-                    heatmap_config=constants.heatmap_config,
-                )
-
-            status.update("Constructing header...")
-            header.construct_header(
-                assets_path=constants.ASSETS_PATH,
-                canvas=c,
-                output_path=dest_file_name,
-                interview_metadata=interview_metadata,
-            )
+            c.doForm("header")
 
             status.update("Constructing video section...")
             video.construct_am_report(
@@ -304,12 +534,12 @@ def generate_report(
                 interview_metadata=interview_metadata,
                 config_file=config_file,
                 min_labels=min_labels,
-                heatmap_vid_pose_pt_path=Path(heatmap_vid_pose_gaze_pt.name),
-                heatmap_vid_fau_pt_path=Path(heatmap_vid_fau_pt.name),
-                heatmap_vid_pose_int_path=Path(heatmap_vid_pose_gaze_int.name),
-                heatmap_vid_fau_int_path=Path(heatmap_vid_fau_int.name),
-                corr_vid_pt_path=Path(correlation_matrix_pt_path.name),
-                corr_vid_int_path=Path(correlation_matrix_int_path.name),
+                heatmap_vid_pose_pt_path=heatmap_vid_pose_gaze_pt,  # type: ignore
+                heatmap_vid_fau_pt_path=heatmap_vid_fau_pt,  # type: ignore
+                heatmap_vid_pose_int_path=heatmap_vid_pose_gaze_int,  # type: ignore
+                heatmap_vid_fau_int_path=heatmap_vid_fau_int,  # type: ignore
+                corr_vid_pt_path=correlation_matrix_pt,
+                corr_vid_int_path=correlation_matrix_int,
                 assets_path=constants.ASSETS_PATH,
                 headpose_labels=constants.HEADPOSE_FEATURES,
                 gaze_labels=constants.GAZE_FEATURES,
@@ -321,15 +551,12 @@ def generate_report(
                 cluster_bars_config=constants.cluster_bars_config,
                 data_path=constants.DATA_PATH,
                 deidentified=anonymize,
+                subject_stats=subject_stats,
+                vid_metadatas=vid_metadatas,
+                qc_metrics=qc_metrics,
             )
 
-            status.update("Writing metadata...")
-            common.print_visit_and_participant_metadata(
-                canvas=c,
-                interview_metadata=interview_metadata,
-                config_file=config_file,
-                data_type="video",
-            )
+            c.doForm("visit_metadata")
 
             common.print_page_numbers(
                 canvas=c,
@@ -340,13 +567,6 @@ def generate_report(
             # Save the page
             c.showPage()
             page_number += 1
-            start_timestap = end_timestamp
-
-            for temp_file in temp_files:
-                temp_file.close()
-
-        for temp_file in temp_files_common:
-            temp_file.close()
 
         console.log("Saving report...")
         c.save()
@@ -3,54 +3,51 @@
 Appearance and Movement Section
 """
 
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+import pandas as pd
 from reportlab.pdfgen import canvas
 
-from pipeline.helpers import pdf, utils
+from pipeline.helpers import dpdash, pdf, utils
 from pipeline.models.interview_roles import InterviewRole
 from pipeline.models.lite.cluster_bar_config import ClusterBarsConfig
 from pipeline.models.lite.interview_metadata import InterviewMetadata
+from pipeline.models.lite.openface_qc_metrics import OpenFaceQcMetrics
 from pipeline.models.lite.ticks_config import TicksConfig
+from pipeline.models.lite.video_metadata import VideoMetadata
 from pipeline.report import common
 from pipeline.report.video import corr_matrix, heatmaps, qc
 
 console = utils.get_console()
 
+# Layout of the "Appearance & Movement" header bar
+_AM_HEADER_BOTTOM = 115.08
+_AM_BARS_HEIGHT = 31.7
+_AM_HEADER_WIDTH = pdf.letter[1] * 2
+_AM_HEADER_TEXT_Y = _AM_HEADER_BOTTOM - _AM_BARS_HEIGHT / 3.5
+_AM_HEADER_TEXT = "Appearance & Movement"
 
-def construct_am_by_role(
-    canvas: canvas.Canvas,
-    role: InterviewRole,
-    interview_name: str,
-    start_time: timedelta,
-    end_time: timedelta,
-    frame_frequency: timedelta,
-    interview_metadata: InterviewMetadata,
-    config_file: Path,
-    min_labels: List[str],
-    heatmap_vid_pose_path: Path,
-    heatmap_vid_fau_path: Path,
-    corr_matrix_path: Path,
-    assets_path: Path,
-    headpose_labels: List[str],
-    gaze_labels: List[str],
-    au_labels: List[str],
-    pose_cols: List[str],
-    gaze_cols: List[str],
-    au_cols: List[str],
-    ticks_config: TicksConfig,
-    cluster_bars_config: ClusterBarsConfig,
-    data_path: Path,
-    deidentified: bool = True,
-) -> None:
+# Fetches each role's snapshots, sample frame, and features in the background.
+# Shared across reports, so that rendering many reports in sequence does not
+# start new threads for each page.
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="am-report")
+atexit.register(_PREFETCH_EXECUTOR.shutdown, wait=False)
+
+
+@dataclass(slots=True, frozen=True)
+class AmRoleContext:
     """
-    Construct the Appearance and Movement section for a given role.
+    The parameters of the Appearance and Movement section that are the same
+    for every role on a page.
 
-    Args:
+    Attributes:
         canvas (canvas.Canvas): The canvas to draw on.
-        role (InterviewRole): The role for whom the section is being constructed.
         interview_name (str): The name of the interview.
         start_time (timedelta): The start time of the section.
         end_time (timedelta): The end time of the section.
@@ -58,9 +55,6 @@ def construct_am_by_role(
         interview_metadata (InterviewMetadata): The interview metadata.
         config_file (Path): The path to the configuration file.
         min_labels (List[str]): The minute labels for the ticks.
-        heatmap_vid_pose_path (Path): The path to the pose heatmap.
-        heatmap_vid_fau_path (Path): The path to the FAU heatmap.
-        corr_matrix_path (Path): The path to the correlation matrix.
         assets_path (Path): The path to the assets directory.
         headpose_labels (List[str]): The list of headpose labels.
         gaze_labels (List[str]): The list of gaze labels.
@@ -72,6 +66,69 @@ def construct_am_by_role(
         cluster_bars_config (ClusterBarsConfig): The cluster bars configuration.
         data_path (Path): The path to the data directory.
         deidentified (bool): Whether the report is deidentified (no face data).
+    """
+
+    canvas: canvas.Canvas
+    interview_name: str
+    start_time: timedelta
+    end_time: timedelta
+    frame_frequency: timedelta
+    interview_metadata: InterviewMetadata
+    config_file: Path
+    min_labels: List[str]
+    assets_path: Path
+    headpose_labels: List[str]
+    gaze_labels: List[str]
+    au_labels: List[str]
+    pose_cols: List[str]
+    gaze_cols: List[str]
+    au_cols: List[str]
+    ticks_config: TicksConfig
+    cluster_bars_config: ClusterBarsConfig
+    data_path: Path
+    deidentified: bool = True
+
+
+def construct_am_by_role(
+    ctx: AmRoleContext,
+    role: InterviewRole,
+    heatmap_vid_pose_path: pdf.Image,
+    heatmap_vid_fau_path: pdf.Image,
+    corr_matrix_path: pdf.Image,
+    snapshots: Optional["Future[List[Optional[bytes]]]"] = None,
+    sample_image: Optional["Future[Optional[bytes]]"] = None,
+    vid_metadata: Optional[VideoMetadata] = None,
+    qc_metrics: Optional[OpenFaceQcMetrics] = None,
+    session_features: Optional["Future[pd.DataFrame]"] = None,
+    subject_stats: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> None:
+    """
+    Construct the Appearance and Movement section for a given role.
+
+    Args:
+        ctx (AmRoleContext): The parameters shared by every role.
+        role (InterviewRole): The role for whom the section is being constructed.
+        heatmap_vid_pose_path (pdf.Image): The pose heatmap.
+        heatmap_vid_fau_path (pdf.Image): The FAU heatmap.
+        corr_matrix_path (pdf.Image): The correlation matrix.
+        snapshots (Optional[Future[List[Optional[bytes]]]]): The snapshots bar
+            frames, being fetched in the background (see
+            heatmaps.fetch_snapshots_by_role). Fetched when drawn, if not provided.
+        sample_image (Optional[Future[Optional[bytes]]]): The sample image, being
+            fetched in the background (see qc.fetch_sample_image_by_role).
+            Fetched when drawn, if not provided.
+        vid_metadata (Optional[VideoMetadata]): The video metadata. Fetched
+            when drawn, if not provided.
+        qc_metrics (Optional[OpenFaceQcMetrics]): The OpenFace QC metrics.
+            Fetched when drawn, if not provided.
+        session_features (Optional[Future[pd.DataFrame]]): The session's pose,
+            gaze and AU features, being fetched in the background (see
+            corr_matrix.fetch_session_features_by_role). Fetched once for both
+            tables, if not provided.
+        subject_stats (Optional[Tuple[np.ndarray, np.ndarray]]): The subject's
+            means and stds, in the order of pose + gaze + AU columns (see
+            corr_matrix.get_subject_distribution_stats). Computed by each table,
+            if not provided.
 
     Returns:
         None
@@ -82,93 +139,127 @@ def construct_am_by_role(
     heatmap_label_right = 60.8
     sample_left = 641
 
-    heatmaps.draw_pose_svgs_by_role(assets_path=assets_path, canvas=canvas, role=role)
+    # The helpers below only reset the fill color after drawing. Bound anything
+    # else they leave set (e.g. line widths) to this role's block.
+    ctx.canvas.saveState()
+
+    heatmaps.draw_pose_svgs_by_role(
+        assets_path=ctx.assets_path, canvas=ctx.canvas, role=role
+    )
 
     heatmaps.construct_heatmap_by_role(
-        canvas=canvas,
+        canvas=ctx.canvas,
         role=role,
-        interview_name=interview_name,
-        start_time=start_time,
-        end_time=end_time,
-        frame_frequency=frame_frequency,
+        interview_name=ctx.interview_name,
+        start_time=ctx.start_time,
+        end_time=ctx.end_time,
+        frame_frequency=ctx.frame_frequency,
         heatmap_vid_pose_path=heatmap_vid_pose_path,
         heatmap_vid_fau_path=heatmap_vid_fau_path,
-        pose_labels=headpose_labels,
-        gaze_labels=gaze_labels,
-        au_labels=au_labels,
-        min_labels=min_labels,
+        pose_labels=ctx.headpose_labels,
+        gaze_labels=ctx.gaze_labels,
+        au_labels=ctx.au_labels,
+        min_labels=ctx.min_labels,
         pose_label_space=pose_label_space,
         au_label_space=au_label_space,
         heatmap_label_right=heatmap_label_right,
-        ticks_config=ticks_config,
-        cluster_bars_config=cluster_bars_config,
-        assets_path=assets_path,
-        config_file=config_file,
-        deidentify=deidentified,
+        ticks_config=ctx.ticks_config,
+        cluster_bars_config=ctx.cluster_bars_config,
+        assets_path=ctx.assets_path,
+        config_file=ctx.config_file,
+        deidentify=ctx.deidentified,
+        snapshots=snapshots.result() if snapshots is not None else None,
     )
 
     corr_matrix.contruct_dendrogram_by_role(
-        canvas=canvas,
+        canvas=ctx.canvas,
         role=role,
-        assets_path=assets_path,
+        assets_path=ctx.assets_path,
     )
 
     corr_matrix.construct_corr_matrix_by_role(
-        canvas=canvas,
+        canvas=ctx.canvas,
         role=role,
-        interview_metadata=interview_metadata,
+        interview_metadata=ctx.interview_metadata,
         corr_matrix_path=corr_matrix_path,
     )
 
     qc.construct_openface_metadata_box_by_role(
-        canvas=canvas,
+        canvas=ctx.canvas,
         role=role,
-        interview_name=interview_name,
-        config_file=config_file,
+        interview_name=ctx.interview_name,
+        config_file=ctx.config_file,
+        vid_metadata=vid_metadata,
     )
 
     qc.draw_qc_metrics_by_role(
-        canvas=canvas,
+        canvas=ctx.canvas,
         role=role,
-        interview_name=interview_name,
+        interview_name=ctx.interview_name,
         x=sample_left,
-        config_file=config_file,
+        config_file=ctx.config_file,
+        qc_metrics=qc_metrics,
     )
 
+    # Both tables reduce the same session, so it is only fetched once
+    if session_features is not None:
+        features = session_features.result()
+    else:
+        features = corr_matrix.fetch_session_features_by_role(
+            interview_name=ctx.interview_name,
+            role=role,
+            cols=ctx.pose_cols + ctx.gaze_cols + ctx.au_cols,
+            config_file=ctx.config_file,
+        )
+
+    pose_stats = au_stats = None
+    if subject_stats is not None:
+        means, stds = subject_stats
+        pose_count = len(ctx.pose_cols) + len(ctx.gaze_cols)
+        pose_stats = (means[:pose_count], stds[:pose_count])
+        au_stats = (means[pose_count:], stds[pose_count:])
+
     corr_matrix.construct_pose_mean_tables_by_role(
-        canvas=canvas,
+        canvas=ctx.canvas,
         role=role,
-        interview_name=interview_name,
-        config_file=config_file,
-        data_path=data_path,
-        pose_cols=pose_cols,
-        gaze_cols=gaze_cols,
+        interview_name=ctx.interview_name,
+        config_file=ctx.config_file,
+        data_path=ctx.data_path,
+        pose_cols=ctx.pose_cols,
+        gaze_cols=ctx.gaze_cols,
+        session_features=features,
+        subject_stats=pose_stats,
     )
 
     corr_matrix.draw_fau_table_header(
-        canvas=canvas,
+        canvas=ctx.canvas,
         role=role,
     )
 
     corr_matrix.construct_fau_z_scores_table_by_role(
-        canvas=canvas,
+        canvas=ctx.canvas,
         role=role,
-        interview_name=interview_name,
-        au_cols=au_cols,
-        data_path=data_path,
-        config_file=config_file,
+        interview_name=ctx.interview_name,
+        au_cols=ctx.au_cols,
+        data_path=ctx.data_path,
+        config_file=ctx.config_file,
+        session_features=features,
+        subject_stats=au_stats,
     )
 
     qc.construct_sample_image_by_role(
-        canvas=canvas,
-        interview_name=interview_name,
+        canvas=ctx.canvas,
+        interview_name=ctx.interview_name,
         role=role,
-        config_file=config_file,
-        start_time=start_time,
-        end_time=end_time,
-        deidentify=deidentified,
+        config_file=ctx.config_file,
+        start_time=ctx.start_time,
+        end_time=ctx.end_time,
+        deidentify=ctx.deidentified,
+        sample_image=sample_image,
     )
 
+    ctx.canvas.restoreState()
+
 
 def construct_am_report(
     canvas: canvas.Canvas,
@@ -179,12 +270,12 @@ def construct_am_report(
     interview_metadata: InterviewMetadata,
     config_file: Path,
     min_labels: List[str],
-    heatmap_vid_pose_pt_path: Path,
-    heatmap_vid_fau_pt_path: Path,
-    heatmap_vid_pose_int_path: Path,
-    heatmap_vid_fau_int_path: Path,
-    corr_vid_pt_path: Path,
-    corr_vid_int_path: Path,
+    heatmap_vid_pose_pt_path: pdf.Image,
+    heatmap_vid_fau_pt_path: pdf.Image,
+    heatmap_vid_pose_int_path: Optional[pdf.Image],
+    heatmap_vid_fau_int_path: Optional[pdf.Image],
+    corr_vid_pt_path: pdf.Image,
+    corr_vid_int_path: Optional[pdf.Image],
     assets_path: Path,
     headpose_labels: List[str],
     gaze_labels: List[str],
@@ -196,6 +287,9 @@ def construct_am_report(
     cluster_bars_config: ClusterBarsConfig,
     data_path: Path,
     deidentified: bool = True,
+    subject_stats: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    vid_metadatas: Optional[Dict[InterviewRole, VideoMetadata]] = None,
+    qc_metrics: Optional[Dict[InterviewRole, OpenFaceQcMetrics]] = None,
 ) -> None:
     """
     Construct the Appearance and Movement section for the report.
@@ -209,12 +303,15 @@ def construct_am_report(
         interview_metadata (InterviewMetadata): The interview metadata.
         config_file (Path): The path to the configuration file.
         min_labels (List[str]): The minute labels for the ticks.
-        heatmap_vid_pose_pt_path (Path): The path to the pose heatmap for the participant.
-        heatmap_vid_fau_pt_path (Path): The path to the FAU heatmap for the participant.
-        heatmap_vid_pose_int_path (Path): The path to the pose heatmap for the interviewer.
-        heatmap_vid_fau_int_path (Path): The path to the FAU heatmap for the interviewer.
-        corr_vid_pt_path (Path): The path to the correlation matrix for the participant.
-        corr_vid_int_path (Path): The path to the correlation matrix for the interviewer.
+        heatmap_vid_pose_pt_path (pdf.Image): The pose heatmap for the participant.
+        heatmap_vid_fau_pt_path (pdf.Image): The FAU heatmap for the participant.
+        heatmap_vid_pose_int_path (Optional[pdf.Image]): The pose heatmap for the
+            interviewer. Only required if there is an interviewer stream.
+        heatmap_vid_fau_int_path (Optional[pdf.Image]): The FAU heatmap for the
+            interviewer. Only required if there is an interviewer stream.
+        corr_vid_pt_path (pdf.Image): The correlation matrix for the participant.
+        corr_vid_int_path (Optional[pdf.Image]): The correlation matrix for the
+            interviewer. Only required if there is an interviewer stream.
         assets_path (Path): The path to the assets directory.
         headpose_labels (List[str]): The list of headpose labels.
         gaze_labels (List[str]): The list of gaze labels.
@@ -226,65 +323,130 @@ def construct_am_report(
         cluster_bars_config (ClusterBarsConfig): The cluster bars configuration.
         data_path (Path): The path to the data directory.
         deidentified (bool): Whether the report is deidentified (no face data).
+        subject_stats (Optional[Tuple[np.ndarray, np.ndarray]]): The subject's
+            means and stds, in the order of pose + gaze + AU columns, computed
+            once for the report (see corr_matrix.get_subject_distribution_stats).
+            Computed for this page, if not provided.
+        vid_metadatas (Optional[Dict[InterviewRole, VideoMetadata]]): The video
+            metadata of each role, fetched once for the report. Fetched for this
+            page, if not provided.
+        qc_metrics (Optional[Dict[InterviewRole, OpenFaceQcMetrics]]): The
+            OpenFace QC metrics of each role, fetched once for the report.
+            Fetched for this page, if not provided.
 
     Returns:
         None
+
+    Raises:
+        ValueError: If there is an interviewer stream, but any of its images
+            are missing.
     """
-    vid_header_bottom = 115.08
-    bars_height = 31.7
-    video_header = "Appearance & Movement"
+    # (pose heatmap, FAU heatmap, correlation matrix) per role to draw. The
+    # interviewer is left out entirely if there is no interviewer stream, so
+    # none of its frames are fetched.
+    role_images = {
+        InterviewRole.SUBJECT: (
+            heatmap_vid_pose_pt_path,
+            heatmap_vid_fau_pt_path,
+            corr_vid_pt_path,
+        ),
+    }
+    if interview_metadata.has_interviewer_stream:
+        int_images = (
+            heatmap_vid_pose_int_path,
+            heatmap_vid_fau_int_path,
+            corr_vid_int_path,
+        )
+        # Fail before anything is drawn, rather than halfway through the page
+        if any(image is None for image in int_images):
+            raise ValueError(
+                "Missing interviewer heatmaps / correlation matrix for "
+                f"{interview_name}"
+            )
+        role_images[InterviewRole.INTERVIEWER] = int_images  # type: ignore
 
     # Draw Video Header
     pdf.draw_colored_rect(
         canvas=canvas,
         x=0,
-        y=vid_header_bottom,
-        width=pdf.letter[1] * 2,
-        height=bars_height,
+        y=_AM_HEADER_BOTTOM,
+        width=_AM_HEADER_WIDTH,
+        height=_AM_BARS_HEIGHT,
         color=(0.7, 0.7, 0.7),  # type: ignore
         fill=True,
         stroke=True,
     )
     pdf.draw_text(
         canvas=canvas,
-        text=video_header,
+        text=_AM_HEADER_TEXT,
         x=None,
-        y=(vid_header_bottom - bars_height / float(3.5)),
+        y=_AM_HEADER_TEXT_Y,
         size=14,
         font="Helvetica-Bold",
         center=True,
     )
 
-    construct_am_by_role(
-        canvas=canvas,
-        role=InterviewRole.SUBJECT,
-        interview_name=interview_name,
-        start_time=start_time,
-        end_time=end_time,
-        frame_frequency=frame_frequency,
-        interview_metadata=interview_metadata,
-        config_file=config_file,
-        min_labels=min_labels,
-        heatmap_vid_pose_path=heatmap_vid_pose_pt_path,
-        heatmap_vid_fau_path=heatmap_vid_fau_pt_path,
-        corr_matrix_path=corr_vid_pt_path,
-        assets_path=assets_path,
-        headpose_labels=headpose_labels,
-        gaze_labels=gaze_labels,
-        au_labels=au_labels,
-        pose_cols=pose_cols,
-        gaze_cols=gaze_cols,
-        au_cols=au_cols,
-        ticks_config=ticks_config,
-        cluster_bars_config=cluster_bars_config,
-        data_path=data_path,
-        deidentified=deidentified,
-    )
+    # Each role's snapshots and sample frame are read from its videos and
+    # processed on disk, which is the slowest part of the section, so fetch them
+    # all in the background while the rest of the section is drawn. The other
+    # drawings only depend on their own data, so their queries run alongside.
+    roles = list(role_images)
 
-    if interview_metadata.has_interviewer_stream:
-        construct_am_by_role(
+    snapshots = {
+        role: _PREFETCH_EXECUTOR.submit(
+            heatmaps.fetch_snapshots_by_role,
+            interview_name=interview_name,
+            role=role,
+            start_time=start_time,
+            end_time=end_time,
+            frame_frequency=frame_frequency,
+            config_file=config_file,
+            deidentified=deidentified,
+        )
+        for role in roles
+    }
+    sample_images = {
+        role: _PREFETCH_EXECUTOR.submit(
+            qc.fetch_sample_image_by_role,
+            interview_name=interview_name,
+            role=role,
+            config_file=config_file,
+            deidentify=deidentified,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        for role in roles
+    }
+    session_features = {
+        role: _PREFETCH_EXECUTOR.submit(
+            corr_matrix.fetch_session_features_by_role,
+            interview_name=interview_name,
+            role=role,
+            cols=pose_cols + gaze_cols + au_cols,
+            config_file=config_file,
+        )
+        for role in roles
+    }
+
+    if subject_stats is None:
+        subject_stats = corr_matrix.get_subject_distribution_stats(
+            subject_id=dpdash.parse_dpdash_name(interview_name)["subject"],
+            cols=pose_cols + gaze_cols + au_cols,
+            config_file=config_file,
+        )
+
+    futures = [
+        future
+        for role_futures in (
+            snapshots,
+            sample_images,
+            session_features,
+        )
+        for future in role_futures.values()
+    ]
+    try:
+        ctx = AmRoleContext(
             canvas=canvas,
-            role=InterviewRole.INTERVIEWER,
             interview_name=interview_name,
             start_time=start_time,
             end_time=end_time,
@@ -292,9 +454,6 @@ def construct_am_report(
             interview_metadata=interview_metadata,
             config_file=config_file,
             min_labels=min_labels,
-            heatmap_vid_pose_path=heatmap_vid_pose_int_path,
-            heatmap_vid_fau_path=heatmap_vid_fau_int_path,
-            corr_matrix_path=corr_vid_int_path,
             assets_path=assets_path,
             headpose_labels=headpose_labels,
             gaze_labels=gaze_labels,
@@ -308,6 +467,30 @@ def construct_am_report(
             deidentified=deidentified,
         )
 
+        for role in roles:
+            heatmap_vid_pose_path, heatmap_vid_fau_path, corr_matrix_path = (
+                role_images[role]
+            )
+            construct_am_by_role(
+                ctx=ctx,
+                role=role,
+                heatmap_vid_pose_path=heatmap_vid_pose_path,
+                heatmap_vid_fau_path=heatmap_vid_fau_path,
+                corr_matrix_path=corr_matrix_path,
+                snapshots=snapshots[role],
+                sample_image=sample_images[role],
+                vid_metadata=(
+                    vid_metadatas.get(role) if vid_metadatas is not None else None
+                ),
+                qc_metrics=qc_metrics.get(role) if qc_metrics is not None else None,
+                session_features=session_features[role],
+                subject_stats=subject_stats,
+            )
+    finally:
+        # Don't leave the shared workers busy with an abandoned report
+        for future in futures:
+            future.cancel()
+
     common.draw_heatmap_legend(
         assets_path=assets_path, canvas=canvas, data_type="video"
     )
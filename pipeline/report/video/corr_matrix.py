@@ -3,8 +3,11 @@ Constructs Correlation Matrix and other metrics for
 Apperance and Movement Section
 """
 
+import os
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -17,12 +20,84 @@ from pipeline.models.lite.interview_metadata import InterviewMetadata
 
 console = utils.get_console()
 
+# Layout of the correlation matrix headers. The top right headers are fixed, so
+# their right-aligned x-offsets are computed once.
+_CORR_MATRIX_VID_LEFT = 637.63
+_CORR_MATRIX_VID_WIDTH = 138.129
+_PT_VID_CORR_TOP_RT_HEADER = "Participant FAU Correlation (All Time)"
+_INT_VID_CORR_TOP_RT_HEADER = "Overall FAU Correlation (All Time)"
+_PT_VID_CORR_TOP_RT_TEXT_LEFT = (
+    _CORR_MATRIX_VID_LEFT
+    + _CORR_MATRIX_VID_WIDTH
+    - pdf.stringWidth(_PT_VID_CORR_TOP_RT_HEADER, "Helvetica", 5) / float(pdf.cw)
+)
+_INT_VID_CORR_TOP_RT_TEXT_LEFT = (
+    _CORR_MATRIX_VID_LEFT
+    + _CORR_MATRIX_VID_WIDTH
+    - pdf.stringWidth(_INT_VID_CORR_TOP_RT_HEADER, "Helvetica", 5) / float(pdf.cw)
+)
+
+
+def _format_number(number: float) -> str:
+    """
+    Formats a table value as a signed number, with 2 decimals, in at most 5
+    characters (e.g. "+0.12", "-1.50", "+12.3").
+    """
+    return format(number, "+.2f")[:5]
+
+
+def _features_array(features: pd.DataFrame, cols: List[str]) -> np.ndarray:
+    """
+    Returns the given feature columns as a float32 array, for reductions.
+
+    Halves the memory read by the reductions, which is plenty for values shown
+    with 2 decimals. Reductions still accumulate in float64 (`dtype=np.float64`),
+    since the subject's distribution spans every frame of their interviews.
+    """
+    return features[cols].to_numpy(dtype=np.float32)
+
+
+@lru_cache(maxsize=8)
+def _read_metrics_cache(metrics_cache_path: str, mtime_ns: int) -> pd.DataFrame:
+    return pd.read_csv(metrics_cache_path)
+
+
+def load_metrics_cache(data_path: Path, role: InterviewRole) -> pd.DataFrame:
+    """
+    Returns the group means (first row) and stds (second row) of every
+    feature, from the metrics cache at the data path:
+    data/metrics_cache_{role}.csv
+
+    The file is parsed once, and re-read only if it changes. The returned
+    DataFrame is shared between calls, and must not be modified.
+
+    Args:
+        data_path (Path): The path to the data directory.
+        role (InterviewRole): The role whose metrics cache is read.
+
+    Raises:
+        FileNotFoundError: If the metrics cache is not found.
+
+    Returns:
+        pd.DataFrame: The group means and stds.
+    """
+    metrics_cache_path = data_path / f"metrics_cache_{role}.csv"
+
+    try:
+        mtime_ns = os.stat(metrics_cache_path).st_mtime_ns
+    except OSError as e:
+        raise FileNotFoundError(
+            f"Metrics cache not found at {metrics_cache_path}"
+        ) from e
+
+    return _read_metrics_cache(str(metrics_cache_path), mtime_ns)
+
 
 def construct_corr_matrix_by_role(
     canvas: canvas.Canvas,
     role: InterviewRole,
     interview_metadata: InterviewMetadata,
-    corr_matrix_path: Path,
+    corr_matrix_path: pdf.Image,
 ) -> None:
     """
     Places the correlation matrix on the canvas based on the role.
@@ -31,7 +106,7 @@ def construct_corr_matrix_by_role(
         canvas (canvas.Canvas): The canvas to draw on.
         role (InterviewRole): The role for whom the correlation matrix is being placed.
         interview_metadata (InterviewMetadata): The interview metadata.
-        corr_matrix_path (Path): The path to the correlation matrix.
+        corr_matrix_path (pdf.Image): The correlation matrix.
 
     Raises:
         ValueError: If the role is invalid.
@@ -39,14 +114,14 @@ def construct_corr_matrix_by_role(
     Returns:
         None
     """
-    corr_matrix_vid_left = 637.63
-    corr_matrix_vid_width = 138.129
+    corr_matrix_vid_left = _CORR_MATRIX_VID_LEFT
+    corr_matrix_vid_width = _CORR_MATRIX_VID_WIDTH
     corr_matrix_vid_height = 127
     corr_matrix_vid_pt_bottom = 351.5
     corr_matrix_vid_int_bottom = 605.24
 
-    pt_vid_corr_top_rt_header = "Participant FAU Correlation (All Time)"
-    int_vid_corr_top_rt_header = "Overall FAU Correlation (All Time)"
+    pt_vid_corr_top_rt_header = _PT_VID_CORR_TOP_RT_HEADER
+    int_vid_corr_top_rt_header = _INT_VID_CORR_TOP_RT_HEADER
 
     visit = interview_metadata.visit
 
@@ -56,16 +131,8 @@ def construct_corr_matrix_by_role(
     pt_vid_corr_top_rt_text_bot = corr_matrix_vid_pt_bottom - corr_matrix_vid_height - 2
     pt_vid_corr_bot_lf_text_left = corr_matrix_vid_left
     pt_vid_corr_bot_lf_text_bot = corr_matrix_vid_pt_bottom + 7
-    int_vid_corr_top_rt_text_left = (
-        corr_matrix_vid_left
-        + corr_matrix_vid_width
-        - pdf.stringWidth(int_vid_corr_top_rt_header, "Helvetica", 5) / float(pdf.cw)
-    )
-    pt_vid_corr_top_rt_text_left = (
-        corr_matrix_vid_left
-        + corr_matrix_vid_width
-        - pdf.stringWidth(pt_vid_corr_top_rt_header, "Helvetica", 5) / float(pdf.cw)
-    )
+    int_vid_corr_top_rt_text_left = _INT_VID_CORR_TOP_RT_TEXT_LEFT
+    pt_vid_corr_top_rt_text_left = _PT_VID_CORR_TOP_RT_TEXT_LEFT
     int_vid_corr_top_rt_text_bot = (
         corr_matrix_vid_int_bottom - corr_matrix_vid_height - 2
     )
@@ -166,7 +233,7 @@ def contruct_dendrogram_by_role(
 
     pdf.draw_image(
         canvas=canvas,
-        image_path=dendro_vid_path,
+        image_path=pdf.load_image(dendro_vid_path),
         x=dendrogram_vid_left,
         y=img_y,
         width=dendrogram_vid_width,
@@ -186,6 +253,72 @@ def contruct_dendrogram_by_role(
     )
 
 
+def fetch_session_features_by_role(
+    interview_name: str,
+    role: InterviewRole,
+    cols: List[str],
+    config_file: Path,
+) -> pd.DataFrame:
+    """
+    Fetches the OpenFace features of the interview for the given role.
+
+    The pose mean and FAU z-score tables only need the means of their own
+    columns, so the features for both can be fetched once, and passed to each.
+
+    Args:
+        interview_name (str): The name of the interview.
+        role (InterviewRole): The role whose features are fetched.
+        cols (List[str]): The feature columns to fetch.
+        config_file (Path): The path to the configuration file.
+
+    Returns:
+        pd.DataFrame: The features of the session.
+    """
+    dpdash_dict = dpdash.parse_dpdash_name(interview_name)
+    study_id = dpdash_dict["study"]
+    subject_id = dpdash_dict["subject"]
+
+    return core.fetch_openface_features(
+        interview_name=interview_name,
+        subject_id=subject_id,
+        study_id=study_id,
+        role=role,
+        cols=cols,
+        config_file=config_file,
+    )
+
+
+def get_subject_distribution_stats(
+    subject_id: str, cols: List[str], config_file: Path
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the means and (sample) stds of the subject's OpenFace features,
+    across all of their interviews.
+
+    Both the pose mean and FAU z-score tables use these, so they can be
+    computed once per report, for all the columns, and passed to each.
+
+    Args:
+        subject_id (str): The ID of the subject.
+        cols (List[str]): The feature columns.
+        config_file (Path): The path to the configuration file.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The means and stds, in the order of cols.
+    """
+    subject_of_features = core.fetch_openface_subject_distribution(
+        subject_id=subject_id,
+        cols=cols,
+        config_file=config_file,
+    )
+    subject_features = _features_array(subject_of_features, cols)
+
+    means = np.nanmean(subject_features, axis=0, dtype=np.float64)
+    stds = np.nanstd(subject_features, axis=0, dtype=np.float64, ddof=1)
+
+    return means, stds
+
+
 def draw_pose_table_header(canvas: canvas.Canvas, role: InterviewRole) -> None:
     """
     Writes the header for the pose mean tables.
@@ -256,6 +389,8 @@ def construct_pose_mean_tables_by_role(
     data_path: Path,
     pose_cols: List[str],
     gaze_cols: List[str],
+    session_features: Optional[pd.DataFrame] = None,
+    subject_stats: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> None:
     """
     Constructs the pose mean tables for the video section.
@@ -277,6 +412,13 @@ def construct_pose_mean_tables_by_role(
         data_path (Path): The path to the data directory.
         pose_cols (List[str]): The list of pose columns.
         gaze_cols (List[str]): The list of gaze columns.
+        session_features (Optional[pd.DataFrame]): The session's features, with
+            at least the pose and gaze columns, if already fetched (see
+            fetch_session_features_by_role). Fetched here if not provided.
+        subject_stats (Optional[Tuple[np.ndarray, np.ndarray]]): The subject's
+            means and stds, in the order of pose_cols + gaze_cols, if already
+            computed (see get_subject_distribution_stats). Computed here for
+            the subject role, if not provided.
 
     Raises:
         ValueError: If the role is invalid.
@@ -285,17 +427,6 @@ def construct_pose_mean_tables_by_role(
     Returns:
         None
     """
-
-    def process_number(number: float) -> str:
-        if number < 0:
-            num_str = f"{number}"
-        else:
-            num_str = f"+{number}"
-
-        num_str = num_str[:5]
-
-        return num_str
-
     required_cols = pose_cols + gaze_cols
 
     table_cell_pose_left = 597.02
@@ -309,182 +440,135 @@ def construct_pose_mean_tables_by_role(
     table_cell_int_pose_left = 607
 
     draw_pose_table_header(canvas, role)
-    means_and_std_path = data_path / f"metrics_cache_{role}.csv"
-
-    if not means_and_std_path.exists():
-        raise FileNotFoundError(f"Metrics cache not found at {means_and_std_path}")
-
-    means_and_std = pd.read_csv(means_and_std_path)
+    means_and_std = load_metrics_cache(data_path=data_path, role=role)
 
     # Keep only POSE columns
     means_and_std = means_and_std[required_cols]
 
-    dpdash_dict = dpdash.parse_dpdash_name(interview_name)
-    study_id = dpdash_dict["study"]
-    subject_id = dpdash_dict["subject"]
+    subject_id = dpdash.parse_dpdash_name(interview_name)["subject"]
 
-    session_of_pose_features = core.fetch_openface_features(
-        interview_name=interview_name,
-        subject_id=subject_id,
-        study_id=study_id,
-        role=role,
-        cols=required_cols,
-        config_file=config_file,
+    session_of_pose_features = session_features
+    if session_of_pose_features is None:
+        session_of_pose_features = fetch_session_features_by_role(
+            interview_name=interview_name,
+            role=role,
+            cols=required_cols,
+            config_file=config_file,
+        )
+    # Reduce the underlying arrays, in the order of required_cols (NaNs are
+    # skipped, as pandas does)
+    session_pose_means = np.nanmean(
+        _features_array(session_of_pose_features, required_cols),
+        axis=0,
+        dtype=np.float64,
     )
-    session_pose_means = session_of_pose_features.mean(axis=0)
 
-    gp_relative_means = (means_and_std.iloc[0] - session_pose_means) * -1
+    gp_relative_means = (means_and_std.iloc[0].to_numpy() - session_pose_means) * -1
+
+    # (x, y, text) of each table cell
+    cells: List[Tuple[float, float, str]] = []
 
     match role:
         case InterviewRole.SUBJECT:
-            subject_of_pose_features = core.fetch_openface_subject_distribution(
-                subject_id=subject_id,
-                cols=required_cols,
-                config_file=config_file,
-            )
-            subject_pose_means = subject_of_pose_features.mean(axis=0)
+            if subject_stats is None:
+                subject_stats = get_subject_distribution_stats(
+                    subject_id=subject_id,
+                    cols=required_cols,
+                    config_file=config_file,
+                )
+            subject_pose_means, _ = subject_stats
 
             pt_relative_means = (subject_pose_means - session_pose_means) * -1
 
             y = table_cell_pose_bot_start
-            for feature in required_cols:
-                gp_mean = gp_relative_means[feature]
-                gp_mean_str = process_number(gp_mean)
-
-                # Draw Cell
-                pdf.draw_colored_rect(
-                    canvas=canvas,
-                    color=(1, 1, 1),  # type: ignore
-                    x=table_cell_pose_left + table_cell_width,
-                    y=y,
-                    width=table_cell_width,
-                    height=table_cell_height_pose,
-                    fill=False,
-                    stroke=True,
-                    line_width=0.25,
-                )
+            for gp_mean, pt_mean in zip(gp_relative_means, pt_relative_means):
+                gp_mean_str = _format_number(gp_mean)
+                pt_mean_str = _format_number(pt_mean)
 
-                # Then Draw Text
-                pdf.draw_text(
-                    canvas=canvas,
-                    text=gp_mean_str,
-                    x=table_cell_pose_left + table_cell_width + 2,
-                    y=y - 2,
-                    size=4,
-                    font="Helvetica",
-                )
-
-                pt_mean = pt_relative_means[feature]
-                pt_mean_str = process_number(pt_mean)
-
-                pdf.draw_colored_rect(
-                    canvas=canvas,
-                    color=(1, 1, 1),  # type: ignore
-                    x=table_cell_pose_left,
-                    y=y,
-                    width=table_cell_width,
-                    height=table_cell_height_pose,
-                    fill=False,
-                    stroke=True,
-                    line_width=0.25,
-                )
-
-                pdf.draw_text(
-                    canvas=canvas,
-                    text=pt_mean_str,
-                    x=table_cell_pose_left + 2,
-                    y=y - 2,
-                    size=4,
-                    font="Helvetica",
-                )
+                cells.append((table_cell_pose_left + table_cell_width, y, gp_mean_str))
+                cells.append((table_cell_pose_left, y, pt_mean_str))
 
                 y = y + table_cell_height_pose
 
         case InterviewRole.INTERVIEWER:
             y = table_cell_int_pose_bot_start
 
-            for feature in required_cols:
-                gp_mean = gp_relative_means[feature]
-                gp_mean_str = process_number(gp_mean)
-
-                # Draw Cell
-                pdf.draw_colored_rect(
-                    canvas=canvas,
-                    color=(1, 1, 1),  # type: ignore
-                    x=table_cell_int_pose_left,
-                    y=y,
-                    width=table_cell_width,
-                    height=table_cell_height_pose,
-                    fill=False,
-                    stroke=True,
-                    line_width=0.25,
-                )
+            for gp_mean in gp_relative_means:
+                gp_mean_str = _format_number(gp_mean)
 
-                # Then Draw Text
-                pdf.draw_text(
-                    canvas=canvas,
-                    text=gp_mean_str,
-                    x=table_cell_int_pose_left + 2,
-                    y=y - 2,
-                    size=4,
-                    font="Helvetica",
-                )
+                cells.append((table_cell_int_pose_left, y, gp_mean_str))
 
                 y = y + table_cell_height_pose
 
         case _:
             raise ValueError(f"Invalid role: {role}")
 
+    # Draw all the cells as one path, then all the text as one text object
+    pdf.draw_colored_rects(
+        canvas=canvas,
+        rects=[
+            (x, y, table_cell_width, table_cell_height_pose) for x, y, _ in cells
+        ],
+        color=(1, 1, 1),  # type: ignore
+        fill=False,
+        stroke=True,
+        line_width=0.25,
+    )
+    pdf.draw_texts(
+        canvas=canvas,
+        texts=[(text, x + 2, y - 2) for x, y, text in cells],
+        size=4,
+        font="Helvetica",
+    )
+
 
 def get_z_score_params(
-    z_score: float,
-) -> Tuple[str, Tuple[float, float, float, float], str]:
+    z_scores: np.ndarray,
+) -> Tuple[List[str], List[Tuple[float, float, float, float]], List[str]]:
     """
-    Get formatting parameters for the z-score.
+    Get formatting parameters for each of the z-scores.
 
-    Returns the z-score string, the color, and the font, where the color is based on the z-score.
-    color is a tuple of (r, g, b, alpha).
+    Returns the z-score strings, the colors, and the fonts, where the color is based
+    on the z-score. Each color is a tuple of (r, g, b, alpha).
+
+    - NaN: no text, grey, bold
+    - z >= 1: red (darker with the z-score), bold
+    - z <= -1: blue (darker with the z-score), bold
+    - otherwise: transparent, regular
 
     Args:
-        z_score (float): The z-score.
+        z_scores (np.ndarray): The z-scores.
 
     Returns:
-        Tuple[str, Tuple[float, float, float, float], str]: The z-score string, the color,
-            and the font.
+        Tuple[List[str], List[Tuple[float, float, float, float]], List[str]]: The
+            z-score strings, the colors, and the fonts, in the order of z_scores.
     """
     grey = (0.5, 0.5, 0.5)
     empahsize_font = "Helvetica-Bold"
     default_font = "Helvetica"
 
-    alpha = 0
-    fill_color: Tuple[float, float, float] = (0, 0, 0)
-    font = default_font
-
-    # Determine Font and Fill Color
-    # Check if not nan
-    if np.isnan(z_score):
-        z_score_str = ""
-        fill_color = grey
-        alpha = 0.5
-        font = empahsize_font
-    # Check if positive
-    elif z_score > 0:
-        z_score_str = f"+{z_score}"[:5]
-        if z_score >= 1:
-            fill_color = (z_score / 2.0, 0, 0)
-            alpha = 0.5
-            font = empahsize_font
-    # Check if negative
-    else:
-        z_score_str = f"{z_score}"[:5]
-        if z_score <= -1:
-            fill_color = (0, 0, -z_score / 2.0)
-            alpha = 0.5
-            font = empahsize_font
-
-    color = (*fill_color, alpha)
-
-    return z_score_str, color, font  # type: ignore
+    z_scores = np.asarray(z_scores, dtype=np.float64)
+
+    # Determine Font and Fill Color, for all z-scores at once
+    is_nan = np.isnan(z_scores)
+    is_high = z_scores >= 1
+    is_low = z_scores <= -1
+    is_emphasized = is_nan | is_high | is_low
+
+    colors = np.zeros((len(z_scores), 4))
+    colors[:, 0] = np.where(is_high, z_scores / 2.0, 0)
+    colors[:, 2] = np.where(is_low, -z_scores / 2.0, 0)
+    colors[:, 3] = np.where(is_emphasized, 0.5, 0)
+    colors[is_nan] = (*grey, 0.5)
+
+    fonts = np.where(is_emphasized, empahsize_font, default_font).tolist()
+
+    z_score_strs = [
+        "" if nan else _format_number(z_score)
+        for z_score, nan in zip(z_scores.tolist(), is_nan.tolist())
+    ]
+
+    return z_score_strs, [tuple(color) for color in colors.tolist()], fonts
 
 
 def construct_fau_z_scores_table_by_role(
@@ -494,6 +578,8 @@ def construct_fau_z_scores_table_by_role(
     au_cols: List[str],
     data_path: Path,
     config_file: Path,
+    session_features: Optional[pd.DataFrame] = None,
+    subject_stats: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> None:
     """
     Constructs the FAU z-scores table for the video section.
@@ -513,6 +599,13 @@ def construct_fau_z_scores_table_by_role(
         au_cols (List[str]): The list of AU columns.
         data_path (Path): The path to the data directory.
         config_file (Path): The path to the configuration file.
+        session_features (Optional[pd.DataFrame]): The session's features, with
+            at least the AU columns, if already fetched (see
+            fetch_session_features_by_role). Fetched here if not provided.
+        subject_stats (Optional[Tuple[np.ndarray, np.ndarray]]): The subject's
+            means and stds, in the order of au_cols, if already computed (see
+            get_subject_distribution_stats). Computed here for the subject
+            role, if not provided.
 
     Raises:
         ValueError: If the role is invalid.
@@ -521,52 +614,52 @@ def construct_fau_z_scores_table_by_role(
     Returns:
         None
     """
-    dp_dast_dict = dpdash.parse_dpdash_name(interview_name)
-    study_id = dp_dast_dict["study"]
-    subject_id = dp_dast_dict["subject"]
+    subject_id = dpdash.parse_dpdash_name(interview_name)["subject"]
 
-    session_of_pose_features = core.fetch_openface_features(
-        interview_name=interview_name,
-        subject_id=subject_id,
-        study_id=study_id,
-        role=role,
-        cols=au_cols,
-        config_file=config_file,
+    session_of_pose_features = session_features
+    if session_of_pose_features is None:
+        session_of_pose_features = fetch_session_features_by_role(
+            interview_name=interview_name,
+            role=role,
+            cols=au_cols,
+            config_file=config_file,
+        )
+    # Reduce the underlying array, in the order of au_cols (NaNs are skipped,
+    # as pandas does)
+    session_pose_means = np.nanmean(
+        _features_array(session_of_pose_features, au_cols), axis=0, dtype=np.float64
     )
-    session_pose_means = session_of_pose_features.mean(axis=0)
 
     # Read Group Metrics (Mean and Std) from cached file
-    group_means_and_std_path = data_path / f"metrics_cache_{role}.csv"
-
-    if not group_means_and_std_path.exists():
-        raise FileNotFoundError(
-            f"Metrics cache not found at {group_means_and_std_path}"
-        )
-
-    group_means_and_std = pd.read_csv(group_means_and_std_path)
+    group_means_and_std = load_metrics_cache(data_path=data_path, role=role)
 
     # Only keep AU columns
     group_means_and_std = group_means_and_std[au_cols]
 
     # Compute Z Score
-    group_means = group_means_and_std.iloc[0]
-    group_stds = group_means_and_std.iloc[1]
+    group_means = group_means_and_std.iloc[0].to_numpy(dtype=np.float64)
+    group_stds = group_means_and_std.iloc[1].to_numpy(dtype=np.float64)
 
     # Z Score = Mean - Group Mean / Group Std
-    group_z_scores = (session_pose_means - group_means) / group_stds
+    # (a zero std gives +/-inf or NaN, as with pandas, without warnings)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        group_z_scores = (session_pose_means - group_means) / group_stds
 
     if role is InterviewRole.SUBJECT:
         # Compute Subject Z Score
-        subject_of_pose_features = core.fetch_openface_subject_distribution(
-            subject_id=subject_id,
-            cols=au_cols,
-            config_file=config_file,
-        )
-        subject_pose_means = subject_of_pose_features.mean(axis=0)
-        subject_pose_std = subject_of_pose_features.std(axis=0)
+        if subject_stats is None:
+            subject_stats = get_subject_distribution_stats(
+                subject_id=subject_id,
+                cols=au_cols,
+                config_file=config_file,
+            )
+        subject_pose_means, subject_pose_std = subject_stats
 
         # Compute Subject Z Score
-        subject_z_scores = (session_pose_means - subject_pose_means) / subject_pose_std
+        with np.errstate(divide="ignore", invalid="ignore"):
+            subject_z_scores = (
+                session_pose_means - subject_pose_means
+            ) / subject_pose_std
 
     # Write to Canvas
     table_cell_width = 18.05
@@ -588,63 +681,49 @@ def construct_fau_z_scores_table_by_role(
         case _:
             raise ValueError(f"Invalid role: {role}")
 
-    for fau_label in au_cols:
-        group_z_score = group_z_scores[fau_label]
+    # Group Z Scores in the first column, Subject Z Scores in the second
+    columns = [(x, get_z_score_params(group_z_scores))]
+    if role is InterviewRole.SUBJECT:
+        columns.append(
+            (x + table_cell_width, get_z_score_params(subject_z_scores))  # type: ignore
+        )
+
+    # Most cells share a fill color (transparent / grey), and a font, so group
+    # the cells by color and the text by font, rather than drawing cell by cell
+    cells_by_color: Dict[
+        Tuple[float, float, float, float], List[Tuple[float, float, float, float]]
+    ] = defaultdict(list)
+    texts_by_font: Dict[str, List[Tuple[str, float, float]]] = defaultdict(list)
+
+    for cell_x, (z_score_strs, colors, fonts) in columns:
+        cell_y = y
+        for z_score_str, color, font in zip(z_score_strs, colors, fonts):
+            cells_by_color[color].append(
+                (cell_x, cell_y, table_cell_width, table_cell_height_fau)
+            )
+            texts_by_font[font].append((z_score_str, cell_x + 3, cell_y - 2))
+
+            cell_y = cell_y + table_cell_height_fau
 
-        # Group Z Score
-        z_score_str, color, font = get_z_score_params(group_z_score)
-        # Draw Cell
-        pdf.draw_colored_rect(
+    # Draw Cells, then the Text over them
+    for color, cells in cells_by_color.items():
+        pdf.draw_colored_rects(
             canvas=canvas,
+            rects=cells,
             color=color,
-            x=x,
-            y=y,
-            width=table_cell_width,
-            height=table_cell_height_fau,
             fill=True,
             stroke=True,
             line_width=0.25,
         )
 
-        # Then Draw Text
-        pdf.draw_text(
+    for font, texts in texts_by_font.items():
+        pdf.draw_texts(
             canvas=canvas,
-            text=z_score_str,
-            x=x + 3,
-            y=y - 2,
+            texts=texts,
             size=4,
             font=font,
         )
 
-        if role is InterviewRole.SUBJECT:
-            # Subject Z Score
-            subject_z_score = subject_z_scores[fau_label]  # type: ignore
-            z_score_str, color, font = get_z_score_params(subject_z_score)
-            # Draw Cell
-            pdf.draw_colored_rect(
-                canvas=canvas,
-                color=color,
-                x=x + table_cell_width,
-                y=y,
-                width=table_cell_width,
-                height=table_cell_height_fau,
-                fill=True,
-                stroke=True,
-                line_width=0.25,
-            )
-
-            # Then Draw Text
-            pdf.draw_text(
-                canvas=canvas,
-                text=z_score_str,
-                x=x + table_cell_width + 3,
-                y=y - 2,
-                size=4,
-                font=font,
-            )
-
-        y = y + table_cell_height_fau
-
 
 def draw_fau_table_header(canvas: canvas.Canvas, role: InterviewRole) -> None:
     """
@@ -3,11 +3,13 @@ Contains functions to construct heatmaps for Appearance and Movement
 section of the report.
 """
 
+import io
 import tempfile
 from datetime import timedelta
 from pathlib import Path
 from typing import List, Optional
 
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 from pipeline import constants, core
@@ -400,42 +402,27 @@ def construct_heatmap_labels_by_role(
     int_pose_label_bottom_start = 417.22
     int_au_label_bottom_start = 484.5
 
-    pose_labels_left = pdf.compute_x_right_align_list(
-        pose_labels, "Helvetica", 5, heatmap_label_right
-    )
-    gaze_labels_left = pdf.compute_x_right_align_list(
-        gaze_labels, "Helvetica", 5, heatmap_label_right
-    )
-    au_labels_left = pdf.compute_x_right_align_list(
-        au_labels, "Helvetica", 5, heatmap_label_right
+    labels = pose_labels + gaze_labels + au_labels
+    labels_left = pdf.compute_x_right_align_list(
+        labels, "Helvetica", 5, heatmap_label_right
     )
 
     match role:
         case InterviewRole.SUBJECT:
-            cur_bot = pt_pose_label_bottom_start
+            pose_bot = pt_pose_label_bottom_start
+            au_bot = pt_au_label_bottom_start
         case InterviewRole.INTERVIEWER:
-            cur_bot = int_pose_label_bottom_start
+            pose_bot = int_pose_label_bottom_start
+            au_bot = int_au_label_bottom_start
         case _:
             raise ValueError(f"Invalid role: {role}")
 
-    for text, left in zip(pose_labels, pose_labels_left):
-        pdf.draw_text(canvas, text, left, cur_bot, 5, "Helvetica")
-        cur_bot = cur_bot + pose_label_space
-    for text, left in zip(gaze_labels, gaze_labels_left):
-        pdf.draw_text(canvas, text, left, cur_bot, 5, "Helvetica")
-        cur_bot = cur_bot + pose_label_space
+    num_pose_labels = len(pose_labels) + len(gaze_labels)
+    labels_bot = [pose_bot + i * pose_label_space for i in range(num_pose_labels)]
+    labels_bot += [au_bot + i * au_label_space for i in range(len(au_labels))]
 
-    match role:
-        case InterviewRole.SUBJECT:
-            cur_bot = pt_au_label_bottom_start
-        case InterviewRole.INTERVIEWER:
-            cur_bot = int_au_label_bottom_start
-        case _:
-            raise ValueError(f"Invalid role: {role}")
-
-    for text, left in zip(au_labels, au_labels_left):
-        pdf.draw_text(canvas, text, left, cur_bot, 5, "Helvetica")
-        cur_bot = cur_bot + au_label_space
+    # All labels share a font, so draw them as a single text object
+    pdf.draw_texts(canvas, list(zip(labels, labels_left, labels_bot)), 5, "Helvetica")
 
 
 def draw_fau_logos(
@@ -476,7 +463,7 @@ def draw_fau_logos(
         fau_path = au_assets_path / file_name
         pdf.draw_image(
             canvas,
-            fau_path,
+            pdf.load_image(fau_path),
             au_samples_left,
             cur_bot,
             au_samples_width,
@@ -611,20 +598,107 @@ def draw_cluster_bars_vid(
         cur_bot = cur_bot - height - cluster_bars_config.cluster_bars_space * 2.0
 
 
+def fetch_snapshots_by_role(
+    interview_name: str,
+    role: InterviewRole,
+    start_time: timedelta,
+    end_time: timedelta,
+    frame_frequency: timedelta,
+    config_file: Path,
+    deidentified: bool = True,
+) -> List[Optional[bytes]]:
+    """
+    Fetches the frames for the snapshots bar, from the OpenFace overlaid video,
+    as image bytes.
+
+    Does not touch the canvas, so that it can run on a worker thread.
+
+    Args:
+        interview_name (str): The name of the interview.
+        role (InterviewRole): The role for whom the snapshots are being fetched.
+        start_time (timedelta): The start time of the section.
+        end_time (timedelta): The end time of the section.
+        frame_frequency (timedelta): The frequency of the frames.
+        config_file (Path): The path to the configuration file.
+        deidentified (bool): Whether to remove face data from the images.
+
+    Returns:
+        List[Optional[bytes]]: The snapshots, None where there is no frame.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        frame_numbers = FrameRequest.get_frame_numbers(
+            interview_name=interview_name,
+            role=role,
+            start_time=start_time,
+            end_time=end_time,
+            frame_frequency=frame_frequency,
+            config_file=config_file,
+        )
+
+        openface_overlaid_video_path = core.get_openfece_features_overlaid_video_path(
+            config_file=config_file, interview_name=interview_name, role=role
+        )
+
+        if openface_overlaid_video_path is None:
+            console.print(
+                f"OpenFace overlaid video not found for {role.value}",
+                style="error",
+            )
+            return [None] * len(frame_numbers)
+
+        frame_paths = image.get_frames_by_numbers(
+            video_path=openface_overlaid_video_path,
+            frame_numbers=frame_numbers,
+            out_dir=Path(temp_dir),
+        )
+
+        snapshots: List[Optional[bytes]] = []
+        for frame in frame_paths:
+            if frame is None:
+                snapshots.append(None)
+                continue
+
+            if deidentified:
+                strategy = "filter_face_data"
+                dest_image = Path(temp_dir) / f"{frame.stem}_deidentified.bmp"
+
+                match strategy:
+                    case "blur":
+                        image.blur_image(source_image=frame, dest_image=dest_image)
+                        frame = dest_image
+
+                    case "black_bar":
+                        image.draw_bars_over_image(
+                            source_image=frame, dest_image=dest_image
+                        )
+                        frame = dest_image
+
+                    case "filter_face_data":
+                        image.filter_by_range(
+                            source_image=frame,
+                            dest_image=dest_image,
+                        )
+
+                        frame = dest_image
+
+            snapshots.append(frame.read_bytes())
+
+    return snapshots
+
+
 def construct_snapshots_bar(
     canvas: canvas.Canvas,
-    frame_paths: List[Optional[Path]],
+    snapshots: List[Optional[pdf.Image]],
     role: InterviewRole,
-    deidentified: bool = True,
 ):
     """
     Draws the snapshots bar for the video section. Multiple smaller images on the top middle.
 
     Args:
         canvas (canvas.Canvas): The canvas to draw on.
-        frame_paths (List[Optional[Path]]): The list of frame paths.
+        snapshots (List[Optional[pdf.Image]]): The snapshots, None where there
+            is no frame (drawn as a gray box).
         role (InterviewRole): The role for whom the snapshots are being drawn
-        deidentified (bool): Whether the images are deidentified.
 
     Raises:
         ValueError: If the role is invalid.
@@ -658,11 +732,9 @@ def construct_snapshots_bar(
         case _:
             raise ValueError(f"Invalid role: {role}")
 
-    files: List[tempfile.NamedTemporaryFile] = []  # type: ignore
-
     x = snapshot_start_left
-    for frame in frame_paths:
-        if frame is None:
+    for snapshot in snapshots:
+        if snapshot is None:
             pdf.draw_colored_rect(
                 canvas=canvas,
                 color=no_data_color,  # type: ignore
@@ -672,43 +744,10 @@ def construct_snapshots_bar(
                 y=y,
             )
         else:
-            if deidentified:
-                strategy = "filter_face_data"
-                temp_file = tempfile.NamedTemporaryFile(suffix=".bmp")
-                files.append(temp_file)
-
-                match strategy:
-                    case "blur":
-                        image.blur_image(
-                            source_image=frame, dest_image=Path(temp_file.name)
-                        )
-                        frame = temp_file.name
-
-                    case "black_bar":
-                        # temp_file = tempfile.NamedTemporaryFile(suffix=".bmp")
-                        # temp_file_name = temp_file.name
-
-                        image.draw_bars_over_image(
-                            source_image=frame, dest_image=Path(temp_file.name)
-                        )
-                        frame = temp_file.name
-
-                    case "filter_face_data":
-                        image.filter_by_range(
-                            source_image=frame,
-                            dest_image=Path(temp_file.name),
-                        )
-
-                        frame = temp_file.name
-
-            pdf.draw_image(canvas, Path(frame), x, y, snapshot_width, snapshot_height)
+            pdf.draw_image(canvas, snapshot, x, y, snapshot_width, snapshot_height)
 
         x = x + snapshot_h_spacing
 
-    for file in files:
-        # Close and delete temp files
-        file.close()
-
     pdf.draw_text(canvas, samples_text, samples_text_left, text_y, 4, "Helvetica")
 
 
@@ -717,8 +756,8 @@ def place_heatmaps_by_role(
     canvas: canvas.Canvas,
     x: float,
     role: InterviewRole,
-    heatmap_vid_pose_path: Path,
-    heatmap_vid_fau_path: Path,
+    heatmap_vid_pose_path: pdf.Image,
+    heatmap_vid_fau_path: pdf.Image,
 ) -> None:
     """
     Places the heatmaps on the canvas based on the role.
@@ -727,8 +766,8 @@ def place_heatmaps_by_role(
         canvas (canvas.Canvas): The canvas to draw on.
         x (float): The x position of the heatmaps.
         role (InterviewRole): The role for whom the heatmaps are being placed.
-        heatmap_vid_pose_path (Path): The path to the pose heatmap.
-        heatmap_vid_fau_path (Path): The path to the FAU heatmap.
+        heatmap_vid_pose_path (pdf.Image): The pose heatmap.
+        heatmap_vid_fau_path (pdf.Image): The FAU heatmap.
 
     Raises:
         ValueError: If the role is invalid.
@@ -786,8 +825,8 @@ def construct_heatmap_by_role(
     start_time: timedelta,
     end_time: timedelta,
     frame_frequency: timedelta,
-    heatmap_vid_pose_path: Path,
-    heatmap_vid_fau_path: Path,
+    heatmap_vid_pose_path: pdf.Image,
+    heatmap_vid_fau_path: pdf.Image,
     pose_labels: List[str],
     gaze_labels: List[str],
     au_labels: List[str],
@@ -800,6 +839,7 @@ def construct_heatmap_by_role(
     assets_path: Path,
     config_file: Path,
     deidentify: bool = True,
+    snapshots: Optional[List[Optional[bytes]]] = None,
 ) -> None:
     """
     Constructs the heatmap section for the video report. Includes the headers, ticks, labels for
@@ -812,8 +852,8 @@ def construct_heatmap_by_role(
         start_time (timedelta): The start time of the video.
         end_time (timedelta): The end time of the video.
         frame_frequency (timedelta): The frequency of the frames (snapshot bar).
-        heatmap_vid_pose_path (Path): The path to the pose heatmap.
-        heatmap_vid_fau_path (Path): The path to the FAU heatmap.
+        heatmap_vid_pose_path (pdf.Image): The pose heatmap.
+        heatmap_vid_fau_path (pdf.Image): The FAU heatmap.
         pose_labels (List[str]): The list of pose labels.
         gaze_labels (List[str]): The list of gaze labels.
         au_labels (List[str]): The list of AU labels.
@@ -828,6 +868,8 @@ def construct_heatmap_by_role(
         deidentify (bool, optional): Whether to deidentify the images.
             Defaults to False.
             Deidentification is done by removing all face data from the images.
+        snapshots (Optional[List[Optional[bytes]]]): The snapshots, if already
+            fetched with fetch_snapshots_by_role. Fetched here if not provided.
 
     Raises:
         ValueError: If the role is invalid.
@@ -888,36 +930,22 @@ def construct_heatmap_by_role(
         role=role,
     )
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        frame_numbers = FrameRequest.get_frame_numbers(
+    if snapshots is None:
+        snapshots = fetch_snapshots_by_role(
             interview_name=interview_name,
             role=role,
             start_time=start_time,
             end_time=end_time,
             frame_frequency=frame_frequency,
             config_file=config_file,
-        )
-
-        openface_overlaid_video_path = core.get_openfece_features_overlaid_video_path(
-            config_file=config_file, interview_name=interview_name, role=role
-        )
-
-        if openface_overlaid_video_path is None:
-            console.print(
-                f"OpenFace overlaid video not found for {role.value}",
-                style="error",
-            )
-            frame_paths: List[Path | None] = [None] * len(frame_numbers)
-        else:
-            frame_paths = image.get_frames_by_numbers(
-                video_path=openface_overlaid_video_path,
-                frame_numbers=frame_numbers,
-                out_dir=Path(temp_dir),
-            )
-
-        construct_snapshots_bar(
-            canvas=canvas,
-            frame_paths=frame_paths,
-            role=role,
             deidentified=deidentify,
         )
+
+    construct_snapshots_bar(
+        canvas=canvas,
+        snapshots=[
+            ImageReader(io.BytesIO(snapshot)) if snapshot is not None else None
+            for snapshot in snapshots
+        ],
+        role=role,
+    )
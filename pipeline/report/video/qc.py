@@ -2,12 +2,15 @@
 Quality Control Section for Apperance and Behavior Section
 """
 
+import io
 import sys
 import tempfile
+from concurrent.futures import Future
 from datetime import timedelta
 from pathlib import Path
 from typing import Optional
 
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 from pipeline import core
@@ -22,7 +25,7 @@ console = utils.get_console()
 
 def draw_sample_image(
     canvas: canvas.Canvas,
-    image_path: Path,
+    image_path: pdf.Image,
     role: InterviewRole,
 ):
     """
@@ -30,7 +33,7 @@ def draw_sample_image(
 
     Args:
         canvas (canvas.Canvas): The canvas to draw on.
-        image_path (Path): The path to the image.
+        image_path (pdf.Image): The sample image.
         role (InterviewRole): The role for whom the image is being drawn
 
     Raises:
@@ -82,21 +85,21 @@ def draw_sample_image(
     )
 
 
-def construct_sample_image_by_role(
-    canvas: canvas.Canvas,
+def fetch_sample_image_by_role(
     interview_name: str,
     role: InterviewRole,
     config_file: Path,
     deidentify: bool = False,
     start_time: timedelta = timedelta(hours=0, minutes=0, seconds=0),
     end_time: timedelta = timedelta(hours=0, minutes=30, seconds=0),
-):
+) -> Optional[bytes]:
     """
-    Fetches the sample image for the video section and draws it on the canvas. Selects
+    Fetches the sample image for the video section, as PNG bytes. Selects
     a frame from the middle of the video.
 
+    Does not touch the canvas, so that it can run on a worker thread.
+
     Args:
-        canvas (canvas.Canvas): The canvas to draw on.
         interview_name (str): The name of the interview.
         role (InterviewRole): The role for whom the image is being drawn
         config_file (Path): The path to the configuration file.
@@ -108,7 +111,7 @@ def construct_sample_image_by_role(
         FileNotFoundError: If the frame number is not found.
 
     Returns:
-        None
+        Optional[bytes]: The sample image, or None if no frame was found.
     """
     of_path = core.get_openface_path(
         interview_name=interview_name, role=role, config_file=config_file
@@ -166,7 +169,7 @@ after {retry_counter} attempts"
             f"[bold red]Failed to get frame number for {interview_name} {role} \
 after {max_retires} attempts"
         )
-        return
+        return None
 
     with tempfile.NamedTemporaryFile(suffix=".png") as sample_frame:
         image.get_frame_by_number(
@@ -203,9 +206,55 @@ after {max_retires} attempts"
                         end_h=0.07,
                         bar_color=(255, 255, 255),
                     )
-                draw_sample_image(
-                    canvas=canvas, image_path=Path(name_removed_image.name), role=role
-                )
+                return Path(name_removed_image.name).read_bytes()
+
+
+def construct_sample_image_by_role(
+    canvas: canvas.Canvas,
+    interview_name: str,
+    role: InterviewRole,
+    config_file: Path,
+    deidentify: bool = False,
+    start_time: timedelta = timedelta(hours=0, minutes=0, seconds=0),
+    end_time: timedelta = timedelta(hours=0, minutes=30, seconds=0),
+    sample_image: Optional["Future[Optional[bytes]]"] = None,
+):
+    """
+    Fetches the sample image for the video section and draws it on the canvas. Selects
+    a frame from the middle of the video.
+
+    Args:
+        canvas (canvas.Canvas): The canvas to draw on.
+        interview_name (str): The name of the interview.
+        role (InterviewRole): The role for whom the image is being drawn
+        config_file (Path): The path to the configuration file.
+        start_time (timedelta): The start time of the video.
+        end_time (timedelta): The end time of the video.
+        sample_image (Optional[Future[Optional[bytes]]]): The sample image, being
+            fetched in the background with fetch_sample_image_by_role. Its result
+            is final, even if None (no sample image). Fetched here if not provided.
+
+    Returns:
+        None
+    """
+    if sample_image is not None:
+        image = sample_image.result()
+    else:
+        image = fetch_sample_image_by_role(
+            interview_name=interview_name,
+            role=role,
+            config_file=config_file,
+            deidentify=deidentify,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    if image is None:
+        return
+
+    draw_sample_image(
+        canvas=canvas, image_path=ImageReader(io.BytesIO(image)), role=role
+    )
 
 
 def construct_openface_metadata_box_by_role(
@@ -213,6 +262,7 @@ def construct_openface_metadata_box_by_role(
     role: InterviewRole,
     interview_name: str,
     config_file: Path,
+    vid_metadata: Optional[VideoMetadata] = None,
 ) -> None:
     """
     Constructs the OpenFace metadata box for the video section.
@@ -222,6 +272,8 @@ def construct_openface_metadata_box_by_role(
         role (InterviewRole): The role for whom the metadata box is being placed.
         interview_name (str): The name of the interview.
         config_file (Path): The path to the configuration file.
+        vid_metadata (Optional[VideoMetadata]): The video metadata, if already
+            fetched. Fetched here if not provided.
 
     Raises:
         ValueError: If the role is invalid.
@@ -236,9 +288,10 @@ def construct_openface_metadata_box_by_role(
 
     openface_info.append(f"Python {python_version}")
 
-    vid_metadata: VideoMetadata = VideoMetadata.get(
-        interview_name=interview_name, role=role, config_file=config_file
-    )
+    if vid_metadata is None:
+        vid_metadata = VideoMetadata.get(
+            interview_name=interview_name, role=role, config_file=config_file
+        )
 
     resolution_text = (
         f"Resolution: {vid_metadata.video_width}x{vid_metadata.video_height}"
@@ -314,6 +367,7 @@ def draw_qc_metrics_by_role(
     interview_name: str,
     x: float,
     config_file: Path,
+    qc_metrics: Optional[OpenFaceQcMetrics] = None,
 ) -> None:
     """
     Draw the QC metrics for the video section.
@@ -330,6 +384,8 @@ def draw_qc_metrics_by_role(
         interview_name (str): The name of the interview.
         x (float): The x position of the text.
         config_file (Path): The path to the configuration file.
+        qc_metrics (Optional[OpenFaceQcMetrics]): The QC metrics, if already
+            fetched. Fetched here if not provided.
 
     Raises:
         ValueError: If the role is invalid.
@@ -338,9 +394,10 @@ def draw_qc_metrics_by_role(
     Returns:
         None
     """
-    qc_metrics = OpenFaceQcMetrics.get(
-        interview_name=interview_name, role=role, config_file=config_file
-    )
+    if qc_metrics is None:
+        qc_metrics = OpenFaceQcMetrics.get(
+            interview_name=interview_name, role=role, config_file=config_file
+        )
 
     pt_sample_qc_text_bot = 195
     int_sample_qc_text_bot = 455.5
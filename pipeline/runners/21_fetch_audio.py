@@ -94,14 +94,18 @@ if __name__ == "__main__":
     # Track number of files requested
     COUNTER = 0
 
+    orchestrator.initialize_key_store(config_file=config_file, requesters=[MODULE_NAME])
+
     study_id = studies[0]
     logger.info(f"Starting with study: {study_id}", extra={"markup": True})
     while True:
+        orchestration_config = orchestrator.load_orchestration_config(config_file)
+
         if orchestrator.check_if_decryption_requested(
             config_file=config_file, requester=MODULE_NAME
         ):
             # Update decryption_count
-            decrytion_count = orchestrator.get_decryption_count(config_file=config_file)
+            decrytion_count = orchestration_config.num_to_decrypt
             logger.info(f"decrytion_count: {decrytion_count}")
 
             while COUNTER < decrytion_count:
@@ -179,7 +183,9 @@ if __name__ == "__main__":
 
         else:
             # Snooze if decryption is not requested
-            orchestrator.snooze(config_file=config_file)
+            orchestrator.snooze(
+                config_file=config_file, orchestration_config=orchestration_config
+            )
 
             # Update decryption_count
             decrytion_count = orchestrator.get_decryption_count(config_file=config_file)
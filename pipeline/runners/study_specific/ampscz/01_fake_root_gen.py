@@ -304,12 +304,14 @@ if __name__ == "__main__":
     COUNTER = 0
 
     while True:
+        orchestration_config = orchestrator.load_orchestration_config(config_file)
+
         study_id = studies[0]
         logger.info(f"Processing study: {study_id}")
 
         if orchestrator.check_if_decryption_requested(config_file=config_file):
             # Update decryption_count
-            decrytion_count = orchestrator.get_decryption_count(config_file=config_file)
+            decrytion_count = orchestration_config.num_to_decrypt
             logger.info(f"decrytion_count: {decrytion_count}")
 
             while COUNTER < decrytion_count:
@@ -389,7 +391,9 @@ if __name__ == "__main__":
 
         else:
             # Snooze if decryption is not requested
-            orchestrator.snooze(config_file=config_file)
+            orchestrator.snooze(
+                config_file=config_file, orchestration_config=orchestration_config
+            )
 
             # Update decryption_count
             decrytion_count = orchestrator.get_decryption_count(config_file=config_file)
@@ -30,6 +30,7 @@ from rich.logging import RichHandler
 
 from pipeline import constants, core
 from pipeline.helpers import cli, db, utils
+from pipeline.helpers.write_buffer import WriteBuffer
 from pipeline.models.interview_roles import InterviewRole
 from pipeline.models.metrics import Metrics
 
@@ -453,7 +454,9 @@ def populate_metrics(
     df = db.execute_sql(config_file=config_file, query=query)
     logger.info(f"Found {df.shape[0]} interviews to process.")
 
-    with utils.get_progress_bar() as progress:
+    with utils.get_progress_bar() as progress, WriteBuffer(
+        config_file=config_file
+    ) as write_buffer:
         task = progress.add_task("Processing interviews", total=df.shape[0])
 
         for _, row in df.iterrows():
@@ -466,13 +469,7 @@ def populate_metrics(
             )
 
             if metrics is not None:
-                sql_query = [metrics.to_sql()]
-                db.execute_queries(
-                    config_file=config_file,
-                    queries=sql_query,
-                    show_commands=False,
-                    silent=True,
-                )
+                write_buffer.submit(metrics.to_sql())
 
 
 if __name__ == "__main__":
@@ -199,4 +199,10 @@ if __name__ == "__main__":
     queries.extend(finalize_queries)
 
     # Execute queries
-    db.execute_queries(config_file, queries, show_commands=True, db="openface_db")
+    db.execute_queries(
+        config_file,
+        queries,
+        show_commands=True,
+        db="openface_db",
+        single_transaction=True,
+    )